@@ -1,5 +1,6 @@
 """Module that provide actors to render."""
 
+import os
 import warnings
 from functools import partial
 
@@ -9,6 +10,8 @@ from fury.shaders import (add_shader_callback, attribute_to_actor,
                           compose_shader, import_fury_shader,
                           replace_shader_in_actor, shader_to_actor)
 from fury import layout
+from fury.actors.chunked_line import ChunkedLineActor
+from fury.actors.lod_line import LODLineActor
 from fury.actors.odf_slicer import OdfSlicerActor
 from fury.actors.peak import PeakActor
 from fury.colormap import colormap_lookup_table
@@ -34,6 +37,7 @@ from fury.utils import (lines_to_vtk_polydata, set_input, apply_affine,
                         set_polydata_vertices, set_polydata_triangles,
                         shallow_copy, rgb_to_vtk, numpy_to_vtk_matrix,
                         repeat_sources, get_actor_from_primitive,
+                        get_instanced_actor_from_primitive,
                         fix_winding_order, numpy_to_vtk_colors, color_check,
                         set_polydata_primitives_count)
 
@@ -783,6 +787,216 @@ def line(lines, colors=None, opacity=1, linewidth=1,
     return actor
 
 
+def tube_impostor(lines, colors=None, radii=0.1, opacity=1,
+                  lookup_colormap=None):
+    """Create an actor rendering lines as tubes ray-cast on the GPU.
+
+    Unlike :func:`streamtube`, no tube mesh is generated: the actor holds the
+    line points, a geometry shader turns every segment into its bounding box
+    and the fragment shader intersects the view rays with the rounded cone
+    joining the end points of the segment. The tubes are shaded with the
+    lighting properties of the actor and write their true depth, so they
+    intersect correctly with each other and with other actors.
+
+    Parameters
+    ----------
+    lines : list of arrays or ArraySequence
+    colors : array (N, 3), list of arrays, tuple (3,), array (K,)
+        See :func:`line`.
+    radii : float, array (N,) or array (K,), optional
+        Radius of the tubes. One radius for all tubes, one radius for each of
+        the N lines or one radius for each of the K points of all lines, in
+        which case the radius varies smoothly along the lines. The radii are
+        in the coordinates of the lines, so they follow the scale of the
+        actor; a non-uniform scale uses the geometric mean of its factors and
+        the tubes stay round. Default is 0.1.
+    opacity : float, optional
+        Takes values from 0 (fully transparent) to 1 (opaque). Default is 1.
+    lookup_colormap : vtkLookupTable, optional
+        Add a default lookup table to the colormap. Default is None which calls
+        :func:`fury.actor.colormap_lookup_table`.
+
+    Returns
+    -------
+    tube_actor : Actor
+
+    Examples
+    --------
+    >>> from fury import actor, window
+    >>> scene = window.Scene()
+    >>> lines = [np.random.rand(10, 3), np.random.rand(20, 3)]
+    >>> c = actor.tube_impostor(lines, radii=[.05, .1])
+    >>> scene.add(c)
+    >>> #window.show(scene)
+
+    """
+    tube_actor = line(lines, colors=colors, opacity=opacity, lod=False,
+                      lookup_colormap=lookup_colormap)
+    poly_data = tube_actor.GetMapper().GetInput()
+    tube_actor.GetMapper().SetVBOShiftScaleMethod(False)
+
+    nb_points = poly_data.GetNumberOfPoints()
+    radii = np.asarray(radii, dtype=float)
+    if radii.ndim == 0:
+        radii = np.full(nb_points, radii)
+    elif len(radii) != nb_points:  # one radius per line
+        offsets = numpy_support.vtk_to_numpy(
+            poly_data.GetLines().GetOffsetsArray())
+        radii = np.repeat(radii, np.diff(offsets))
+    attribute_to_actor(tube_actor, radii, 'radius')
+
+    replace_shader_in_actor(tube_actor, 'geometry',
+                            import_fury_shader('tube_impostor.geom'))
+    shader_to_actor(tube_actor, 'vertex',
+                    decl_code=import_fury_shader('tube_impostor_dec.vert'),
+                    impl_code=import_fury_shader('tube_impostor_impl.vert'))
+    fs_dec_code = compose_shader([
+        import_fury_shader('tube_impostor_dec.frag'),
+        import_fury_shader(os.path.join('lighting',
+                                        'blinn_phong_model.frag'))])
+    shader_to_actor(tube_actor, 'fragment', decl_code=fs_dec_code)
+    shader_to_actor(tube_actor, 'fragment',
+                    impl_code=import_fury_shader('tube_impostor_impl.frag'),
+                    block='light')
+
+    def callback(_caller, _event, calldata=None):
+        program = calldata
+        if program is not None:
+            prop = tube_actor.GetProperty()
+            program.SetUniformf('tubeSpecular', prop.GetSpecular())
+            program.SetUniformf('tubeSpecularPower',
+                                prop.GetSpecularPower())
+            program.SetUniform3f('tubeSpecularColor',
+                                 prop.GetSpecularColor())
+
+    add_shader_callback(tube_actor, callback)
+    return tube_actor
+
+
+def chunked_line(source, chunk_size=100_000, colors=None, opacity=1,
+                 linewidth=1, lookup_colormap=None, depth_cue=False,
+                 fake_tube=False):
+    """Create an assembly of line actors built one chunk of lines at a time.
+
+    Unlike :func:`line`, the lines are never gathered in a single polydata,
+    so ``source`` can be larger than the available memory and be read while
+    the first chunks are already rendered.
+
+    Parameters
+    ----------
+    source : str, sequence or iterable of ndarrays
+        Streamlines, each one a (P, 3) array. It can be a generator, a list,
+        an ArraySequence whose data is a memory-mapped array, or the file
+        name of a tractogram (.trk, .tck, ...) which is then loaded lazily
+        with nibabel.
+    chunk_size : int, optional
+        Number of lines per chunk actor. Default is 100000.
+    colors : None, tuple (3,), array (N, 3) or array (N,), optional
+        If None, a standard orientation colormap is used for every line.
+        If one tuple of color is given, all lines have the same color.
+        If an array is given, it holds one RGB color or one colormap value
+        for each of the N lines of ``source``, in the same order.
+    opacity : float, optional
+        Takes values from 0 (fully transparent) to 1 (opaque). Default is 1.
+    linewidth : float, optional
+        Line thickness. Default is 1.
+    lookup_colormap : vtkLookupTable, optional
+        Lookup table shared by all chunks when colors are colormap values.
+        Default is None which calls :func:`fury.actor.colormap_lookup_table`.
+    depth_cue : boolean, optional
+        Add a size depth cue so that lines shrink with distance to the camera.
+        Works best with linewidth <= 1.
+    fake_tube: boolean, optional
+        Add shading to lines to approximate the look of tubes.
+
+    Returns
+    -------
+    chunked_actor : ChunkedLineActor
+        Assembly without any chunk loaded yet. Call its ``load_all`` method,
+        or ``load_progressively`` once it is in the scene of a show manager.
+
+    Examples
+    --------
+    >>> from fury import actor, window
+    >>> scene = window.Scene()
+    >>> lines = (np.random.rand(10, 3) for _ in range(1000))
+    >>> c = actor.chunked_line(lines, chunk_size=100)
+    >>> scene.add(c)
+    >>> showm = window.ShowManager(scene)
+    >>> timer_id = c.load_progressively(showm)
+    >>> #showm.start()
+
+    """
+    if lookup_colormap is None:
+        lookup_colormap = colormap_lookup_table()
+
+    line_actor = partial(line, opacity=opacity, linewidth=linewidth,
+                         lod=False, lookup_colormap=lookup_colormap,
+                         depth_cue=depth_cue, fake_tube=fake_tube)
+    return ChunkedLineActor(source, line_actor, chunk_size=chunk_size,
+                            colors=colors)
+
+
+def lod_line(lines, colors=None, opacity=1, linewidth=1,
+             lookup_colormap=None, fake_tube=False,
+             levels=((2, 1), (4, 2), (8, 4))):
+    """Create a line actor with precomputed simplified levels of detail.
+
+    Unlike ``line(..., lod=True)``, which replaces the lines by a random
+    point cloud, the levels keep one point out of ``point_step`` along every
+    line and one line out of ``line_step``, with the colors of the full
+    resolution lines. VTK switches to a coarser level while the render time
+    exceeds the budget of the interactor, so that whole-brain tractograms
+    stay interactive and are rendered with full detail once the camera stops.
+
+    Parameters
+    ----------
+    lines : list of arrays or ArraySequence
+    colors : array (N, 3), list of arrays, tuple (3,), array (K,)
+        See :func:`line`.
+    opacity : float, optional
+        Takes values from 0 (fully transparent) to 1 (opaque). Default is 1.
+    linewidth : float, optional
+        Line thickness. Default is 1.
+    lookup_colormap : vtkLookupTable, optional
+        Add a default lookup table to the colormap. Default is None which calls
+        :func:`fury.actor.colormap_lookup_table`.
+    fake_tube: boolean, optional
+        Add shading to lines to approximate the look of tubes.
+    levels : sequence of (int, int), optional
+        ``(point_step, line_step)`` of each simplified level, from the finest
+        to the coarsest. Default is ((2, 1), (4, 2), (8, 4)).
+
+    Returns
+    -------
+    lod_actor : LODLineActor
+
+    Notes
+    -----
+    The render time budget while interacting is one over the desired update
+    rate of the interactor, e.g. ``showm.iren.SetDesiredUpdateRate(60)`` for
+    60 frames per second. To select the level from the size of the lines on
+    the screen instead, call
+    ``lod_actor.track_camera(scene.GetActiveCamera())``.
+
+    Examples
+    --------
+    >>> from fury import actor, window
+    >>> scene = window.Scene()
+    >>> lines = [np.random.rand(100, 3) for _ in range(1000)]
+    >>> c = actor.lod_line(lines)
+    >>> scene.add(c)
+    >>> #window.show(scene)
+
+    """
+    full_actor = line(lines, colors=colors, opacity=opacity,
+                      linewidth=linewidth, lod=False,
+                      lookup_colormap=lookup_colormap, fake_tube=fake_tube)
+    lod_actor = LODLineActor(full_actor.GetMapper(), levels=levels)
+    lod_actor.SetProperty(full_actor.GetProperty())
+    return lod_actor
+
+
 def scalar_bar(lookup_table=None, title=" "):
     """ Default scalar bar actor for a given colormap (colorbar)
 
@@ -1551,7 +1765,8 @@ def point(points, colors, point_radius=0.1, phi=8, theta=8, opacity=1.):
 
 
 def sphere(centers, colors, radii=1., phi=16, theta=16,
-           vertices=None, faces=None, opacity=1, use_primitive=False):
+           vertices=None, faces=None, opacity=1, use_primitive=False,
+           instanced=False):
     """Visualize one or many spheres with different colors and radii
 
     Parameters
@@ -1575,7 +1790,9 @@ def sphere(centers, colors, radii=1., phi=16, theta=16,
         Takes values from 0 (fully transparent) to 1 (opaque). Default is 1.
     use_primitive : boolean, optional
         If True, uses primitives to create an actor.
-
+    instanced : bool, optional
+        If True, the unit primitive is uploaded once and rendered with GPU
+        instancing instead of being duplicated for each center.
 
     Returns
     -------
@@ -1591,7 +1808,7 @@ def sphere(centers, colors, radii=1., phi=16, theta=16,
     >>> # window.show(scene)
 
     """
-    if not use_primitive:
+    if not use_primitive and not instanced:
         src = SphereSource() if faces is None else None
 
         if src is not None:
@@ -1611,6 +1828,12 @@ def sphere(centers, colors, radii=1., phi=16, theta=16,
     if faces is None and vertices is None:
         vertices, faces = fp.prim_sphere(phi=phi, theta=theta)
 
+    if instanced:
+        sphere_actor = get_instanced_actor_from_primitive(
+            vertices, faces, centers, colors=colors, scales=scales)
+        sphere_actor.GetProperty().SetOpacity(opacity)
+        return sphere_actor
+
     res = fp.repeat_primitive(vertices, faces,
                               directions=directions, centers=centers,
                               colors=colors, scales=scales)
@@ -1751,7 +1974,8 @@ def disk(centers, directions, colors, rinner=0.3,
     return disk_actor
 
 
-def square(centers, directions=(1, 0, 0), colors=(1, 0, 0), scales=1):
+def square(centers, directions=(1, 0, 0), colors=(1, 0, 0), scales=1,
+           instanced=False):
     """Visualize one or many squares with different features.
 
     Parameters
@@ -1764,6 +1988,9 @@ def square(centers, directions=(1, 0, 0), colors=(1, 0, 0), scales=1):
         RGB or RGBA (for opacity) R, G, B and A should be at the range [0, 1]
     scales : int or ndarray (N,3) or tuple (3,), optional
         Square size on each direction (x, y), default(1)
+    instanced : bool, optional
+        If True, the unit primitive is uploaded once and rendered with GPU
+        instancing instead of being duplicated for each center.
 
     Returns
     -------
@@ -1781,6 +2008,11 @@ def square(centers, directions=(1, 0, 0), colors=(1, 0, 0), scales=1):
 
     """
     verts, faces = fp.prim_square()
+    if instanced:
+        return get_instanced_actor_from_primitive(
+            verts, faces, centers, directions=directions, colors=colors,
+            scales=scales, backface_culling=False)
+
     res = fp.repeat_primitive(verts, faces, directions=directions,
                               centers=centers, colors=colors, scales=scales)
 
@@ -1793,7 +2025,7 @@ def square(centers, directions=(1, 0, 0), colors=(1, 0, 0), scales=1):
 
 
 def rectangle(centers, directions=(1, 0, 0), colors=(1, 0, 0),
-              scales=(1, 2, 0)):
+              scales=(1, 2, 0), instanced=False):
     """Visualize one or many rectangles with different features.
 
     Parameters
@@ -1806,6 +2038,9 @@ def rectangle(centers, directions=(1, 0, 0), colors=(1, 0, 0),
         RGB or RGBA (for opacity) R, G, B and A should be at the range [0, 1]
     scales : int or ndarray (N,3) or tuple (3,), optional
         Rectangle size on each direction (x, y), default(1)
+    instanced : bool, optional
+        If True, the unit primitive is uploaded once and rendered with GPU
+        instancing instead of being duplicated for each center.
 
     Returns
     -------
@@ -1827,12 +2062,13 @@ def rectangle(centers, directions=(1, 0, 0), colors=(1, 0, 0),
 
     """
     return square(centers=centers, directions=directions, colors=colors,
-                  scales=scales)
+                  scales=scales, instanced=instanced)
 
 
 @deprecated_params(['size', 'heights'], ['scales', 'scales'],
                    since='0.6', until='0.8')
-def box(centers, directions=(1, 0, 0), colors=(1, 0, 0), scales=(1, 2, 3)):
+def box(centers, directions=(1, 0, 0), colors=(1, 0, 0), scales=(1, 2, 3),
+        instanced=False):
     """Visualize one or many boxes with different features.
 
     Parameters
@@ -1845,6 +2081,9 @@ def box(centers, directions=(1, 0, 0), colors=(1, 0, 0), scales=(1, 2, 3)):
         RGB or RGBA (for opacity) R, G, B and A should be at the range [0, 1]
     scales : int or ndarray (N,3) or tuple (3,), optional
         Box size on each direction (x, y), default(1)
+    instanced : bool, optional
+        If True, the unit primitive is uploaded once and rendered with GPU
+        instancing instead of being duplicated for each center.
 
     Returns
     -------
@@ -1862,6 +2101,11 @@ def box(centers, directions=(1, 0, 0), colors=(1, 0, 0), scales=(1, 2, 3)):
 
     """
     verts, faces = fp.prim_box()
+    if instanced:
+        return get_instanced_actor_from_primitive(
+            verts, faces, centers, directions=directions, colors=colors,
+            scales=scales)
+
     res = fp.repeat_primitive(verts, faces, directions=directions,
                               centers=centers, colors=colors, scales=scales)
 
@@ -1873,7 +2117,8 @@ def box(centers, directions=(1, 0, 0), colors=(1, 0, 0), scales=(1, 2, 3)):
 
 
 @deprecated_params('heights', 'scales', since='0.6', until='0.8')
-def cube(centers, directions=(1, 0, 0), colors=(1, 0, 0), scales=1):
+def cube(centers, directions=(1, 0, 0), colors=(1, 0, 0), scales=1,
+         instanced=False):
     """Visualize one or many cubes with different features.
 
     Parameters
@@ -1886,6 +2131,9 @@ def cube(centers, directions=(1, 0, 0), colors=(1, 0, 0), scales=1):
         RGB or RGBA (for opacity) R, G, B and A should be at the range [0, 1]
     scales : int or ndarray (N,3) or tuple (3,), optional
         Cube size, default=1
+    instanced : bool, optional
+        If True, the unit primitive is uploaded once and rendered with GPU
+        instancing instead of being duplicated for each center.
 
     Returns
     -------
@@ -1903,12 +2151,12 @@ def cube(centers, directions=(1, 0, 0), colors=(1, 0, 0), scales=1):
 
     """
     return box(centers=centers, directions=directions, colors=colors,
-               scales=scales)
+               scales=scales, instanced=instanced)
 
 
 def arrow(centers, directions, colors, heights=1., resolution=10,
           tip_length=0.35, tip_radius=0.1, shaft_radius=0.03, scales=1,
-          vertices=None, faces=None, repeat_primitive=True):
+          vertices=None, faces=None, repeat_primitive=True, instanced=False):
     """Visualize one or many arrows with differents features.
 
     Parameters
@@ -1935,6 +2183,9 @@ def arrow(centers, directions, colors, heights=1., resolution=10,
         If faces is None then a arrow is created based on directions, heights
         and resolution. If not then a arrow is created with the provided
         vertices and faces.
+    instanced : bool, optional
+        If True, the unit primitive is uploaded once and rendered with GPU
+        instancing instead of being duplicated for each center.
 
     Returns
     -------
@@ -1952,6 +2203,13 @@ def arrow(centers, directions, colors, heights=1., resolution=10,
     >>> # window.show(scene)
 
     """
+    if instanced:
+        if faces is None and vertices is None:
+            vertices, faces = fp.prim_arrow()
+        return get_instanced_actor_from_primitive(
+            vertices, faces, centers, directions=directions, colors=colors,
+            scales=scales)
+
     if repeat_primitive:
         vertices, faces = fp.prim_arrow()
         res = fp.repeat_primitive(vertices, faces, directions=directions, centers=centers,
@@ -1978,7 +2236,7 @@ def arrow(centers, directions, colors, heights=1., resolution=10,
 
 
 def cone(centers, directions, colors, heights=1., resolution=10,
-         vertices=None, faces=None, use_primitive=True):
+         vertices=None, faces=None, use_primitive=True, instanced=False):
     """Visualize one or many cones with different features.
 
     Parameters
@@ -2001,6 +2259,9 @@ def cone(centers, directions, colors, heights=1., resolution=10,
         vertices and faces.
     use_primitive: boolean, optional
         If True uses primitives to create the cone actor.
+    instanced : bool, optional
+        If True, the unit primitive is uploaded once and rendered with GPU
+        instancing instead of being duplicated for each center.
 
     Returns
     -------
@@ -2018,7 +2279,7 @@ def cone(centers, directions, colors, heights=1., resolution=10,
     >>> # window.show(scene)
 
     """
-    if not use_primitive:
+    if not use_primitive and not instanced:
         src = ConeSource() if faces is None else None
 
         if src is not None:
@@ -2032,6 +2293,11 @@ def cone(centers, directions, colors, heights=1., resolution=10,
     if faces is None and vertices is None:
         vertices, faces = fp.prim_cone(sectors=resolution)
 
+    if instanced:
+        return get_instanced_actor_from_primitive(
+            vertices, faces, centers, directions=directions, colors=colors,
+            scales=heights)
+
     res = fp.repeat_primitive(
                     vertices, faces, centers,
                     directions=directions, colors=colors, scales=heights)
@@ -2045,7 +2311,7 @@ def cone(centers, directions, colors, heights=1., resolution=10,
 
 
 def triangularprism(centers, directions=(1, 0, 0), colors=(1, 0, 0),
-                    scales=1):
+                    scales=1, instanced=False):
     """Visualize one or many regular triangular prisms with different features.
 
     Parameters
@@ -2058,6 +2324,9 @@ def triangularprism(centers, directions=(1, 0, 0), colors=(1, 0, 0),
         RGB or RGBA (for opacity) R, G, B and A should be at the range [0, 1]
     scales : int or ndarray (N,3) or tuple (3,), optional
         Triangular prism size on each direction (x, y), default(1)
+    instanced : bool, optional
+        If True, the unit primitive is uploaded once and rendered with GPU
+        instancing instead of being duplicated for each center.
 
     Returns
     -------
@@ -2077,6 +2346,11 @@ def triangularprism(centers, directions=(1, 0, 0), colors=(1, 0, 0),
 
     """
     verts, faces = fp.prim_triangularprism()
+    if instanced:
+        return get_instanced_actor_from_primitive(
+            verts, faces, centers, directions=directions, colors=colors,
+            scales=scales)
+
     res = fp.repeat_primitive(verts, faces, directions=directions,
                               centers=centers, colors=colors, scales=scales)
     big_verts, big_faces, big_colors, _ = res
@@ -2087,7 +2361,7 @@ def triangularprism(centers, directions=(1, 0, 0), colors=(1, 0, 0),
 
 
 def rhombicuboctahedron(centers, directions=(1, 0, 0), colors=(1, 0, 0),
-                        scales=1):
+                        scales=1, instanced=False):
     """Visualize one or many rhombicuboctahedron with different features.
 
     Parameters
@@ -2100,6 +2374,9 @@ def rhombicuboctahedron(centers, directions=(1, 0, 0), colors=(1, 0, 0),
         RGB or RGBA (for opacity) R, G, B and A should be at the range [0, 1]
     scales : int or ndarray (N,3) or tuple (3,), optional
         Rhombicuboctahedron size on each direction (x, y), default(1)
+    instanced : bool, optional
+        If True, the unit primitive is uploaded once and rendered with GPU
+        instancing instead of being duplicated for each center.
 
     Returns
     -------
@@ -2119,6 +2396,11 @@ def rhombicuboctahedron(centers, directions=(1, 0, 0), colors=(1, 0, 0),
 
     """
     verts, faces = fp.prim_rhombicuboctahedron()
+    if instanced:
+        return get_instanced_actor_from_primitive(
+            verts, faces, centers, directions=directions, colors=colors,
+            scales=scales)
+
     res = fp.repeat_primitive(verts, faces, directions=directions,
                               centers=centers, colors=colors, scales=scales)
     big_verts, big_faces, big_colors, _ = res
@@ -2129,7 +2411,7 @@ def rhombicuboctahedron(centers, directions=(1, 0, 0), colors=(1, 0, 0),
 
 
 def pentagonalprism(centers, directions=(1, 0, 0), colors=(1, 0, 0),
-                    scales=1):
+                    scales=1, instanced=False):
     """Visualize one or many pentagonal prisms with different features.
 
     Parameters
@@ -2142,6 +2424,9 @@ def pentagonalprism(centers, directions=(1, 0, 0), colors=(1, 0, 0),
         RGB or RGBA (for opacity) R, G, B and A should be at the range [0, 1]
     scales : int or ndarray (N,3) or tuple (3,), optional
         Pentagonal prism size on each direction (x, y), default(1)
+    instanced : bool, optional
+        If True, the unit primitive is uploaded once and rendered with GPU
+        instancing instead of being duplicated for each center.
 
     Returns
     -------
@@ -2162,6 +2447,11 @@ def pentagonalprism(centers, directions=(1, 0, 0), colors=(1, 0, 0),
 
     """
     verts, faces = fp.prim_pentagonalprism()
+    if instanced:
+        return get_instanced_actor_from_primitive(
+            verts, faces, centers, directions=directions, colors=colors,
+            scales=scales)
+
     res = fp.repeat_primitive(verts, faces, directions=directions,
                               centers=centers, colors=colors, scales=scales)
 
@@ -2173,7 +2463,7 @@ def pentagonalprism(centers, directions=(1, 0, 0), colors=(1, 0, 0),
 
 
 def octagonalprism(centers, directions=(1, 0, 0), colors=(1, 0, 0),
-                   scales=1):
+                   scales=1, instanced=False):
     """Visualize one or many octagonal prisms with different features.
 
     Parameters
@@ -2186,6 +2476,9 @@ def octagonalprism(centers, directions=(1, 0, 0), colors=(1, 0, 0),
         RGB or RGBA (for opacity) R, G, B and A should be at the range [0, 1]
     scales : int or ndarray (N,3) or tuple (3,), optional
         Octagonal prism size on each direction (x, y), default(1)
+    instanced : bool, optional
+        If True, the unit primitive is uploaded once and rendered with GPU
+        instancing instead of being duplicated for each center.
 
     Returns
     -------
@@ -2205,6 +2498,11 @@ def octagonalprism(centers, directions=(1, 0, 0), colors=(1, 0, 0),
 
     """
     verts, faces = fp.prim_octagonalprism()
+    if instanced:
+        return get_instanced_actor_from_primitive(
+            verts, faces, centers, directions=directions, colors=colors,
+            scales=scales)
+
     res = fp.repeat_primitive(verts, faces, directions=directions,
                               centers=centers, colors=colors, scales=scales)
 
@@ -2215,7 +2513,8 @@ def octagonalprism(centers, directions=(1, 0, 0), colors=(1, 0, 0),
     return oct_actor
 
 
-def frustum(centers, directions=(1, 0, 0), colors=(0, 1, 0), scales=1):
+def frustum(centers, directions=(1, 0, 0), colors=(0, 1, 0), scales=1,
+            instanced=False):
     """Visualize one or many frustum pyramids with different features.
 
     Parameters
@@ -2228,6 +2527,10 @@ def frustum(centers, directions=(1, 0, 0), colors=(0, 1, 0), scales=1):
         RGB or RGBA (for opacity) R, G, B and A should be at the range [0, 1]
     scales : int or ndarray (N,3) or tuple (3,), optional
         Frustum pyramid size on each direction (x, y), default(1)
+    instanced : bool, optional
+        If True, the unit primitive is uploaded once and rendered with GPU
+        instancing instead of being duplicated for each center.
+
     Returns
     -------
     frustum_actor: Actor
@@ -2246,6 +2549,11 @@ def frustum(centers, directions=(1, 0, 0), colors=(0, 1, 0), scales=1):
 
     """
     verts, faces = fp.prim_frustum()
+    if instanced:
+        return get_instanced_actor_from_primitive(
+            verts, faces, centers, directions=directions, colors=colors,
+            scales=scales)
+
     res = fp.repeat_primitive(verts, faces, directions=directions,
                               centers=centers, colors=colors, scales=scales)
 
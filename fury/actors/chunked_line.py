@@ -0,0 +1,163 @@
+from itertools import islice
+
+import numpy as np
+
+from fury.lib import Assembly
+from fury.optpkg import optional_package
+
+nib, have_nibabel, _ = optional_package('nibabel')
+
+
+def _line_chunks(lines, chunk_size):
+    """Yield consecutive chunks of at most ``chunk_size`` lines.
+
+    Sequences are sliced, so a memory-mapped ArraySequence only reads the
+    points of the current chunk. Other iterables are consumed lazily.
+
+    """
+    if hasattr(lines, '__getitem__') and hasattr(lines, '__len__'):
+        for start in range(0, len(lines), chunk_size):
+            yield lines[start:start + chunk_size]
+    else:
+        lines = iter(lines)
+        while True:
+            chunk = list(islice(lines, chunk_size))
+            if not chunk:
+                return
+            yield chunk
+
+
+class ChunkedLineActor(Assembly):
+    """VTK assembly rendering streamlines built chunk by chunk.
+
+    The streamlines are never stacked together: every chunk of
+    ``chunk_size`` lines gets its own actor, added to the assembly when the
+    chunk is loaded. This allows rendering tractograms larger than the
+    memory available to build a single polydata, and showing the first
+    chunks while the next ones are still being read.
+
+    Parameters
+    ----------
+    source : str, sequence or iterable of ndarrays
+        Streamlines, each one a (P, 3) array. It can be a generator, a list,
+        an ArraySequence whose data is a memory-mapped array, or the file
+        name of a tractogram (.trk, .tck, ...) which is then loaded lazily
+        with nibabel.
+    line_actor : callable
+        Function creating the actor of a chunk, called as
+        ``line_actor(lines, colors)``, e.g. :func:`fury.actor.line`.
+    chunk_size : int, optional
+        Number of lines per chunk. Default is 100000.
+    colors : None, tuple (3,), array (N, 3) or array (N,), optional
+        If None, a standard orientation colormap is used for every line.
+        If one tuple of color is given, all lines have the same color.
+        If an array is given, it holds one RGB color or one colormap value
+        for each of the N lines of ``source``, in the same order. When the
+        number of lines of ``source`` is unknown, e.g. for a generator, a
+        (3,) array is a single color.
+
+    """
+
+    def __init__(self, source, line_actor, chunk_size=100_000, colors=None):
+        if isinstance(source, str):
+            source = nib.streamlines.load(source, lazy_load=True).streamlines
+
+        self.chunk_size = chunk_size
+        self.chunk_actors = []
+        self.nb_lines = 0
+        self.finished = False
+        self.__chunks = _line_chunks(source, chunk_size)
+        self.__line_actor = line_actor
+        self.__colors = colors
+        self.__per_line_colors = False
+        if colors is not None:
+            # per-line colors are sliced for each chunk, a single color is
+            # given unchanged to every chunk
+            colors_array = np.asarray(colors)
+            if hasattr(source, '__len__'):
+                per_line = len(colors_array) == len(source)
+            else:
+                per_line = colors_array.shape != (3,)
+            if per_line:
+                self.__colors = colors_array
+                self.__per_line_colors = True
+
+    def load_chunk(self):
+        """Build the actor of the next chunk and add it to the assembly.
+
+        Returns
+        -------
+        chunk_actor : vtkActor or None
+            Actor of the chunk, None once every line has been loaded.
+
+        """
+        if self.finished:
+            return None
+
+        chunk = next(self.__chunks, None)
+        if chunk is None or len(chunk) == 0:
+            self.finished = True
+            return None
+
+        start, stop = self.nb_lines, self.nb_lines + len(chunk)
+        colors = self.__colors
+        if self.__per_line_colors:
+            colors = colors[start:stop]
+
+        chunk_actor = self.__line_actor(chunk, colors)
+        self.AddPart(chunk_actor)
+        self.chunk_actors.append(chunk_actor)
+        self.nb_lines = stop
+        return chunk_actor
+
+    def load_all(self):
+        """Load every remaining chunk."""
+        while self.load_chunk() is not None:
+            pass
+
+    def load_progressively(self, show_manager, chunks_per_update=1,
+                           interval=10, reset_camera=True):
+        """Load the chunks from a timer of a running show manager.
+
+        Parameters
+        ----------
+        show_manager : ShowManager
+            Show manager whose scene contains this assembly.
+        chunks_per_update : int, optional
+            Number of chunks loaded at every timer event. Default is 1.
+        interval : int, optional
+            Time between two timer events in milliseconds. Default is 10.
+        reset_camera : bool, optional
+            Reset the camera once the first chunk is loaded, so that it is
+            visible. Default is True.
+
+        Returns
+        -------
+        timer_id : int
+            Id of the timer, destroyed with its observer once every chunk is
+            loaded.
+
+        """
+        def timer_callback(_obj, _event):
+            if timer_id not in show_manager.timers:
+                return
+            first_chunk = not self.chunk_actors
+            for _ in range(chunks_per_update):
+                if self.load_chunk() is None:
+                    break
+
+            if reset_camera and first_chunk and self.chunk_actors:
+                show_manager.scene.ResetCamera()
+            show_manager.scene.ResetCameraClippingRange()
+            show_manager.render()
+            if self.finished:
+                show_manager.destroy_timer(timer_id)
+                show_manager.iren.RemoveObserver(observer_id)
+
+        # Same as ShowManager.add_timer_callback, which does not return the
+        # id of the observer.
+        observer_id = show_manager.iren.AddObserver("TimerEvent",
+                                                    timer_callback)
+        timer_id = show_manager.iren.CreateRepeatingTimer(interval)
+        show_manager.timers.append(timer_id)
+        return timer_id
@@ -0,0 +1,210 @@
+import numpy as np
+
+from fury.lib import (numpy_support, CellArray, Command, LODActor,
+                      PolyDataMapper, PolyData)
+from fury.utils import numpy_to_vtk_points
+
+
+def _decimate_lines(poly_data, point_step, line_step):
+    """Simplify the lines of a polydata by subsampling points and lines.
+
+    Parameters
+    ----------
+    poly_data : vtkPolyData
+        Polydata whose cells are lines.
+    point_step : int
+        Keep one point out of ``point_step`` along each line. The last point
+        of every line is always kept, so lines keep their extent.
+    line_step : int
+        Keep one line out of ``line_step``.
+
+    Returns
+    -------
+    decimated : vtkPolyData
+        Polydata with the kept points, lines and every point data array.
+
+    """
+    cells = poly_data.GetLines()
+    offsets = numpy_support.vtk_to_numpy(cells.GetOffsetsArray())
+    connectivity = numpy_support.vtk_to_numpy(cells.GetConnectivityArray())
+    lengths = np.diff(offsets)
+    nb_lines = len(lengths)
+
+    line_ids = np.repeat(np.arange(nb_lines), lengths)
+    local_ids = np.arange(len(connectivity)) - offsets[:-1][line_ids]
+    keep = line_ids % line_step == 0
+    keep &= (local_ids % point_step == 0) | \
+        (local_ids == lengths[line_ids] - 1)
+    point_ids = connectivity[keep]
+
+    new_lengths = np.bincount(line_ids[keep],
+                              minlength=nb_lines)[::line_step]
+    new_offsets = np.zeros(len(new_lengths) + 1, dtype=np.int64)
+    np.cumsum(new_lengths, out=new_offsets[1:])
+    array_type = numpy_support.get_vtk_array_type(np.int64)
+    new_cells = CellArray()
+    new_cells.SetData(
+        numpy_support.numpy_to_vtk(new_offsets, deep=True,
+                                   array_type=array_type),
+        numpy_support.numpy_to_vtk(np.arange(new_offsets[-1]), deep=True,
+                                   array_type=array_type))
+
+    points = numpy_support.vtk_to_numpy(poly_data.GetPoints().GetData())
+    decimated = PolyData()
+    decimated.SetPoints(numpy_to_vtk_points(points[point_ids]))
+    decimated.SetLines(new_cells)
+
+    point_data = poly_data.GetPointData()
+    for i in range(point_data.GetNumberOfArrays()):
+        vtk_array = point_data.GetArray(i)
+        array = numpy_support.vtk_to_numpy(vtk_array)[point_ids]
+        new_array = numpy_support.numpy_to_vtk(
+            np.ascontiguousarray(array), deep=True,
+            array_type=vtk_array.GetDataType())
+        new_array.SetName(vtk_array.GetName())
+        decimated.GetPointData().AddArray(new_array)
+    scalars = point_data.GetScalars()
+    if scalars is not None:
+        decimated.GetPointData().SetActiveScalars(scalars.GetName())
+    return decimated
+
+
+class LODLineActor(LODActor):
+    """VTK actor rendering lines with several levels of detail.
+
+    Simplified versions of the lines are computed once, by keeping one
+    point out of ``point_step`` along the lines and one line out of
+    ``line_step``. While the camera moves, VTK renders the finest level
+    whose last render time fits in the time allocated to the actor, which
+    comes from the desired update rate of the interactor. Once the camera
+    stops, the still update rate allocates enough time to render the lines
+    with full detail. Alternatively, the level can follow the size of the
+    lines on the screen with :meth:`track_camera`.
+
+    Parameters
+    ----------
+    mapper : vtkPolyDataMapper
+        Mapper of the lines at full resolution. Its settings (lookup table,
+        color array, ...) are shared by all levels.
+    levels : sequence of (int, int), optional
+        ``(point_step, line_step)`` of each simplified level, from the finest
+        to the coarsest. Default is ((2, 1), (4, 2), (8, 4)).
+
+    Attributes
+    ----------
+    level_mappers : list of vtkPolyDataMapper
+        Mappers of the full resolution lines followed by the simplified
+        levels.
+    level_steps : list of (int, int)
+        ``(point_step, line_step)`` of every mapper of ``level_mappers``.
+
+    """
+
+    def __init__(self, mapper, levels=((2, 1), (4, 2), (8, 4))):
+        poly_data = mapper.GetInput()
+        self.level_steps = [(1, 1)] + [tuple(steps) for steps in levels]
+        self.level_mappers = [mapper]
+        for point_step, line_step in self.level_steps[1:]:
+            level_mapper = PolyDataMapper()
+            level_mapper.ShallowCopy(mapper)
+            level_mapper.SetInputData(
+                _decimate_lines(poly_data, point_step, line_step))
+            self.level_mappers.append(level_mapper)
+
+        self.__camera = None
+        self.__observer_id = None
+        self.__full_detail_size = 1.
+        self.set_level(0)
+
+    @property
+    def level(self):
+        """Index in ``level_mappers`` of the finest level used."""
+        return self.__level
+
+    def set_level(self, level):
+        """Render the lines with a level of detail, or any coarser one.
+
+        Parameters
+        ----------
+        level : int
+            Index in ``level_mappers`` of the finest level that can be
+            rendered. Coarser levels are still used when the render time of
+            this level exceeds the time allocated to the actor.
+
+        """
+        self.__level = level
+        self.SetMapper(self.level_mappers[level])
+        self.GetLODMappers().RemoveAllItems()
+        # vtkLODActor builds its own point cloud levels when it has none,
+        # so the coarsest level is kept even when it is the one rendered
+        for level_mapper in self.level_mappers[level + 1:] or \
+                self.level_mappers[-1:]:
+            self.AddLODMapper(level_mapper)
+
+    def screen_size(self, camera):
+        """Compute the size of the lines on the screen.
+
+        Parameters
+        ----------
+        camera : vtkCamera
+
+        Returns
+        -------
+        size : float
+            Diagonal of the bounding box of the lines divided by the height
+            of the view at their center, i.e. 1 when they fill the view.
+
+        """
+        bounds = np.reshape(self.GetBounds(), (3, 2))
+        diagonal = np.linalg.norm(bounds[:, 1] - bounds[:, 0])
+        if camera.GetParallelProjection():
+            view_height = 2 * camera.GetParallelScale()
+        else:
+            distance = np.linalg.norm(np.asarray(camera.GetPosition()) -
+                                      bounds.mean(axis=1))
+            view_height = 2 * distance * np.tan(
+                np.radians(camera.GetViewAngle()) / 2)
+        if view_height <= 0:
+            return np.inf
+        return diagonal / view_height
+
+    def track_camera(self, camera, full_detail_size=1.):
+        """Select the level of detail from the size of the lines on screen.
+
+        Every time the camera changes, the level used is the coarsest one
+        whose ``point_step`` is at most ``full_detail_size / size``, where
+        ``size`` is given by :meth:`screen_size`. Lines filling the view are
+        rendered with full detail, lines filling half of it with one point
+        out of two, and so on.
+
+        Parameters
+        ----------
+        camera : vtkCamera or None
+            Camera of the scene, e.g. ``scene.GetActiveCamera()``. None
+            stops tracking the previous camera.
+        full_detail_size : float, optional
+            Screen size from which the lines are rendered with full detail.
+            Default is 1.
+
+        """
+        if self.__camera is not None:
+            self.__camera.RemoveObserver(self.__observer_id)
+            self.__camera = self.__observer_id = None
+        if camera is None:
+            return
+
+        self.__camera = camera
+        self.__full_detail_size = full_detail_size
+        self.__observer_id = camera.AddObserver(Command.ModifiedEvent,
+                                                self.__camera_callback)
+        self.__camera_callback(camera, None)
+
+    def __camera_callback(self, camera, _event):
+        size = self.screen_size(camera)
+        max_step = self.__full_detail_size / size if size > 0 else np.inf
+        level = 0
+        for i, (point_step, _) in enumerate(self.level_steps):
+            if point_step <= max_step:
+                level = i
+        if level != self.__level:
+            self.set_level(level)
@@ -0,0 +1,17 @@
+"""Streamlines and helpers shared by the tests of the line actors."""
+
+import numpy as np
+
+from fury.lib import numpy_support
+
+
+def generate_lines(nb_lines=10, max_points=6):
+    """Generate random lines of 2 to ``max_points - 1`` points."""
+    rng = np.random.default_rng(42)
+    return [rng.random((n, 3)) for n in rng.integers(2, max_points, nb_lines)]
+
+
+def mapper_points(mapper):
+    """Return the points of the polydata rendered by a mapper."""
+    polydata = mapper.GetInput()
+    return numpy_support.vtk_to_numpy(polydata.GetPoints().GetData())
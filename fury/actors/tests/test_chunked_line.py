@@ -0,0 +1,112 @@
+from itertools import chain
+from unittest.mock import MagicMock
+
+import numpy as np
+import numpy.testing as npt
+
+from fury import actor, utils
+from fury.actors.chunked_line import ChunkedLineActor, _line_chunks
+from fury.actors.tests._lines import generate_lines, mapper_points
+
+
+def test_line_chunks():
+    lines = generate_lines()
+    for source in (lines, iter(lines)):
+        chunks = list(_line_chunks(source, 4))
+        npt.assert_equal([len(chunk) for chunk in chunks], [4, 4, 2])
+        for chunk_line, line in zip(chain(*chunks), lines):
+            npt.assert_array_equal(chunk_line, line)
+
+
+def test_chunked_line():
+    lines = generate_lines()
+    colors = np.random.rand(len(lines), 3)
+    chunked_actor = actor.chunked_line((line for line in lines),
+                                       chunk_size=4, colors=colors)
+    npt.assert_equal(chunked_actor.GetParts().GetNumberOfItems(), 0)
+
+    chunk_actor = chunked_actor.load_chunk()
+    npt.assert_equal(chunked_actor.nb_lines, 4)
+    npt.assert_array_equal(mapper_points(chunk_actor.GetMapper()), np.vstack(lines[:4]))
+    res_colors = utils.get_polydata_colors(chunk_actor.GetMapper().GetInput())
+    npt.assert_array_equal(np.unique(res_colors, axis=0),
+                           np.unique((255 * colors[:4]).astype(np.uint8),
+                                     axis=0))
+
+    chunked_actor.load_all()
+    npt.assert_equal(chunked_actor.finished, True)
+    npt.assert_equal(chunked_actor.nb_lines, len(lines))
+    npt.assert_equal(chunked_actor.GetParts().GetNumberOfItems(), 3)
+    npt.assert_array_equal(
+        np.vstack([mapper_points(a.GetMapper()) for a in chunked_actor.chunk_actors]),
+        np.vstack(lines))
+    npt.assert_equal(chunked_actor.load_chunk(), None)
+
+
+def test_chunked_line_colors():
+    lines = generate_lines()
+    colors = np.random.rand(len(lines), 3)
+    values = np.arange(len(lines))
+
+    def chunk_colors(source, colors):
+        line_actor = MagicMock(return_value=actor.line(lines[:1]))
+        ChunkedLineActor(source(), line_actor, chunk_size=4,
+                         colors=colors).load_all()
+        return [call.args[1] for call in line_actor.call_args_list]
+
+    sources = (lambda: lines, lambda: iter(lines))
+    for source in sources:
+        # one color or one colormap value per line, given as lists
+        res = chunk_colors(source, colors.tolist())
+        npt.assert_equal(len(res), 3)
+        npt.assert_array_equal(np.vstack(res), colors)
+        res = chunk_colors(source, values.tolist())
+        npt.assert_array_equal(np.concatenate(res), values)
+
+    # a single color is given to every chunk
+    for source in sources:
+        for color in ((1, 0, 0), np.array([1, 0, 0])):
+            res = chunk_colors(source, color)
+            npt.assert_equal(len(res), 3)
+            for chunk_color in res:
+                npt.assert_array_equal(chunk_color, [1, 0, 0])
+    npt.assert_equal(chunk_colors(sources[0], None), [None] * 3)
+
+
+def test_chunked_line_load_progressively():
+    lines = generate_lines()
+    line_actor = MagicMock(side_effect=lambda chunk, colors: actor.line(chunk))
+    chunked_actor = ChunkedLineActor(lines, line_actor, chunk_size=4,
+                                     colors=(1, 0, 0))
+
+    showm = MagicMock()
+    showm.timers = []
+
+    def add_observer(event, timer_callback):
+        showm.callback = timer_callback
+        return 7
+
+    showm.iren.AddObserver.side_effect = add_observer
+    showm.iren.CreateRepeatingTimer.return_value = 1
+    showm.destroy_timer.side_effect = showm.timers.remove
+
+    timer_id = chunked_actor.load_progressively(showm, chunks_per_update=2)
+    npt.assert_equal(timer_id, 1)
+    npt.assert_equal(showm.timers, [1])
+    showm.iren.CreateRepeatingTimer.assert_called_once_with(10)
+
+    showm.callback(None, None)
+    npt.assert_equal(chunked_actor.nb_lines, 8)
+    showm.scene.ResetCamera.assert_called_once()
+    showm.render.assert_called_once()
+    line_actor.assert_called_with(lines[4:8], (1, 0, 0))
+
+    showm.callback(None, None)
+    npt.assert_equal(chunked_actor.finished, True)
+    showm.destroy_timer.assert_called_once_with(timer_id)
+    showm.iren.RemoveObserver.assert_called_once_with(7)
+
+    # Events of other timers are ignored once every chunk is loaded
+    showm.callback(None, None)
+    npt.assert_equal(showm.render.call_count, 2)
+    npt.assert_equal(line_actor.call_count, 3)
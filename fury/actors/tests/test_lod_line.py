@@ -0,0 +1,100 @@
+import numpy as np
+import numpy.testing as npt
+
+from fury import actor, utils
+from fury.actors.lod_line import LODLineActor, _decimate_lines
+from fury.actors.tests._lines import generate_lines, mapper_points
+from fury.lib import numpy_support, Camera
+
+
+def test_decimate_lines():
+    lines = generate_lines(nb_lines=8, max_points=12)
+    colors = np.random.rand(len(lines), 3)
+    poly_data, _ = utils.lines_to_vtk_polydata(lines, colors)
+
+    decimated = _decimate_lines(poly_data, point_step=3, line_step=2)
+    expected = [np.vstack([line[::3], line[-1:]]) if (len(line) - 1) % 3
+                else line[::3] for line in lines[::2]]
+    res_lines = utils.get_polydata_lines(decimated)
+    npt.assert_equal(len(res_lines), len(expected))
+    for res_line, line in zip(res_lines, expected):
+        npt.assert_array_equal(res_line, line)
+
+    res_colors = utils.get_polydata_colors(decimated)
+    expected_colors = np.repeat((255 * colors[::2]).astype(np.uint8),
+                                [len(line) for line in expected], axis=0)
+    npt.assert_array_equal(res_colors, expected_colors)
+    npt.assert_equal(decimated.GetPointData().GetScalars().GetName(),
+                     'colors')
+
+    decimated = _decimate_lines(poly_data, point_step=1, line_step=1)
+    npt.assert_array_equal(mapper_points(actor.line(lines).GetMapper()),
+                           numpy_support.vtk_to_numpy(
+                               decimated.GetPoints().GetData()))
+
+
+def test_lod_line():
+    lines = generate_lines(nb_lines=8, max_points=12)
+    lod_actor = actor.lod_line(lines, colors=(1, 0, 0), opacity=.5,
+                               linewidth=3, levels=((2, 1), (4, 2)))
+    npt.assert_equal(lod_actor.GetProperty().GetOpacity(), .5)
+    npt.assert_equal(lod_actor.GetProperty().GetLineWidth(), 3)
+    npt.assert_equal(lod_actor.level_steps, [(1, 1), (2, 1), (4, 2)])
+    npt.assert_equal(len(lod_actor.level_mappers), 3)
+    npt.assert_equal(lod_actor.GetLODMappers().GetNumberOfItems(), 2)
+    npt.assert_array_equal(mapper_points(lod_actor.level_mappers[0]),
+                           np.vstack(lines))
+    nb_points = [len(mapper_points(m)) for m in lod_actor.level_mappers]
+    npt.assert_equal(nb_points, sorted(nb_points, reverse=True))
+    for level_mapper in lod_actor.level_mappers[1:]:
+        npt.assert_equal(level_mapper.GetScalarVisibility(), True)
+        npt.assert_equal(level_mapper.GetArrayName(), 'colors')
+
+    lod_actor.set_level(1)
+    npt.assert_equal(lod_actor.level, 1)
+    npt.assert_equal(lod_actor.GetMapper(), lod_actor.level_mappers[1])
+    npt.assert_equal(lod_actor.GetLODMappers().GetNumberOfItems(), 1)
+
+    # vtkLODActor would add its own point cloud levels to an empty
+    # collection, the coarsest level is always kept
+    for levels in (((2, 1), (4, 2)), ()):
+        lod_actor = actor.lod_line(lines, levels=levels)
+        for level in range(len(lod_actor.level_mappers)):
+            lod_actor.set_level(level)
+            lod_mappers = lod_actor.GetLODMappers()
+            npt.assert_equal(lod_mappers.GetNumberOfItems() >= 1, True)
+            npt.assert_equal(
+                lod_mappers.GetItemAsObject(
+                    lod_mappers.GetNumberOfItems() - 1),
+                lod_actor.level_mappers[-1])
+
+
+def test_lod_line_track_camera():
+    lines = generate_lines(nb_lines=8, max_points=12)
+    lod_actor = LODLineActor(actor.line(lines).GetMapper())
+
+    camera = Camera()
+    camera.SetFocalPoint(lod_actor.GetCenter())
+    camera.SetPosition(np.add(lod_actor.GetCenter(), (0, 0, 1)))
+    lod_actor.track_camera(camera)
+    npt.assert_equal(lod_actor.level, 0)
+
+    # Twice smaller on screen, one point out of two is enough
+    camera.Dolly(.5)
+    npt.assert_almost_equal(lod_actor.screen_size(camera),
+                            np.linalg.norm(np.ptp(np.vstack(lines), axis=0)) /
+                            (4 * np.tan(np.radians(15))))
+    lod_actor.track_camera(camera, full_detail_size=4)
+    npt.assert_equal(lod_actor.level, 1)
+    camera.Dolly(.1)
+    npt.assert_equal(lod_actor.level, 3)
+
+    camera.ParallelProjectionOn()
+    camera.SetParallelScale(100)
+    npt.assert_equal(lod_actor.level, 3)
+    camera.SetParallelScale(.01)
+    npt.assert_equal(lod_actor.level, 0)
+
+    lod_actor.track_camera(None)
+    camera.SetParallelScale(100)
+    npt.assert_equal(lod_actor.level, 0)
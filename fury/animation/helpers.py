@@ -8,7 +8,7 @@ def get_previous_timestamp(timestamps, current_time, include_last=False):
     ----------
     timestamps : ndarray
         Sorted list of timestamps.
-    current_time : float or int
+    current_time : float or int or ndarray
         The time to get previous timestamp for.
     include_last: bool, optional, default: False
         If `True`, even the last timestamp will be considered a valid previous
@@ -16,14 +16,14 @@ def get_previous_timestamp(timestamps, current_time, include_last=False):
 
     Returns
     -------
-    float or int
+    float or int or ndarray
         The previous timestamp
     """
 
-    for timestamp in timestamps[::-1] if include_last else timestamps[-2::-1]:
-        if timestamp <= current_time:
-            return timestamp
-    return timestamps[0]
+    index = np.searchsorted(timestamps, current_time, side='right') - 1
+    if not include_last:
+        index = np.minimum(index, len(timestamps) - 2)
+    return timestamps[np.maximum(index, 0)]
 
 
 def get_next_timestamp(timestamps, current_time, include_first=False):
@@ -33,7 +33,7 @@ def get_next_timestamp(timestamps, current_time, include_first=False):
     ----------
     timestamps : ndarray
         Sorted list of timestamps.
-    current_time : float or int
+    current_time : float or int or ndarray
         The time to get previous timestamp for.
     include_first: bool, optional, default: False
         If `True`, even the first timestamp will be considered a valid next
@@ -41,13 +41,52 @@ def get_next_timestamp(timestamps, current_time, include_first=False):
 
     Returns
     -------
-    float or int
+    float or int or ndarray
         The next timestamp
     """
-    for timestamp in timestamps[:] if include_first else timestamps[1:]:
-        if timestamp > current_time:
-            return timestamp
-    return timestamps[-1]
+    index = np.searchsorted(timestamps, current_time, side='right')
+    if not include_first:
+        index = np.maximum(index, 1)
+    return timestamps[np.minimum(index, len(timestamps) - 1)]
+
+
+def get_segment_index(timestamps, current_time, last_index=None):
+    """Return the index of the keyframes segment containing a given time.
+
+    The segment ``i`` spans ``timestamps[i]`` to ``timestamps[i + 1]``. Times
+    before the first or after the last timestamp are assigned to the first or
+    the last segment, which matches `get_previous_timestamp` and
+    `get_next_timestamp`.
+
+    Parameters
+    ----------
+    timestamps : ndarray
+        Sorted list of timestamps.
+    current_time : float or int or ndarray
+        The time(s) to get the segment for.
+    last_index : int, optional
+        Segment index returned by the previous call. This segment and the next
+        one are checked before falling back to a binary search, which makes
+        monotonic playback constant time.
+
+    Returns
+    -------
+    int or ndarray
+        The index of the previous timestamp of the segment.
+    """
+    last_segment = len(timestamps) - 2
+    if np.ndim(current_time):
+        index = np.searchsorted(timestamps, current_time, side='right') - 1
+        return np.clip(index, 0, max(last_segment, 0))
+    if last_index is not None and 0 <= last_index <= last_segment:
+        if timestamps[last_index] <= current_time:
+            if current_time < timestamps[last_index + 1]:
+                return last_index
+            if last_index < last_segment and \
+                    current_time < timestamps[last_index + 2]:
+                return last_index + 1
+    index = np.searchsorted(timestamps, current_time, side='right') - 1
+    return max(min(index, last_segment), 0)
 
 
 def get_timestamps_from_keyframes(keyframes):
@@ -88,18 +127,25 @@ def get_time_tau(t, t0, t1):
 
     Parameters
     ----------
-    t : float or int
+    t : float or int or ndarray
         Current time to calculate tau for.
-    t0 : float or int
+    t0 : float or int or ndarray
         Lower timestamp of the time period.
-    t1 : float or int
+    t1 : float or int or ndarray
         Higher timestamp of the time period.
 
     Returns
     -------
-    float
+    float or ndarray
         The time tau
     """
+    if np.ndim(t) or np.ndim(t0) or np.ndim(t1):
+        t, t0, t1 = np.broadcast_arrays(t, t0, t1)
+        duration = t1 - t0
+        tau = np.where(t > t0, 1., 0.)
+        valid = duration > 0
+        tau[valid] = (t[valid] - t0[valid]) / duration[valid]
+        return np.clip(tau, 0, 1)
     return 0 if t <= t0 else 1 if t >= t1 else (t - t0) / (t1 - t0)
 
 
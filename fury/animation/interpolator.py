@@ -2,9 +2,17 @@ import numpy as np
 from scipy.interpolate import splprep, splev
 from scipy.spatial import transform
 from fury.colormap import rgb2hsv, hsv2rgb, rgb2lab, lab2rgb, xyz2rgb, rgb2xyz
-from fury.animation.helpers import get_previous_timestamp, get_next_timestamp,\
-    get_time_tau, get_timestamps_from_keyframes, euclidean_distances,\
-    get_values_from_keyframes, lerp
+from fury.animation.helpers import get_previous_timestamp, get_time_tau, \
+    get_timestamps_from_keyframes, euclidean_distances, \
+    get_values_from_keyframes, lerp, get_segment_index
+
+
+def _get_batch_values(keyframes, timestamps, key='value'):
+    return np.asarray([keyframes.get(t).get(key) for t in timestamps])
+
+
+def _as_column(tau, values):
+    return np.reshape(tau, (-1,) + (1,) * (np.ndim(values) - 1))
 
 
 def spline_interpolator(keyframes, degree):
@@ -24,7 +32,8 @@ def spline_interpolator(keyframes, degree):
     -------
     function
         The interpolation function that take time and return interpolated
-        value at that time.
+        value at that time. Given an array of T timestamps, it returns an
+        array of T interpolated values.
 
     """
     if len(keyframes) < (degree + 1):
@@ -38,11 +47,19 @@ def spline_interpolator(keyframes, degree):
     distances_sum = sum(distances)
     cumulative_dist_sum = np.cumsum([0] + distances)
     tck = splprep(values.T, k=degree, full_output=1, s=0)[0][0]
+    mi_index = None
 
     def interpolate(t):
-        t0 = get_previous_timestamp(timestamps, t)
-        t1 = get_next_timestamp(timestamps, t)
-        mi_index = np.where(timestamps == t0)[0][0]
+        nonlocal mi_index
+        if np.ndim(t):
+            index = get_segment_index(timestamps, t)
+            dt = get_time_tau(t, timestamps[index], timestamps[index + 1])
+            ts = (cumulative_dist_sum[index] +
+                  dt * np.take(distances, index)) / distances_sum
+            return np.array(splev(ts, tck)).T
+        mi_index = get_segment_index(timestamps, t, mi_index)
+        t0 = timestamps[mi_index]
+        t1 = timestamps[mi_index + 1]
         dt = get_time_tau(t, t0, t1)
         section = cumulative_dist_sum[mi_index]
         ts = (section + dt * distances[mi_index]) / distances_sum
@@ -67,7 +84,8 @@ def cubic_spline_interpolator(keyframes):
     -------
     function
         The interpolation function that take time and return interpolated
-        value at that time.
+        value at that time. Given an array of T timestamps, it returns an
+        array of T interpolated values.
 
     See Also
     --------
@@ -92,12 +110,17 @@ def step_interpolator(keyframes):
     -------
     function
         The interpolation function that take time and return interpolated
-        value at that time.
+        value at that time. Given an array of T timestamps, it returns an
+        array of T interpolated values.
     """
 
     timestamps = get_timestamps_from_keyframes(keyframes)
 
     def interpolate(t):
+        if np.ndim(t):
+            index = np.searchsorted(timestamps, t, side='right') - 1
+            values = _get_batch_values(keyframes, timestamps)
+            return values[np.maximum(index, 0)]
         previous_t = get_previous_timestamp(timestamps, t, include_last=True)
         return keyframes.get(previous_t).get('value')
 
@@ -119,17 +142,29 @@ def linear_interpolator(keyframes):
     -------
     function
         The interpolation function that take time and return interpolated
-        value at that time.
+        value at that time. Given an array of T timestamps, it returns an
+        array of T interpolated values.
     """
     timestamps = get_timestamps_from_keyframes(keyframes)
     is_single = len(keyframes) == 1
+    index = None
 
     def interpolate(t):
+        nonlocal index
+        if np.ndim(t):
+            values = _get_batch_values(keyframes, timestamps)
+            if is_single:
+                return np.repeat(values, len(t), axis=0)
+            idx = get_segment_index(timestamps, t)
+            dt = get_time_tau(t, timestamps[idx], timestamps[idx + 1])
+            v0 = values[idx]
+            return v0 + _as_column(dt, values) * (values[idx + 1] - v0)
         if is_single:
             t = timestamps[0]
             return keyframes.get(t).get('value')
-        t0 = get_previous_timestamp(timestamps, t)
-        t1 = get_next_timestamp(timestamps, t)
+        index = get_segment_index(timestamps, t, index)
+        t0 = timestamps[index]
+        t1 = timestamps[index + 1]
         p0 = keyframes.get(t0).get('value')
         p1 = keyframes.get(t1).get('value')
         return lerp(p0, p1, t0, t1, t)
@@ -152,7 +187,8 @@ def cubic_bezier_interpolator(keyframes):
     -------
     function
         The interpolation function that take time and return interpolated
-        value at that time.
+        value at that time. Given an array of T timestamps, it returns an
+        array of T interpolated values.
 
     Notes
     -----
@@ -170,17 +206,32 @@ def cubic_bezier_interpolator(keyframes):
 
         if kf_ts.get('out_cp') is None:
             kf_ts['out_cp'] = kf_ts.get('value')
+    last = len(timestamps) - 1
+    index = None
 
     def interpolate(t):
-        t0 = get_previous_timestamp(timestamps, t)
-        t1 = get_next_timestamp(timestamps, t)
-        k0 = keyframes.get(t0)
-        k1 = keyframes.get(t1)
-        p0 = k0.get('value')
-        p1 = k0.get('out_cp')
-        p2 = k1.get('in_cp')
-        p3 = k1.get('value')
-        dt = get_time_tau(t, t0, t1)
+        nonlocal index
+        if np.ndim(t):
+            idx0 = get_segment_index(timestamps, t)
+            idx1 = np.minimum(idx0 + 1, last)
+            values = _get_batch_values(keyframes, timestamps)
+            p0 = values[idx0]
+            p1 = _get_batch_values(keyframes, timestamps, 'out_cp')[idx0]
+            p2 = _get_batch_values(keyframes, timestamps, 'in_cp')[idx1]
+            p3 = values[idx1]
+            dt = _as_column(get_time_tau(t, timestamps[idx0],
+                                         timestamps[idx1]), values)
+        else:
+            index = get_segment_index(timestamps, t, index)
+            t0 = timestamps[index]
+            t1 = timestamps[min(index + 1, last)]
+            k0 = keyframes.get(t0)
+            k1 = keyframes.get(t1)
+            p0 = k0.get('value')
+            p1 = k0.get('out_cp')
+            p2 = k1.get('in_cp')
+            p3 = k1.get('value')
+            dt = get_time_tau(t, t0, t1)
         val = (1 - dt) ** 3 * p0 + 3 * (1 - dt) ** 2 * dt * p1 + 3 * \
               (1 - dt) * dt ** 2 * p2 + dt ** 3 * p3
         return val
@@ -202,7 +253,8 @@ def slerp(keyframes):
     -------
     function
         The interpolation function that take time and return interpolated
-        value at that time.
+        value at that time. Given an array of T timestamps, it returns an
+        array of T interpolated values.
 
     Notes
     -----
@@ -223,7 +275,7 @@ def slerp(keyframes):
     max_t = timestamps[-1]
 
     def interpolate(t):
-        t = min_t if t < min_t else max_t if t > max_t else t
+        t = np.clip(t, min_t, max_t)
         v = slerp_interp(t)
         q = v.as_quat()
         return q
@@ -251,7 +303,8 @@ def color_interpolator(keyframes, rgb2space, space2rgb):
     -------
     function
         The interpolation function that take time and return interpolated
-        value at that time.
+        value at that time. Given an array of T timestamps, it returns an
+        array of T interpolated values.
 
     """
     timestamps = get_timestamps_from_keyframes(keyframes)
@@ -259,13 +312,27 @@ def color_interpolator(keyframes, rgb2space, space2rgb):
     is_single = len(keyframes) == 1
     for ts, keyframe in keyframes.items():
         space_keyframes[ts] = rgb2space(keyframe.get('value'))
+    index = None
 
     def interpolate(t):
+        nonlocal index
+        if np.ndim(t):
+            if is_single:
+                return np.repeat(_get_batch_values(keyframes, timestamps),
+                                 len(t), axis=0)
+            values = np.asarray([space_keyframes.get(ts)
+                                 for ts in timestamps])
+            idx = get_segment_index(timestamps, t)
+            dt = get_time_tau(t, timestamps[idx], timestamps[idx + 1])
+            c0 = values[idx]
+            return space2rgb(c0 + _as_column(dt, values) *
+                             (values[idx + 1] - c0))
         if is_single:
             t = timestamps[0]
             return keyframes.get(t).get('value')
-        t0 = get_previous_timestamp(timestamps, t)
-        t1 = get_next_timestamp(timestamps, t)
+        index = get_segment_index(timestamps, t, index)
+        t0 = timestamps[index]
+        t1 = timestamps[index + 1]
         c0 = space_keyframes.get(t0)
         c1 = space_keyframes.get(t1)
         space_color_val = lerp(c0, c1, t0, t1, t)
@@ -319,7 +386,8 @@ def tan_cubic_spline_interpolator(keyframes):
     -------
     function
         The interpolation function that take time and return interpolated
-        value at that time.
+        value at that time. Given an array of T timestamps, it returns an
+        array of T interpolated values.
 
     """
 
@@ -331,19 +399,39 @@ def tan_cubic_spline_interpolator(keyframes):
             data['in_tangent'] = np.zeros_like(value)
         if data.get('in_tangent') is None:
             data['in_tangent'] = np.zeros_like(value)
+    last = len(timestamps) - 1
+    index = None
 
     def interpolate(t):
-        t0 = get_previous_timestamp(timestamps, t)
-        t1 = get_next_timestamp(timestamps, t)
-
-        dt = get_time_tau(t, t0, t1)
-
-        time_delta = t1 - t0
-
-        p0 = keyframes.get(t0).get('value')
-        tan_0 = keyframes.get(t0).get('out_tangent') * time_delta
-        p1 = keyframes.get(t1).get('value')
-        tan_1 = keyframes.get(t1).get('in_tangent') * time_delta
+        nonlocal index
+        if np.ndim(t):
+            idx0 = get_segment_index(timestamps, t)
+            idx1 = np.minimum(idx0 + 1, last)
+            values = _get_batch_values(keyframes, timestamps)
+            t0 = timestamps[idx0]
+            t1 = timestamps[idx1]
+            dt = _as_column(get_time_tau(t, t0, t1), values)
+            time_delta = _as_column(t1 - t0, values)
+
+            p0 = values[idx0]
+            tan_0 = _get_batch_values(keyframes, timestamps,
+                                      'out_tangent')[idx0] * time_delta
+            p1 = values[idx1]
+            tan_1 = _get_batch_values(keyframes, timestamps,
+                                      'in_tangent')[idx1] * time_delta
+        else:
+            index = get_segment_index(timestamps, t, index)
+            t0 = timestamps[index]
+            t1 = timestamps[min(index + 1, last)]
+
+            dt = get_time_tau(t, t0, t1)
+
+            time_delta = t1 - t0
+
+            p0 = keyframes.get(t0).get('value')
+            tan_0 = keyframes.get(t0).get('out_tangent') * time_delta
+            p1 = keyframes.get(t1).get('value')
+            tan_1 = keyframes.get(t1).get('in_tangent') * time_delta
         # cubic spline equation using tangents
         t2 = dt * dt
         t3 = t2 * dt
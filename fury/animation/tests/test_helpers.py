@@ -88,6 +88,29 @@ def test_get_previous_timestamp():
     ft.assert_equal(ts, 6)
 
 
+def test_get_segment_index():
+    timestamps = np.array([1, 2, 3, 4, 5, 6])
+    last_index = None
+    for t in range(-100, 100, 1):
+        t /= 10
+        index = helpers.get_segment_index(timestamps, t)
+        ft.assert_equal(timestamps[index],
+                        helpers.get_previous_timestamp(timestamps, t))
+        ft.assert_equal(timestamps[index + 1],
+                        helpers.get_next_timestamp(timestamps, t))
+        # cached segment from the previous evaluation
+        last_index = helpers.get_segment_index(timestamps, t, last_index)
+        ft.assert_equal(last_index, index)
+        # wrong cached segments
+        for hint in [-1, 0, 3, 4, 5, 10]:
+            ft.assert_equal(helpers.get_segment_index(timestamps, t, hint),
+                            index)
+
+    ft.assert_equal(helpers.get_segment_index(timestamps, 6), 4)
+    ft.assert_equal(helpers.get_segment_index(timestamps, 3.5, 1), 2)
+    ft.assert_equal(helpers.get_segment_index(np.array([1]), 3), 0)
+
+
 def test_get_time_tau():
     t0 = 5
     t1 = 20
@@ -339,3 +339,36 @@ def test_slerp():
         raise "This shouldn't work since invalid keyframes were provided!"
     except ValueError:
         ...
+
+
+def test_batch_interpolation():
+    timestamps = np.linspace(-1, 6, 71)
+    data = {0: {'value': np.array([0, 0, 0])},
+            1: {'value': np.array([1, 2, 0])},
+            2.5: {'value': np.array([3, 1, 1])},
+            4: {'value': np.array([0, 1, 2])},
+            5: {'value': np.array([1, 1, 1])}}
+    rotations = {0: {'value': np.array([0, 0, 0, 1])},
+                 2: {'value': np.array([0, 0, 1, 1]) / np.sqrt(2)},
+                 4: {'value': np.array([1, 0, 0, 0])}}
+    colors = {0: {'value': np.array([1, 0, 0])},
+              2: {'value': np.array([0, 1, 0])},
+              5: {'value': np.array([0.5, 0, 1])}}
+    single = {1: {'value': np.array([1, 2, 3])}}
+
+    test_cases = [(linear_interpolator, data),
+                  (linear_interpolator, single),
+                  (step_interpolator, data),
+                  (cubic_spline_interpolator, data),
+                  (cubic_bezier_interpolator, data),
+                  (cubic_bezier_interpolator, single),
+                  (slerp, rotations),
+                  (hsv_color_interpolator, colors),
+                  (lab_color_interpolator, colors),
+                  (xyz_color_interpolator, colors)]
+    for interp_func, keyframes in test_cases:
+        interpolator = interp_func(keyframes)
+        values = interpolator(timestamps)
+        expected = np.array([interpolator(t) for t in timestamps])
+        npt.assert_equal(values.shape, expected.shape)
+        npt.assert_array_almost_equal(values, expected)
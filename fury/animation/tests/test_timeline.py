@@ -103,3 +103,82 @@ def test_timeline():
                                 transform.GetScale())
         npt.assert_almost_equal(tl.get_rotation(tl.current_timestamp),
                                 transform.GetOrientation())
+
+
+def test_timeline_bake():
+    tl = Timeline(playback_panel=False)
+    cube = actor.cube(np.array([[0, 0, 0]]))
+    tl.add_actor(cube)
+    tl.set_position(0, np.array([0, 0, 0]))
+    tl.set_position(2, np.array([3, 1, -2]))
+    tl.set_rotation(0, np.array([10, 20, 30]))
+    tl.set_rotation(2, np.array([80, -40, 170]))
+    tl.set_scale(0, np.array([1, 1, 1]))
+    tl.set_scale(2, np.array([2, 0.5, 3]))
+    tl.set_opacity(0, 1)
+    tl.set_opacity(2, 0.2)
+
+    child_tl = Timeline(playback_panel=False)
+    child_cube = actor.cube(np.array([[0, 0, 0]]))
+    child_tl.add_actor(child_cube)
+    child_tl.set_position(0, np.array([1, 0, 0]))
+    child_tl.set_position(2, np.array([0, 1, 0]))
+    tl.add_child_timeline(child_tl)
+
+    def get_matrices(t):
+        tl.update_animation(t, force=True)
+        matrices = []
+        for act in [cube, child_cube]:
+            matrix = act.GetUserTransform().GetMatrix()
+            matrices.append([[matrix.GetElement(i, j) for j in range(4)]
+                             for i in range(4)])
+        return matrices
+
+    npt.assert_equal(tl.is_baked, False)
+    for t in [0, 0.5, 1.3, 2]:
+        tl.unbake()
+        live = get_matrices(t)
+        live_opacity = cube.GetProperty().GetOpacity()
+        tl.bake(fps=10)
+        npt.assert_equal(tl.is_baked, True)
+        npt.assert_equal(child_tl.is_baked, True)
+        npt.assert_almost_equal(get_matrices(t), live)
+        npt.assert_almost_equal(cube.GetProperty().GetOpacity(),
+                                live_opacity)
+
+    # Changing a keyframe discards the baked data.
+    tl.set_position(3, np.array([0, 0, 0]))
+    npt.assert_equal(tl.is_baked, False)
+
+
+def test_timeline_skip_unchanged_values():
+    tl = Timeline(playback_panel=False)
+    cube = actor.cube(np.array([[0, 0, 0]]))
+    tl.add_actor(cube)
+    tl.set_position(0, np.array([0, 0, 0]))
+    tl.set_position(1, np.array([1, 2, 3]))
+    tl.set_opacity(0, 1)
+    tl.set_opacity(1, 0.5)
+    tl.set_color(0, np.array([1, 0, 0]))
+    tl.set_color(1, np.array([0, 0, 1]))
+    tl.set_interpolator('opacity', step_interpolator)
+    tl.set_interpolator('color', step_interpolator)
+
+    def get_mtimes():
+        colors = cube.GetMapper().GetInput().GetPointData().GetScalars()
+        return [cube.GetUserTransform().GetMTime(),
+                cube.GetProperty().GetMTime(), colors.GetMTime()]
+
+    tl.update_animation(2, force=True)
+    mtimes = get_mtimes()
+    # Past the last keyframe nothing changes anymore.
+    tl.update_animation(3, force=True)
+    npt.assert_equal(get_mtimes(), mtimes)
+
+    # Only the position changes between step keyframes.
+    tl.update_animation(0.2, force=True)
+    mtimes = get_mtimes()
+    tl.update_animation(0.4, force=True)
+    npt.assert_equal(get_mtimes()[1:], mtimes[1:])
+    npt.assert_almost_equal(cube.GetUserTransform().GetPosition(),
+                            [0.4, 0.8, 1.2])
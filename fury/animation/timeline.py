@@ -4,12 +4,22 @@ from collections import defaultdict
 from fury import utils, actor
 from fury.actor import Container
 from fury.animation.interpolator import spline_interpolator, \
-    step_interpolator, linear_interpolator, slerp
+    step_interpolator, linear_interpolator, slerp, \
+    cubic_spline_interpolator, cubic_bezier_interpolator, \
+    hsv_color_interpolator, lab_color_interpolator, xyz_color_interpolator, \
+    tan_cubic_spline_interpolator
 import numpy as np
 from scipy.spatial import transform
 from fury.ui.elements import PlaybackPanel
 from fury.lib import Actor, Transform
 
+# Interpolators that also evaluate an array of timestamps in a single call.
+BATCH_INTERPOLATORS = (spline_interpolator, cubic_spline_interpolator,
+                       step_interpolator, linear_interpolator,
+                       cubic_bezier_interpolator, slerp,
+                       hsv_color_interpolator, lab_color_interpolator,
+                       xyz_color_interpolator, tan_cubic_spline_interpolator)
+
 
 class Timeline(Container):
     """Keyframe animation timeline class.
@@ -68,6 +78,10 @@ class Timeline(Container):
         self._motion_path_actor = None
         self._parent_timeline = None
         self._transform = Transform()
+        self._baked_fps = None
+        self._baked_data = None
+        self._transform_version = 0
+        self._applied_values = {}
 
         # Handle actors while constructing the timeline.
         if playback_panel:
@@ -120,9 +134,9 @@ class Timeline(Container):
         colors = []
         if self.is_interpolatable('position'):
             ts = np.linspace(0, self.final_timestamp, res)
-            [lines.append(self.get_position(t).tolist()) for t in ts]
+            lines = self.get_values('position', ts).tolist()
             if self.is_interpolatable('color'):
-                [colors.append(self.get_color(t)) for t in ts]
+                colors = self.get_values('color', ts)
             elif len(self.items) >= 1:
                 colors = sum([i.vcolors[0] / 255 for i in self.items]) / \
                          len(self.items)
@@ -206,7 +220,7 @@ class Timeline(Container):
         out_tangent: ndarray, shape (1, M), optional
             The out tangent at that position for the cubic spline curve.
         """
-
+        self.unbake()
         attrib_data = self._get_attribute_data(attrib, is_camera=is_camera)
         keyframes = attrib_data.get('keyframes')
 
@@ -393,6 +407,7 @@ class Timeline(Container):
         >>> Timeline.set_interpolator('position', pos_fun)
         """
 
+        self.unbake()
         attrib_data = self._get_attribute_data(attrib, is_camera=is_camera)
         keyframes = attrib_data.get('keyframes', {})
         interp_data = attrib_data.get('interpolator', {})
@@ -606,6 +621,31 @@ class Timeline(Container):
             get('func')(timestamp)
         return value
 
+    def get_values(self, attrib, timestamps):
+        """Return the values of an attribute at many timestamps.
+
+        Built-in interpolators evaluate all the timestamps in a single
+        vectorized call, other interpolators and evaluators are called once
+        per timestamp.
+
+        Parameters
+        ----------
+        attrib: str
+            The attribute name.
+        timestamps: ndarray, shape (T,)
+            The timestamps to interpolate at.
+
+        Returns
+        -------
+        ndarray(T, ...):
+            The interpolated values.
+        """
+        interp_data = self._data.get(attrib, {}).get('interpolator', {})
+        func = interp_data.get('func')
+        if interp_data.get('base') in BATCH_INTERPOLATORS:
+            return np.asarray(func(np.asarray(timestamps)))
+        return np.asarray([func(t) for t in timestamps])
+
     def get_current_value(self, attrib):
         """Return the value of an attribute at current time.
 
@@ -1263,11 +1303,6 @@ class Timeline(Container):
         self.handle_scene_event(t)
 
         if self.playing or force:
-            if isinstance(self._parent_timeline, Timeline):
-                self._transform.DeepCopy(self._parent_timeline._transform)
-            else:
-                self._transform.Identity()
-
             if self._camera is not None:
                 if self.is_interpolatable('rotation', is_camera=True):
                     pos = self._camera.GetPosition()
@@ -1304,40 +1339,47 @@ class Timeline(Container):
                 return
 
             # actors properties
-            if in_scene:
-                if self.is_interpolatable('position'):
-                    position = self.get_position(t)
-                    self._transform.Translate(*position)
+            if in_scene and self.is_baked:
+                frame = self._get_baked_frame(t)
+                values = {attrib: self._baked_data[attrib][frame] for attrib
+                          in ['transform', 'opacity', 'color']
+                          if attrib in self._baked_data}
+            elif in_scene:
+                values = {attrib: self.get_value(attrib, t) for attrib
+                          in ['position', 'scale', 'opacity', 'color']
+                          if self.is_interpolatable(attrib)}
+                if self.is_interpolatable('rotation'):
+                    values['rotation'] = self.get_rotation(t)
+            else:
+                values = {}
 
-                if self.is_interpolatable('opacity'):
-                    opacity = self.get_opacity(t)
-                    [act.GetProperty().SetOpacity(opacity) for
-                     act in self.actors]
+            self._update_transform(values)
 
-                if self.is_interpolatable('rotation'):
-                    x, y, z = self.get_rotation(t)
-                    # Rotate in the same order as VTK defaults.
-                    self._transform.RotateZ(z)
-                    self._transform.RotateX(x)
-                    self._transform.RotateY(y)
-
-                if self.is_interpolatable('scale'):
-                    scale = self.get_scale(t)
-                    self._transform.Scale(*scale)
-
-                if self.is_interpolatable('color'):
-                    color = self.get_color(t)
-                    for act in self.actors:
+            if 'opacity' in values:
+                opacity = values['opacity']
+                [act.GetProperty().SetOpacity(opacity) for act in self.actors
+                 if self._is_value_changed((act, 'opacity'), opacity)]
+
+            if 'color' in values:
+                color = values['color']
+                for act in self.actors:
+                    if self._is_value_changed((act, 'color'), color):
                         act.vcolors[:] = color * 255
                         utils.update_actor(act)
 
+            if in_scene:
                 # update actors' transformation matrix
-                [act.SetUserTransform(self._transform) for act in self.actors]
+                [act.SetUserTransform(self._transform) for act in self.actors
+                 if act.GetUserTransform() is not self._transform]
 
             for attrib in self._data:
                 callbacks = self._data.get(attrib, {}).get('callbacks', [])
                 if callbacks is not [] and self.is_interpolatable(attrib):
-                    value = self.get_current_value(attrib)
+                    if self.is_baked and attrib in self._baked_data:
+                        value = self._baked_data[attrib][
+                            self._get_baked_frame(t)]
+                    else:
+                        value = self.get_current_value(attrib)
                     [cbk(value) for cbk in callbacks]
 
             # Also update all child Timelines.
@@ -1347,6 +1389,145 @@ class Timeline(Container):
             if self.parent_timeline is None and self._scene:
                 self._scene.reset_clipping_range()
 
+    def _is_value_changed(self, key, value):
+        """Store the value applied under a key and check if it changed.
+
+        Parameters
+        ----------
+        key: hashable
+            Identifier of the applied value, i.e.: (actor, attribute).
+        value: ndarray or float
+            The value about to be applied.
+
+        Returns
+        -------
+        bool
+            'True' if the value differs from the last one stored under the
+            same key.
+        """
+        last_value = self._applied_values.get(key)
+        if last_value is not None and np.array_equal(last_value, value):
+            return False
+        self._applied_values[key] = np.copy(value)
+        return True
+
+    def _update_transform(self, values):
+        """Rebuild the Timeline transform if it or its parent's changed.
+
+        Parameters
+        ----------
+        values: dict
+            The current values of the transform attributes of the Timeline.
+        """
+        parent = self._parent_timeline
+        parent_version = parent._transform_version \
+            if isinstance(parent, Timeline) else 0
+        attribs = ['transform', 'position', 'rotation', 'scale']
+        # The state holds which attributes are set along with their values.
+        state = np.concatenate([[parent_version],
+                                [attrib in values for attrib in attribs],
+                                *[np.ravel(values[attrib]) for attrib
+                                  in attribs if attrib in values]])
+        if not self._is_value_changed('transform', state):
+            return
+
+        if isinstance(parent, Timeline):
+            self._transform.DeepCopy(parent._transform)
+        else:
+            self._transform.Identity()
+
+        if 'transform' in values:
+            self._transform.Concatenate(values['transform'].ravel())
+
+        if 'position' in values:
+            self._transform.Translate(*values['position'])
+
+        if 'rotation' in values:
+            x, y, z = values['rotation']
+            # Rotate in the same order as VTK defaults.
+            self._transform.RotateZ(z)
+            self._transform.RotateX(x)
+            self._transform.RotateY(y)
+
+        if 'scale' in values:
+            self._transform.Scale(*values['scale'])
+        self._transform_version += 1
+
+    def bake(self, fps=30):
+        """Precompute the animation of the Timeline at a fixed frame rate.
+
+        All the interpolated attributes of this Timeline and its child
+        Timelines are sampled once into contiguous arrays, from 0 to the
+        final timestamp. Position, rotation and scale are combined into one
+        transformation matrix per frame. Playback then only indexes into these
+        arrays, whatever the interpolators used.
+
+        Parameters
+        ----------
+        fps: int or float, optional, default: 30
+            Number of sampled frames per second.
+
+        Notes
+        -----
+        Baked data is discarded as soon as a keyframe or an interpolator of
+        the Timeline changes. Camera animation is not baked.
+        """
+        final_t = self.update_final_timestamp()
+        n_frames = int(np.ceil(final_t * fps)) + 1
+        timestamps = np.minimum(np.arange(n_frames) / fps, final_t)
+        self._bake(timestamps, fps)
+
+    def _bake(self, timestamps, fps):
+        baked_data = {}
+        for attrib in self._data:
+            if attrib != 'in_scene' and self.is_interpolatable(attrib):
+                baked_data[attrib] = self.get_values(attrib, timestamps)
+
+        n_frames = len(timestamps)
+        matrices = np.tile(np.identity(4), (n_frames, 1, 1))
+        if 'position' in baked_data:
+            matrices[:, :3, 3] = baked_data['position']
+        if 'rotation' in baked_data:
+            rot = baked_data['rotation']
+            if rot.shape[-1] == 4:
+                rot = transform.Rotation.from_quat(rot).as_euler(
+                    'zxy', degrees=True)[:, [1, 2, 0]]
+            # Live playback passes these Euler angles to SetOrientation,
+            # which composes them as intrinsic Z, X, Y rotations. This is
+            # not the matrix of the quaternion (extrinsic z, x, y), so
+            # from_quat(rot).as_matrix() would not match it.
+            rot = transform.Rotation.from_euler('ZXY', rot[:, [2, 0, 1]],
+                                                degrees=True)
+            matrices[:, :3, :3] = rot.as_matrix()
+        if 'scale' in baked_data:
+            matrices[:, :3, :3] *= baked_data['scale'][:, np.newaxis, :]
+        baked_data['transform'] = matrices
+
+        self._baked_data = baked_data
+        self._baked_fps = fps
+        [tl._bake(timestamps, fps) for tl in self.timelines]
+
+    def unbake(self):
+        """Discard the baked animation of the Timeline and its children."""
+        self._baked_data = None
+        self._baked_fps = None
+        [tl.unbake() for tl in self.timelines]
+
+    @property
+    def is_baked(self):
+        """Return whether the Timeline animation is baked.
+
+        Returns
+        -------
+        bool
+            'True' if the Timeline is played from baked data.
+        """
+        return self._baked_data is not None
+
+    def _get_baked_frame(self, t):
+        n_frames = len(self._baked_data['transform'])
+        return min(max(int(round(t * self._baked_fps)), 0), n_frames - 1)
+
     def play(self):
         """Play the animation"""
         if not self.playing:
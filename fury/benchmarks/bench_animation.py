@@ -0,0 +1,69 @@
+"""Benchmarks for the animation module.
+
+Run this benchmark with::
+
+    python -m fury.benchmarks.bench_animation
+
+"""
+import numpy as np
+from numpy.testing import measure
+
+from fury.animation.interpolator import (linear_interpolator,
+                                         cubic_bezier_interpolator,
+                                         cubic_spline_interpolator)
+
+
+def _keyframes(n_keyframes, rng):
+    timestamps = np.linspace(0, n_keyframes, n_keyframes)
+    return {t: {'value': rng.random(3)} for t in timestamps}
+
+
+def _play(interpolator, duration, n_frames):
+    for t in np.linspace(0, duration, n_frames):
+        interpolator(t)
+
+
+def _bake(interpolator, timestamps):
+    return np.array([interpolator(t) for t in timestamps])
+
+
+def bench_interpolators(n_keyframes=(10, 100, 1000, 10_000), n_frames=20_000):
+    rng = np.random.default_rng(42)
+    interpolators = {'linear': linear_interpolator,
+                     'cubic_bezier': cubic_bezier_interpolator,
+                     'cubic_spline': cubic_spline_interpolator}
+
+    print()
+    print('Per-frame interpolation cost (us) over %d frames' % n_frames)
+    print('%10s' % 'keyframes' +
+          ''.join('%14s' % name for name in interpolators))
+    for n in n_keyframes:
+        keyframes = _keyframes(n, rng)
+        row = '%10d' % n
+        for name, interp in interpolators.items():
+            interpolator = interp(keyframes)  # noqa: F841
+            elapsed = measure('_play(interpolator, n, n_frames)')
+            row += '%14.2f' % (elapsed / n_frames * 1e6)
+        print(row)
+
+
+def bench_batch_interpolation(n_frames=10_000, n_keyframes=100):
+    rng = np.random.default_rng(42)
+    keyframes = _keyframes(n_keyframes, rng)
+    timestamps = np.linspace(0, n_keyframes, n_frames)  # noqa: F841
+
+    print()
+    print('Baking %d frames of %d keyframes (s)' % (n_frames, n_keyframes))
+    print('%14s %12s %12s' % ('interpolator', 'loop', 'batch'))
+    for name, interp in [('linear', linear_interpolator),
+                         ('cubic_bezier', cubic_bezier_interpolator),
+                         ('cubic_spline', cubic_spline_interpolator)]:
+        interpolator = interp(keyframes)  # noqa: F841
+        loop_time = measure('_bake(interpolator, timestamps)')
+        batch_time = measure('interpolator(timestamps)', 10) / 10
+        print('%14s %12.4f %12.4f' % (name, loop_time, batch_time))
+
+
+if __name__ == '__main__':
+    bench_interpolators()
+    bench_batch_interpolation()
@@ -0,0 +1,41 @@
+"""Benchmarks for the glTF loader.
+
+Run this benchmark with::
+
+    python -m fury.benchmarks.bench_gltf
+
+"""
+import os
+from tempfile import TemporaryDirectory
+
+import numpy as np
+from numpy.testing import measure
+
+from fury import actor, window
+from fury.gltf import glTF, export_scene  # noqa: F401
+
+
+def _export_boxes(fname, n_actors, n_boxes):
+    rng = np.random.default_rng(42)
+    scene = window.Scene()
+    for _ in range(n_actors):
+        centers = rng.random((n_boxes, 3)) * 100
+        scene.add(actor.box(centers, colors=rng.random(3)))
+    export_scene(scene, fname)
+
+
+def bench_load_gltf(n_actors=(50, 200, 500), n_boxes=100, repeat=3):
+    print()
+    print('Loading a glTF file with one mesh per actor (s)')
+    print('%10s%14s%14s' % ('actors', 'buffer (MB)', 'load'))
+    with TemporaryDirectory() as tdir:
+        fname = os.path.join(tdir, 'bench.gltf')  # noqa: F841
+        for n in n_actors:
+            _export_boxes(fname, n, n_boxes)
+            size = os.path.getsize(os.path.join(tdir, 'bench.bin')) / 2**20
+            elapsed = measure('glTF(fname)', repeat) / repeat
+            print('%10d%14.1f%14.3f' % (n, size, elapsed))
+
+
+if __name__ == '__main__':
+    bench_load_gltf()
@@ -0,0 +1,117 @@
+"""Benchmarks for the creation of line polydata.
+
+Run this benchmark with::
+
+    python -m fury.benchmarks.bench_lines
+
+"""
+import numpy as np
+from numpy.testing import measure
+
+from fury import actor, utils
+from fury.colormap import line_colors
+from fury.optpkg import optional_package
+
+nib, have_nibabel, _ = optional_package('nibabel')
+
+
+def _make_lines(n_lines, n_points=10, seed=42):
+    rng = np.random.default_rng(seed)
+    points = rng.random((n_lines * n_points, 3))
+    return np.split(points, np.arange(n_points, len(points), n_points))
+
+
+def _line_colors_loop(lines, colors):
+    """Reference per-line implementation of the color expansion step."""
+    nb_lines = len(lines)
+    lines_range = range(nb_lines)
+    points_per_line = np.array([len(lines[i]) for i in lines_range],
+                               np.intp)
+    if colors is None:
+        cols_arr = line_colors(lines)
+        colors_mapper = np.repeat(lines_range, points_per_line, axis=0)
+        return utils.numpy_to_vtk_colors(255 * cols_arr[colors_mapper])
+    cols_arr = np.asarray(colors)
+    if cols_arr.ndim == 2:
+        colors_mapper = np.repeat(lines_range, points_per_line, axis=0)
+        return utils.numpy_to_vtk_colors(255 * cols_arr[colors_mapper])
+    if len(cols_arr) == nb_lines:
+        cols_arrx = []
+        for (i, value) in enumerate(colors):
+            cols_arrx += lines[i].shape[0] * [value]
+        return utils.numpy_support.numpy_to_vtk(np.array(cols_arrx),
+                                                deep=True)
+    return utils.numpy_to_vtk_colors(
+        np.tile(255 * cols_arr, (int(points_per_line.sum()), 1)))
+
+
+def bench_lines_to_vtk_polydata(n_lines=(100_000, 1_000_000), repeat=1,
+                                loop_limit=100_000):
+    rng = np.random.default_rng(42)
+
+    print()
+    print('lines_to_vtk_polydata color modes (10 points per line)')
+    print('%10s %18s %12s %16s %12s' % ('lines', 'colors', 'loop (s)',
+                                        'vectorized (s)', 'total (s)'))
+    for n in n_lines:
+        lines = _make_lines(n)
+        points = np.vstack(lines)  # noqa: F841
+        modes = [('orientation', None),
+                 ('rgb per line', rng.random((n, 3))),
+                 ('scalar per line', rng.random(n)),
+                 ('single color', (1, 0.5, 0))]
+        for name, colors in modes:
+            if n <= loop_limit:
+                loop_time = measure('_line_colors_loop(lines, colors)',
+                                    repeat)
+                loop_time = '%12.3f' % (loop_time / repeat)
+            else:
+                loop_time = '%12s' % 'skipped'
+            vectorized_time = measure('utils._lines_to_vtk_colors(lines, '
+                                      'points, colors)', repeat)
+            total_time = measure('utils.lines_to_vtk_polydata(lines, colors)',
+                                 repeat)
+            print('%10d %18s %s %16.3f %12.3f' % (n, name, loop_time,
+                                                  vectorized_time / repeat,
+                                                  total_time / repeat))
+
+
+def bench_array_sequence_to_polydata(n_lines=(100_000, 1_000_000),
+                                     repeat=1):
+    if not have_nibabel:
+        print('nibabel is required for the ArraySequence benchmark')
+        return
+
+    print()
+    print('lines_to_vtk_polydata input type (10 points per line)')
+    print('%10s %12s %16s' % ('lines', 'list (s)', 'ArraySequence (s)'))
+    for n in n_lines:
+        lines = _make_lines(n)
+        seq = nib.streamlines.ArraySequence(lines)  # noqa: F841
+        list_time = measure('utils.lines_to_vtk_polydata(lines)',
+                            repeat)
+        seq_time = measure('utils.lines_to_vtk_polydata(seq)', repeat)
+        print('%10d %12.3f %16.3f' % (n, list_time / repeat,
+                                      seq_time / repeat))
+
+
+def bench_lod_line(n_lines=(100_000, 1_000_000), repeat=1):
+    print()
+    print('lod_line levels of detail (10 points per line)')
+    print('%10s %12s %14s %s' % ('lines', 'line (s)', 'lod_line (s)',
+                                 'points per level'))
+    for n in n_lines:
+        lines = _make_lines(n)
+        line_time = measure('actor.line(lines, lod=False)', repeat)
+        lod_time = measure('actor.lod_line(lines)', repeat)
+        lod_actor = actor.lod_line(lines)
+        nb_points = [m.GetInput().GetNumberOfPoints()
+                     for m in lod_actor.level_mappers]
+        print('%10d %12.3f %14.3f %s' % (n, line_time / repeat,
+                                         lod_time / repeat, nb_points))
+
+
+if __name__ == '__main__':
+    bench_lines_to_vtk_polydata(loop_limit=1_000_000)
+    bench_array_sequence_to_polydata()
+    bench_lod_line()
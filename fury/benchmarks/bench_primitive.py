@@ -0,0 +1,75 @@
+"""Benchmarks for the primitive module.
+
+Run this benchmark with::
+
+    python -m fury.benchmarks.bench_primitive
+
+"""
+import numpy as np
+from numpy.testing import measure
+
+import fury.primitive as fp
+
+
+def _rotate_loop(vertices, directions, unit_verts_size):
+    """Reference per-glyph implementation of the orientation step."""
+    for pts, dirs in enumerate(directions):
+        dir_abs = np.linalg.norm(dirs)
+        if dir_abs:
+            normal = np.array([1., 0., 0.])
+            dirs = dirs / dir_abs
+            v = np.cross(normal, dirs)
+            c = np.dot(normal, dirs)
+            v1, v2, v3 = v
+            h = 1 / (1 + c)
+            vmat = np.array([[0, -v3, v2],
+                             [v3, 0, -v1],
+                             [-v2, v1, 0]])
+            rotation_matrix = np.eye(3) + vmat + (vmat.dot(vmat) * h)
+        else:
+            rotation_matrix = np.identity(3)
+        sl = slice(pts * unit_verts_size, (pts + 1) * unit_verts_size)
+        vertices[sl] = np.dot(rotation_matrix, vertices[sl].T).T
+    return vertices
+
+
+def _rotate_batched(vertices, directions, unit_verts_size):
+    """Batched implementation used by ``fury.primitive.repeat_primitive``."""
+    rotation_matrices = fp._rotation_matrices_from_directions(directions)
+    unit_vertices = vertices.reshape((len(directions), unit_verts_size, 3))
+    vertices[:] = np.einsum('nij,nkj->nki', rotation_matrices,
+                            unit_vertices).reshape((-1, 3))
+    return vertices
+
+
+def bench_repeat_primitive(n_centers=(10_000, 100_000, 1_000_000), repeat=1,
+                           loop_limit=100_000):
+    rng = np.random.default_rng(42)
+    verts, faces = fp.prim_box()
+    unit_verts_size = verts.shape[0]  # noqa: F841
+
+    print()
+    print('repeat_primitive orientation step (box glyphs)')
+    print('%10s %12s %12s %12s' % ('centers', 'loop (s)', 'batched (s)',
+                                   'total (s)'))
+    for n in n_centers:
+        centers = rng.random((n, 3))  # noqa: F841
+        directions = rng.random((n, 3)) - 0.5  # noqa: F841
+        big_verts = np.tile(verts, (n, 1)).astype(float)  # noqa: F841
+
+        if n <= loop_limit:
+            loop_time = measure('_rotate_loop(big_verts.copy(), directions, '
+                                'unit_verts_size)', repeat)
+            loop_time = '%12.3f' % (loop_time / repeat)
+        else:
+            loop_time = '%12s' % 'skipped'
+        batched_time = measure('_rotate_batched(big_verts.copy(), '
+                               'directions, unit_verts_size)', repeat)
+        total_time = measure('fp.repeat_primitive(verts, faces, centers, '
+                             'directions=directions)', repeat)
+        print('%10d %s %12.3f %12.3f' % (n, loop_time, batched_time / repeat,
+                                         total_time / repeat))
+
+
+if __name__ == '__main__':
+    bench_repeat_primitive(loop_limit=1_000_000)
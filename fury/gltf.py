@@ -3,6 +3,7 @@ import base64
 import os
 import numpy as np
 import copy
+from concurrent.futures import ThreadPoolExecutor
 import pygltflib as gltflib
 from pygltflib.utils import glb2gltf, gltf2glb
 from PIL import Image
@@ -33,7 +34,8 @@ acc_type = {
 
 class glTF:
 
-    def __init__(self, filename, apply_normals=False):
+    def __init__(self, filename, apply_normals=False, max_workers=1,
+                 lazy=False):
         """Read and generate actors from glTF files.
 
         Parameters
@@ -42,6 +44,16 @@ class glTF:
             Path of the gltf file
         apply_normals : bool, optional
             If `True` applies normals to the mesh.
+        max_workers : int, optional
+            Number of threads decoding the textures in the background while
+            the meshes are loaded. With 1, textures are decoded one after
+            the other when their material is loaded.
+        lazy : bool, optional
+            If `True`, meshes and materials are only loaded on the first call
+            of `actors`. With `max_workers` > 1, the actors are also returned
+            before their textures are decoded: call `update_textures` to
+            attach the textures decoded since then. With `max_workers` = 1,
+            the textures are decoded in `actors`.
 
         """
         if filename in ['', None]:
@@ -59,6 +71,7 @@ class glTF:
 
         self.pwd = os.path.dirname(filename)
         self.apply_normals = apply_normals
+        self.lazy = lazy
 
         self.cameras = {}
         self.materials = []
@@ -69,6 +82,7 @@ class glTF:
         self.node_transform = []
         self.animation_channels = {}
         self.sampler_matrices = {}
+        self._buffers = {}
 
         # Skinning Informations
         self.bone_tranforms = {}
@@ -88,9 +102,30 @@ class glTF:
         self.morph_vertices = []
         self.morph_weights = []
 
-        self.inspect_scene(0)
         self._actors = []
         self._bactors = {}
+        # (actor, material) pairs, to attach textures decoded later.
+        self._actor_materials = []
+
+        # Textures decoded in the background, by texture index.
+        self._textures = {}
+        self._pending_textures = []
+        self._executor = None
+        if max_workers > 1:
+            self._executor = ThreadPoolExecutor(max_workers=max_workers)
+            for material in self.gltf.materials:
+                pbr = material.pbrMetallicRoughness
+                bct = pbr.baseColorTexture if pbr is not None else None
+                if bct is not None and bct.index not in self._textures:
+                    self._textures[bct.index] = self._executor.submit(
+                        self.read_texture, bct.index)
+            self._shutdown_when_decoded()
+
+        self._scene_loaded = False
+        if not lazy:
+            self.inspect_scene(0)
+            self._scene_loaded = True
+            self.update_textures()
 
     def actors(self):
         """Generate actors from glTF file.
@@ -101,6 +136,10 @@ class glTF:
             List of vtkActors with texture.
 
         """
+        if not self._scene_loaded:
+            self.inspect_scene(0)
+            self._scene_loaded = True
+
         for i, polydata in enumerate(self.polydatas):
             actor = utils.get_actor_from_polydata(polydata)
             transform_mat = self.transformations[i]
@@ -114,14 +153,59 @@ class glTF:
 
             if self.materials[i] is not None:
                 base_col_tex = self.materials[i]['baseColorTexture']
-                actor.SetTexture(base_col_tex)
+                if base_col_tex is not None:
+                    actor.SetTexture(base_col_tex)
                 base_color = self.materials[i]['baseColor']
                 actor.GetProperty().SetColor(tuple(base_color[:3]))
+                self._actor_materials.append((actor, self.materials[i]))
 
             self._actors.append(actor)
 
+        if self._pending_textures:
+            self.update_textures()
         return self._actors
 
+    def update_textures(self):
+        """Attach the textures decoded in the background to their actors.
+
+        Returns
+        -------
+        pending : int
+            Number of textures that are still being decoded.
+
+        """
+        pending = []
+        for material, tex_id in self._pending_textures:
+            if self._textures[tex_id].done():
+                material['baseColorTexture'] = self.get_texture(tex_id)
+            else:
+                pending.append((material, tex_id))
+        self._pending_textures = pending
+
+        for act, material in self._actor_materials:
+            if act.GetTexture() is None and \
+                    material['baseColorTexture'] is not None:
+                act.SetTexture(material['baseColorTexture'])
+
+        return len(pending)
+
+    def _shutdown_when_decoded(self):
+        """Release the decoding threads once every texture is decoded,
+        even if `update_textures` is never called."""
+        executor = self._executor
+        futures = list(self._textures.values())
+
+        def shutdown(_future=None):
+            # callbacks run in the decoding threads, the last one to
+            # finish sees every texture done
+            if all(future.done() for future in futures):
+                executor.shutdown(wait=False)
+
+        if not futures:
+            shutdown()
+        for future in futures:
+            future.add_done_callback(shutdown)
+
     def inspect_scene(self, scene_id=0):
         """Loop over nodes in a scene.
 
@@ -339,9 +423,6 @@ class glTF:
             Numpy array of size byte_length from buffer.
 
         """
-        buffer = self.gltf.buffers[buff_id]
-        uri = buffer.uri
-
         if d_type == np.short or d_type == np.ushort or \
                 d_type == np.uint16:
             byte_length = int(byte_length/2)
@@ -352,15 +433,7 @@ class glTF:
             byte_stride = int(byte_stride/4)
 
         try:
-            if uri.startswith('data:application/octet-stream;base64') or \
-                    uri.startswith('data:application/gltf-buffer;base64'):
-                buff_data = uri.split(',')[1]
-                buff_data = base64.b64decode(buff_data)
-
-            elif uri.endswith('.bin'):
-                with open(os.path.join(self.pwd, uri), 'rb') as f:
-                    buff_data = f.read(-1)
-
+            buff_data = self.get_buffer(buff_id)
             out_arr = np.frombuffer(buff_data, dtype=d_type,
                                     count=byte_length, offset=byte_offset)
 
@@ -370,6 +443,41 @@ class glTF:
         except IOError as e:
             print(f'Failed to read ! Error in opening file:')
 
+    def get_buffer(self, buff_id):
+        """Return the content of a buffer, decoding or mapping it only once.
+
+        Base64 data URIs are decoded on first access. External `.bin` files
+        are memory-mapped, so the arrays extracted from them are views on
+        the file and only the pages actually accessed are read.
+
+        Parameters
+        ----------
+        buff_id : int
+            Buffer Index
+
+        Returns
+        -------
+        buff_data : bytes or ndarray
+            Content of the buffer.
+
+        """
+        if buff_id in self._buffers:
+            return self._buffers[buff_id]
+
+        uri = self.gltf.buffers[buff_id].uri
+        buff_data = None
+        if uri.startswith('data:application/octet-stream;base64') or \
+                uri.startswith('data:application/gltf-buffer;base64'):
+            buff_data = uri.split(',')[1]
+            buff_data = base64.b64decode(buff_data)
+
+        elif uri.endswith('.bin'):
+            buff_data = np.memmap(os.path.join(self.pwd, uri), dtype=np.uint8,
+                                  mode='r')
+
+        self._buffers[buff_id] = buff_data
+        return buff_data
+
     def get_materials(self, mat_id):
         """Get the materials data.
 
@@ -388,13 +496,18 @@ class glTF:
         bct = None
 
         pbr = material.pbrMetallicRoughness
+        colors = pbr.baseColorFactor
+        materials = {'baseColorTexture': bct,
+                     'baseColor': colors}
 
         if pbr.baseColorTexture is not None:
-            bct = pbr.baseColorTexture.index
-            bct = self.get_texture(bct)
-        colors = pbr.baseColorFactor
-        return {'baseColorTexture': bct,
-                'baseColor': colors}
+            tex_id = pbr.baseColorTexture.index
+            if self.lazy and tex_id in self._textures and \
+                    not self._textures[tex_id].done():
+                self._pending_textures.append((materials, tex_id))
+            else:
+                materials['baseColorTexture'] = self.get_texture(tex_id)
+        return materials
 
     def get_texture(self, tex_id):
         """Read and convert image into vtk texture.
@@ -409,6 +522,33 @@ class glTF:
         atexture : Texture
             Returns flipped vtk texture from image.
 
+        """
+        if tex_id in self._textures:
+            rgb = self._textures[tex_id].result()
+        else:
+            rgb = self.read_texture(tex_id)
+
+        grid = utils.rgb_to_vtk(rgb)
+        atexture = Texture()
+        atexture.InterpolateOn()
+        atexture.EdgeClampOn()
+        atexture.SetInputDataObject(grid)
+
+        return atexture
+
+    def read_texture(self, tex_id):
+        """Read and decode the image of a texture.
+
+        Parameters
+        ----------
+        tex_id : int
+            Texture index
+
+        Returns
+        -------
+        rgb : ndarray
+            Decoded image.
+
         """
         texture = self.gltf.textures[tex_id].source
         image = self.gltf.images[texture]
@@ -423,7 +563,8 @@ class glTF:
             buff_data = base64.b64decode(buff_data)
 
             extension = '.png' if file.startswith('data:image/png') else '.jpg'
-            image_path = os.path.join(self.pwd, str("b64texture"+extension))
+            image_path = os.path.join(self.pwd,
+                                      f'b64texture{tex_id}{extension}')
             with open(image_path, "wb") as image_file:
                 image_file.write(buff_data)
 
@@ -432,26 +573,17 @@ class glTF:
             buffer = bv.buffer
             bo = bv.byteOffset
             bl = bv.byteLength
-            uri = self.gltf.buffers[buffer].uri
-            with open(os.path.join(self.pwd, uri), 'rb') as f:
-                f.seek(bo)
-                img_binary = f.read(bl)
+            img_binary = bytes(self.get_buffer(buffer)[bo:bo + bl])
             extension = '.png' if mimetype == 'images/png' else '.jpg'
-            image_path = os.path.join(self.pwd, str("bvtexture"+extension))
+            image_path = os.path.join(self.pwd,
+                                      f'bvtexture{tex_id}{extension}')
             with open(image_path, "wb") as image_file:
                 image_file.write(img_binary)
 
         else:
             image_path = os.path.join(self.pwd, file)
 
-        rgb = io.load_image(image_path)
-        grid = utils.rgb_to_vtk(rgb)
-        atexture = Texture()
-        atexture.InterpolateOn()
-        atexture.EdgeClampOn()
-        atexture.SetInputDataObject(grid)
-
-        return atexture
+        return io.load_image(image_path)
 
     def load_camera(self, camera_id, transform_mat):
         """Load the camera data of a node.
@@ -738,37 +870,39 @@ class glTF:
     def apply_skin_matrix(self, vertices, joint_matrices, actor_index=0):
         """Apply the skinnig matrix, that transform the vertices.
 
+        The joint matrices of every vertex are gathered at once and blended
+        with the vertex weights, so all the vertices are skinned in a single
+        batched operation.
+
         Parameters
         ----------
         vertices : ndarray
             Vertices of an actor.
-        join_matrices : list
-            List  of skinning matrix to calculate the weighted transformation.
+        join_matrices : dict
+            Skinning matrix of each bone, used to calculate the weighted
+            transformation.
+        actor_index : int, optional
+            Index of the actor whose joints and weights are used.
+            (default=0)
 
         Returns
         -------
         vertices : ndarray
             Modified vertices.
         """
-        clone = np.copy(vertices)
-        weights = self.weights_0[actor_index]
-        joints = self.joints_0[actor_index]
-
-        for i, xyz in enumerate(clone):
-            a_joint = joints[i]
-            a_joint = [self.bones[i] for i in a_joint]
-            a_weight = weights[i]
-
-            skin_mat = \
-                np.multiply(a_weight[0], joint_matrices[a_joint[0]]) +\
-                np.multiply(a_weight[1], joint_matrices[a_joint[1]]) +\
-                np.multiply(a_weight[2], joint_matrices[a_joint[2]]) +\
-                np.multiply(a_weight[3], joint_matrices[a_joint[3]])
-
-            xyz = np.dot(skin_mat, np.append(xyz, [1.0]))
-            clone[i] = xyz[:3]
-
-        return clone
+        weights = np.asarray(self.weights_0[actor_index])
+        joints = np.asarray(self.joints_0[actor_index]).astype(int)
+
+        identity = np.identity(4)
+        bone_matrices = np.array([joint_matrices.get(bone, identity)
+                                  for bone in self.bones])
+        homogeneous = np.ones((len(vertices), 4))
+        homogeneous[:, :3] = vertices
+
+        skinned = np.einsum('nj,njab,nb->na', weights,
+                            bone_matrices[joints], homogeneous,
+                            optimize=True)
+        return skinned[:, :3].astype(vertices.dtype)
 
     def transverse_bones(self, bone_id, channel_name,
                          parent_timeline: Timeline):
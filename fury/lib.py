@@ -35,6 +35,7 @@ VTK_VERSION = ccvtk.vtkVersion.GetVTKVersion()
 ##############################################################
 #  vtkCommonCore Module
 Command = ccvtk.vtkCommand
+Math = ccvtk.vtkMath
 LookupTable = ccvtk.vtkLookupTable
 Points = ccvtk.vtkPoints
 IdTypeArray = ccvtk.vtkIdTypeArray
@@ -80,6 +81,7 @@ HardwareSelector = rcvtk.vtkHardwareSelector
 ImageActor = rcvtk.vtkImageActor
 PolyDataMapper = rcvtk.vtkPolyDataMapper
 PolyDataMapper2D = rcvtk.vtkPolyDataMapper2D
+Glyph3DMapper = rcvtk.vtkGlyph3DMapper
 Assembly = rcvtk.vtkAssembly
 DataSetMapper = rcvtk.vtkDataSetMapper
 Texture = rcvtk.vtkTexture
@@ -93,6 +93,47 @@ def repeat_primitive_function(func, centers, func_args=[],
                             scales=scales, have_tiled_verts=True)
 
 
+def _rotation_matrices_from_directions(directions):
+    """Compute the rotation matrices aligning the x-axis to each direction.
+
+    Parameters
+    ----------
+    directions : ndarray, shape (N, 3)
+        Orientation vectors. Null vectors give the identity matrix.
+
+    Returns
+    -------
+    rotation_matrices : ndarray, shape (N, 3, 3)
+
+    """
+    directions = np.asarray(directions, dtype=np.float64).reshape((-1, 3))
+    rotation_matrices = np.zeros((directions.shape[0], 3, 3))
+    rotation_matrices[:] = np.identity(3)
+
+    dir_abs = np.linalg.norm(directions, axis=1)
+    valid = dir_abs != 0
+    if not np.any(valid):
+        return rotation_matrices
+
+    # Rodrigues' formula: R = I + [v]x + [v]x^2 / (1 + c), with v = x ^ d
+    # and c = x . d, for the normal vector x = (1, 0, 0) of the object.
+    dirs = directions[valid] / dir_abs[valid, None]
+    v1 = np.zeros(dirs.shape[0])
+    v2 = -dirs[:, 2]
+    v3 = dirs[:, 1]
+    h = 1 / (1 + dirs[:, 0])
+    vmat = np.zeros((dirs.shape[0], 3, 3))
+    vmat[:, 0, 1] = -v3
+    vmat[:, 0, 2] = v2
+    vmat[:, 1, 0] = v3
+    vmat[:, 1, 2] = -v1
+    vmat[:, 2, 0] = -v2
+    vmat[:, 2, 1] = v1
+    rotation_matrices[valid] += vmat + \
+        np.matmul(vmat, vmat) * h[:, None, None]
+    return rotation_matrices
+
+
 def repeat_primitive(vertices, faces, centers, directions=None,
                      colors=(1, 0, 0), scales=1, have_tiled_verts=False):
     """Repeat Vertices and triangles of a specific primitive shape.
@@ -181,28 +222,12 @@ def repeat_primitive(vertices, faces, centers, directions=None,
 
     # update orientations
     directions = normalize_input(directions, 'directions')
-    for pts, dirs in enumerate(directions):
-        # Normal vector of the object.
-        dir_abs = np.linalg.norm(dirs)
-        if dir_abs:
-            normal = np.array([1., 0., 0.])
-            dirs = dirs / dir_abs
-            v = np.cross(normal, dirs)
-            c = np.dot(normal, dirs)
-            v1, v2, v3 = v
-            h = 1 / (1 + c)
-            Vmat = np.array([[0, -v3, v2],
-                             [v3, 0, -v1],
-                             [-v2, v1, 0]])
-
-            rotation_matrix = np.eye(3, dtype=np.float64) + Vmat + (Vmat.dot(Vmat) * h)
-        else:
-            rotation_matrix = np.identity(3)
-
-        big_vertices[pts * unit_verts_size: (pts + 1) * unit_verts_size] = \
-            np.dot(rotation_matrix[:3, :3],
-                   big_vertices[pts * unit_verts_size:
-                                (pts + 1) * unit_verts_size].T).T
+    if directions.size:
+        rotation_matrices = _rotation_matrices_from_directions(directions)
+        unit_vertices = big_vertices.reshape((centers.shape[0],
+                                              unit_verts_size, 3))
+        big_vertices[:] = np.einsum('nij,nkj->nki', rotation_matrices,
+                                    unit_vertices).reshape((-1, 3))
 
     # apply centers position
     big_centers = np.repeat(centers, unit_verts_size, axis=0)
@@ -0,0 +1,71 @@
+/* Tube impostor fragment shader declaration */
+
+flat in vec3 tubeStartGSOutput;
+flat in vec3 tubeEndGSOutput;
+flat in vec2 tubeRadiiGSOutput;
+flat in vec4 tubeClipZGSOutput;
+flat in vec4 tubeClipWGSOutput;
+in vec3 tubePointVCGSOutput;
+
+uniform float tubeSpecular;
+uniform float tubeSpecularPower;
+uniform vec3 tubeSpecularColor;
+
+/*
+ * Intersection of a ray with a rounded cone, i.e. the convex hull of two
+ * spheres of radii ra and rb centered at pa and pb.
+ * Returns the distance along the normalized ray direction rd and the normal
+ * at the hit point, or a negative distance when the ray misses.
+ * See https://iquilezles.org/articles/intersectors
+ */
+vec4 roundedConeIntersect(vec3 ro, vec3 rd, vec3 pa, vec3 pb, float ra,
+                          float rb)
+{
+    vec3 ba = pb - pa;
+    vec3 oa = ro - pa;
+    vec3 ob = ro - pb;
+    float rr = ra - rb;
+    float m0 = dot(ba, ba);
+    float m1 = dot(ba, oa);
+    float m2 = dot(ba, rd);
+    float m3 = dot(rd, oa);
+    float m5 = dot(oa, oa);
+    float m6 = dot(ob, rd);
+    float m7 = dot(ob, ob);
+
+    // body, absent when one sphere contains the other
+    float d2 = m0 - rr * rr;
+    float t;
+    if (d2 > 0.0)
+    {
+        float k2 = d2 - m2 * m2;
+        float k1 = d2 * m3 - m1 * m2 + m2 * rr * ra;
+        float k0 = d2 * m5 - m1 * m1 + m1 * rr * ra * 2.0 - m0 * ra * ra;
+        float h = k1 * k1 - k0 * k2;
+        if (h < 0.0)
+            return vec4(-1.0);
+        t = (-sqrt(h) - k1) / k2;
+        float y = m1 - ra * rr + t * m2;
+        if (y > 0.0 && y < d2)
+            return vec4(t, normalize(d2 * (oa + t * rd) - ba * y));
+    }
+
+    // caps
+    float h1 = m3 * m3 - m5 + ra * ra;
+    float h2 = m6 * m6 - m7 + rb * rb;
+    if (max(h1, h2) < 0.0)
+        return vec4(-1.0);
+    vec4 r = vec4(1e20);
+    if (h1 > 0.0)
+    {
+        t = -m3 - sqrt(h1);
+        r = vec4(t, (oa + t * rd) / ra);
+    }
+    if (h2 > 0.0)
+    {
+        t = -m6 - sqrt(h2);
+        if (t < r.x)
+            r = vec4(t, (ob + t * rd) / rb);
+    }
+    return r;
+}
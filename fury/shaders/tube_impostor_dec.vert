@@ -0,0 +1,6 @@
+/* Tube impostor vertex shader declaration */
+
+in float radius;
+
+out vec4 tubePointMCVSOutput;
+out float tubeRadiusVSOutput;
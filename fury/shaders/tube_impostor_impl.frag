@@ -0,0 +1,39 @@
+/* Tube impostor fragment shader implementation */
+
+// the projection is parallel when it keeps w constant
+bool parallel = tubeClipWGSOutput.z == 0.0;
+
+// view ray through this fragment of the bounding box, starting at the camera
+// or, for parallel projections, in front of the box
+vec3 rayDir = parallel ? vec3(0.0, 0.0, -1.0) :
+                         normalize(tubePointVCGSOutput);
+vec3 rayOrigin = vec3(0.0);
+if (parallel)
+{
+    float boxSize = distance(tubeStartGSOutput, tubeEndGSOutput) +
+                    4.0 * max(tubeRadiiGSOutput.x, tubeRadiiGSOutput.y);
+    rayOrigin = tubePointVCGSOutput - boxSize * rayDir;
+}
+
+vec4 hit = roundedConeIntersect(rayOrigin, rayDir, tubeStartGSOutput,
+                                tubeEndGSOutput, tubeRadiiGSOutput.x,
+                                tubeRadiiGSOutput.y);
+if (hit.x < 0.0)
+{
+    discard;
+}
+
+vec4 hitVC = vec4(rayOrigin + hit.x * rayDir, 1.0);
+vec3 normal = normalize(hit.yzw);
+
+// depth of the tube surface instead of the bounding box
+float depth = dot(tubeClipZGSOutput, hitVC) / dot(tubeClipWGSOutput, hitVC);
+gl_FragDepth = ((gl_DepthRange.far - gl_DepthRange.near) * depth +
+                gl_DepthRange.near + gl_DepthRange.far) / 2.0;
+
+// headlight shading, the light comes from the camera
+vec3 color = blinnPhongIllumModel(dot(-rayDir, normal), vec3(1.0),
+                                  diffuseColor, tubeSpecularPower,
+                                  tubeSpecular * tubeSpecularColor,
+                                  ambientColor);
+fragOutput0 = vec4(color, opacity);
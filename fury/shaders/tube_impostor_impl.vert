@@ -0,0 +1,4 @@
+/* Tube impostor vertex shader implementation */
+
+tubePointMCVSOutput = vertexMC;
+tubeRadiusVSOutput = radius;
@@ -3,12 +3,12 @@ from functools import partial
 import time
 import platform
 
-import vtk
 import numpy as np
+from fury.lib import numpy_support, Camera, VTK_UNSIGNED_CHAR
 from fury.stream.tools import ArrayCircularQueue, SharedMemCircularQueue
 from fury.stream.tools import (
     RawArrayImageBufferManager, SharedMemImageBufferManager)
-from fury.stream.tools import IntervalTimer
+from fury.stream.tools import IntervalTimer, StreamMetrics
 from fury.stream.tools import IntervalTimerThreading
 from fury.stream.constants import _CQUEUE, PY_VERSION_8
 
@@ -17,6 +17,11 @@ def callback_stream_client(stream_client):
     """This callback is used to update the image inside of
     the ImageManager instance
 
+    The pixels of the window are read straight into the next buffer
+    of the ImageManager, without intermediate copies. When the capture
+    is driven by a timer, the window is rendered first, so changes made
+    to the scene since the last render are captured.
+
     Parameters
     ----------
     stream_client : StreamClient
@@ -25,18 +30,36 @@ def callback_stream_client(stream_client):
     if stream_client.in_request:
         return
     stream_client.in_request = True
-    stream_client.window2image_filter.Update()
-    stream_client.window2image_filter.Modified()
-    vtk_image = stream_client.window2image_filter.GetOutput()
-    vtk_array = vtk_image.GetPointData().GetScalars()
-
-    w, h, _ = vtk_image.GetDimensions()
-    np_arr = np.frombuffer(vtk_array, dtype='uint8')
-    if np_arr is None:
+    start = time.perf_counter()
+    img_manager = stream_client.img_manager
+    window = stream_client.showm.window
+    w, h = window.GetSize()
+    buffer = img_manager.get_next_buffer(w, h)
+    if buffer is None:
+        # the window is bigger than the buffers, write_into shows
+        # a warning image instead
+        img_manager.write_into(w, h, None)
         stream_client.in_request = False
         return
 
-    stream_client.img_manager.write_into(w, h, np_arr)
+    key = (img_manager.next_buffer_index, w, h)
+    if key not in stream_client.pixel_arrays:
+        if stream_client.pixel_arrays and \
+                next(iter(stream_client.pixel_arrays))[1:] != (w, h):
+            # the window was resized
+            stream_client.pixel_arrays.clear()
+        stream_client.pixel_arrays[key] = numpy_support.numpy_to_vtk(
+            buffer.reshape(-1, 3), deep=False,
+            array_type=VTK_UNSIGNED_CHAR)
+    if stream_client.render_before_capture:
+        window.Render()
+    window.GetPixelData(
+        0, 0, w - 1, h - 1, 1, stream_client.pixel_arrays[key], 0)
+    # OpenGL returns the rows bottom-up
+    img_manager.swap_buffers(w, h, bottom_up=True)
+    stream_client.metrics.increment('frames_captured')
+    stream_client.metrics.observe(
+        'capture_ms', (time.perf_counter() - start)*1000)
     stream_client.in_request = False
 
 
@@ -74,8 +97,9 @@ class FuryStreamClient:
 
         self._whithout_iren_start = whithout_iren_start
         self.showm = showm
-        self.window2image_filter = vtk.vtkWindowToImageFilter()
-        self.window2image_filter.SetInput(self.showm.window)
+        # vtk arrays sharing the memory of the image buffers
+        self.pixel_arrays = {}
+        self.metrics = StreamMetrics()
         self.image_buffers = []
         self.image_buffer_names = []
         self.info_buffer_name = None
@@ -111,6 +135,9 @@ class FuryStreamClient:
         self.update = True
         self.use_raw_array = use_raw_array
         self._started = False
+        # captures driven by a timer render the window first, the ones
+        # following a RenderEvent read the frame just rendered
+        self.render_before_capture = False
 
     def start(self, ms=0, use_asyncio=False):
         """Start the stream client.
@@ -131,6 +158,7 @@ class FuryStreamClient:
         use_asyncio = platform.system() == 'Windows' or use_asyncio
         if self._started:
             self.stop()
+        self.render_before_capture = ms > 0
         if ms > 0:
             if self._whithout_iren_start:
 
@@ -209,25 +237,47 @@ class FuryStreamClient:
                 print(f'Shared Memory {name}(buffer image) File not found')
 
 
-def interaction_callback(circular_queue, showm, iren, render_after):
-    """This callback is used to invoke vtk interaction events
-    reading those events from the provided circular_queue instance
+def coalesce_events(events):
+    """Merge consecutive mouse move events and consecutive mouse weel
+    events, so just the latest state of the mouse is handled.
+
+    The moves are replaced by the last one, while the weel events are
+    replaced by a single one with the same overall zoom.
 
     Parameters
     ----------
-    circular_queue : CircularQueue
-    showm : ShowmManager
-    iren : vtkInteractor
-    render_after : bool, optional
-        If the render method should be called after an
-        dequeue
+    events : ndarray
+        (N, dimension) array with the events in the order they were
+        enqueued.
 
-    """
-    ts = time.time()*1000
-    data = circular_queue.dequeue()
-    if data is None:
-        return
+    Returns
+    -------
+    events : ndarray
 
+    """
+    if len(events) < 2:
+        return events
+    event_ids = _CQUEUE.event_ids
+    ids = events[:, 0]
+    # an event followed by one of the same kind is dropped
+    merged = (ids[:-1] == ids[1:]) & np.isin(
+        ids[:-1], [event_ids.mouse_move, event_ids.mouse_weel])
+    if not merged.any():
+        return events
+    keep = np.append(~merged, True)
+    events = events.copy()
+    weel = _CQUEUE.index_info.weel
+    zoom = 1.0 - events[:, weel] / 1000.0
+    # the product of the zoom factors of each run of weel events
+    run_ids = np.cumsum(np.append(True, ~merged))
+    for run_id in np.unique(run_ids[ids == event_ids.mouse_weel]):
+        run = run_ids == run_id
+        last = np.flatnonzero(run)[-1]
+        events[last, weel] = (1.0 - np.prod(zoom[run]))*1000.0
+    return events[keep]
+
+
+def _process_event(data, showm, iren):
     user_event_id = data[0]
     user_timestamp = data[_CQUEUE.index_info.user_timestamp]
 
@@ -271,9 +321,52 @@ def interaction_callback(circular_queue, showm, iren, render_after):
     logging.info(
         'Interaction: time to peform event ' +
         f'{ts-user_timestamp:.2f} ms')
-    if render_after:
+
+
+def _render(showm):
+    """Render the window once and notify the observers of the
+    RenderEvent of the interactor."""
+    iren = showm.iren
+    if iren.GetEnabled() and iren.GetEnableRender():
+        iren.Render()
+    else:
         showm.window.Render()
-        showm.iren.Render()
+        iren.InvokeEvent('RenderEvent')
+
+
+def interaction_callback(circular_queue, showm, iren, render_after):
+    """This callback is used to invoke vtk interaction events
+    reading those events from the provided circular_queue instance
+
+    All the pending events are dequeued at once and consecutive mouse
+    move and mouse weel events are merged before being handled.
+
+    Parameters
+    ----------
+    circular_queue : CircularQueue
+    showm : ShowmManager
+    iren : vtkInteractor
+    render_after : bool, optional
+        If the render method should be called after the
+        events were handled
+
+    Returns
+    -------
+    events : ndarray
+        The events dequeued, before being merged. Empty if there
+        was no event to handle.
+
+    """
+    events = circular_queue.dequeue_many()
+    if len(events) == 0:
+        return events
+
+    for data in coalesce_events(events):
+        _process_event(data, showm, iren)
+
+    if render_after:
+        _render(showm)
+    return events
 
 
 class FuryStreamInteraction:
@@ -314,8 +407,47 @@ class FuryStreamInteraction:
         self._interval_timer = None
         self._whithout_iren_start = whithout_iren_start
         self._started = False
+        self.ms_render = 0
+        self._render_pending = False
+        self._last_render = None
+        self._first_event_ms = 0
+        self.metrics = StreamMetrics()
+
+    def update(self):
+        """Handle all the pending user interactions and render the
+        window if needed.
 
-    def start(self, ms=3, use_asyncio=False):
+        Renders are coalesced: after the events are handled the window
+        is rendered at most once every ms_render miliseconds. A render
+        postponed by this limit happens in a later call, even if no new
+        event arrives.
+
+        """
+        events = interaction_callback(
+            self.circular_queue, self.showm, self.iren, False)
+        if len(events) > 0:
+            self.metrics.increment('events_handled', len(events))
+            if not self._render_pending:
+                self._render_pending = True
+                timestamps = events[:, _CQUEUE.index_info.server_timestamp]
+                self._first_event_ms = timestamps.min()
+        if not self._render_pending:
+            return
+
+        now = time.perf_counter()
+        if self._last_render is not None and \
+                (now - self._last_render)*1000 < self.ms_render:
+            return
+        _render(self.showm)
+        self._last_render = now
+        self._render_pending = False
+        self.metrics.increment('renders')
+        if self._first_event_ms > 0:
+            latency = time.time()*1000 - self._first_event_ms
+            self.metrics.observe('input_to_render_ms', latency)
+            self.circular_queue.render_latency = max(0, int(latency))
+
+    def start(self, ms=3, use_asyncio=False, ms_render=16):
         """Start the stream interaction client.
 
         Parameters
@@ -325,6 +457,9 @@ class FuryStreamInteraction:
         use_asyncio : bool, optional
             If False then the interaction will be performed in a
             separate thread.
+        ms_render : float, optional
+            Minimum amount of miliseconds between two renders triggered
+            by the user interactions.
 
         """
 
@@ -334,23 +469,14 @@ class FuryStreamInteraction:
 
         if self._started:
             self.stop()
+        self.ms_render = ms_render
         if self._whithout_iren_start:
             Interval = IntervalTimer \
                     if use_asyncio else IntervalTimerThreading
-            self._interval_timer = Interval(
-                ms/1000,
-                interaction_callback,
-                *[
-                     self.circular_queue,
-                     self.showm,
-                     self.iren,
-                     True
-                 ]
-            )
+            self._interval_timer = Interval(ms/1000, self.update)
         else:
             def callback(caller, event, *args, **kwargs):
-                interaction_callback(
-                    self.circular_queue, self.showm, self.iren, True)
+                self.update()
 
             self._id_observer = self.showm.iren.AddObserver(
                 "TimerEvent", callback)
@@ -383,3 +509,272 @@ class FuryStreamInteraction:
         """Release the shared memory resources if necessary.
         """
         self.circular_queue.cleanup()
+
+
+class FuryStreamSession:
+    """This obj. stores the state of one viewer of a scene shared by
+    several streaming sessions."""
+    def __init__(self, camera, style, stream, interaction):
+        """
+
+        Parameters
+        ----------
+        camera : vtkCamera
+            Camera used to render the view of this session.
+        style : vtkInteractorStyle
+            Interactor style handling the events of this session, so the
+            state of a mouse drag isn't shared with other sessions.
+        stream : FuryStreamClient
+            Owns the image buffers of this session.
+        interaction : FuryStreamInteraction
+            Owns the queue with the user interactions of this session.
+
+        """
+        self.camera = camera
+        self.style = style
+        self.stream = stream
+        self.interaction = interaction
+        self.dirty = True
+        # the interactor is shared, the positions of the previous events
+        # of this session are restored before handling its next events
+        self.event_position = (0, 0)
+        self.last_event_position = (0, 0)
+
+    @property
+    def img_manager(self):
+        return self.stream.img_manager
+
+    @property
+    def circular_queue(self):
+        return self.interaction.circular_queue
+
+
+class FuryStreamSessions:
+    """This obj. streams the same scene to several sessions, each one
+    with its own camera, image buffers and interaction queue.
+
+    A single window renders the view of each session in turn, so one
+    heavy scene can be served to many viewers from one process. The
+    sessions with new interactions are rendered in round-robin order,
+    at most max_renders per update.
+
+    Examples
+    --------
+    Each session can be served by its own web server, as a Widget does
+
+    .. code-block:: python
+
+        sessions = FuryStreamSessions(showm, num_sessions=3)
+        sessions.start(ms=16)
+        session = sessions.sessions[0]
+        web_server_raw_array(
+            image_buffers=session.img_manager.image_buffers,
+            info_buffer=session.img_manager.info_buffer,
+            queue_head_tail_buffer=session.circular_queue.head_tail_buffer,
+            queue_buffer=session.circular_queue.buffer.buffer)
+
+    """
+    def __init__(
+            self, showm, num_sessions=1, max_window_size=None,
+            use_raw_array=True, max_queue_size=50,
+            whithout_iren_start=False, max_renders=1):
+        """
+
+        Parameters
+        ----------
+        showm : ShowmManager
+        num_sessions : int, optional
+            Number of sessions created at once. More sessions can be
+            added with add_session.
+        max_window_size : tuple of ints, optional
+            This allows resize events inside of the FURY window instance.
+            Should be greater than the window size.
+        use_raw_array : bool, optional
+            If False then the sessions will use SharedMemory
+            instead of RawArrays.
+        max_queue_size : int, optional
+            maximum number of events to be stored for each session.
+        whithout_iren_start : bool, optional
+            Set that to True if you can't initiate the vtkInteractor
+            instance.
+        max_renders : int, optional
+            Maximum number of sessions rendered in each update.
+
+        """
+        self.showm = showm
+        self.max_window_size = max_window_size
+        self.use_raw_array = use_raw_array
+        self.max_queue_size = max_queue_size
+        self.max_renders = max_renders
+        self.sessions = []
+        self._whithout_iren_start = whithout_iren_start
+        self._next = 0
+        self._id_timer = None
+        self._id_observer = None
+        self._interval_timer = None
+        self._started = False
+        # the sessions trigger the renders, not the interactor styles.
+        # The previous state of the window is restored by cleanup
+        self._off_screen_rendering = \
+            self.showm.window.GetOffScreenRendering()
+        self._enable_render = self.showm.iren.GetEnableRender()
+        self.showm.window.SetOffScreenRendering(1)
+        self.showm.iren.EnableRenderOff()
+        for _ in range(num_sessions):
+            self.add_session()
+
+    def add_session(self):
+        """Create a new session starting from the current camera.
+
+        Returns
+        -------
+        session : FuryStreamSession
+
+        """
+        camera = Camera()
+        camera.DeepCopy(self.showm.scene.GetActiveCamera())
+        style = type(self.showm.style)()
+        style.SetCurrentRenderer(self.showm.scene)
+        stream = FuryStreamClient(
+            self.showm, max_window_size=self.max_window_size,
+            use_raw_array=self.use_raw_array,
+            whithout_iren_start=self._whithout_iren_start)
+        interaction = FuryStreamInteraction(
+            self.showm, max_queue_size=self.max_queue_size,
+            use_raw_array=self.use_raw_array,
+            whithout_iren_start=self._whithout_iren_start)
+        session = FuryStreamSession(camera, style, stream, interaction)
+        self.sessions.append(session)
+        return session
+
+    def remove_session(self, session):
+        """Stop streaming a session and release its resources.
+
+        Parameters
+        ----------
+        session : FuryStreamSession
+
+        """
+        self.sessions.remove(session)
+        session.stream.cleanup()
+        session.interaction.cleanup()
+        self._next = 0
+
+    def invalidate(self):
+        """Render again every session, for instance after the scene was
+        modified."""
+        for session in self.sessions:
+            session.dirty = True
+
+    def _activate(self, session):
+        iren = self.showm.iren
+        self.showm.scene.SetActiveCamera(session.camera)
+        iren.SetInteractorStyle(session.style)
+        # SetEventPosition also updates the last event position
+        iren.SetEventPosition(*session.event_position)
+        iren.SetLastEventPosition(*session.last_event_position)
+
+    def update(self):
+        """Handle the interactions of every session and render the views
+        of the sessions that changed.
+        """
+        scene = self.showm.scene
+        iren = self.showm.iren
+        camera = scene.GetActiveCamera()
+        style = iren.GetInteractorStyle()
+        event_position = iren.GetEventPosition()
+        last_event_position = iren.GetLastEventPosition()
+        try:
+            for session in self.sessions:
+                self._activate(session)
+                events = interaction_callback(
+                    session.circular_queue, self.showm, iren, False)
+                if len(events) > 0:
+                    session.dirty = True
+                    session.event_position = iren.GetEventPosition()
+                    session.last_event_position = \
+                        iren.GetLastEventPosition()
+
+            num_sessions = len(self.sessions)
+            num_renders = 0
+            for i in range(num_sessions):
+                idx = (self._next + i) % num_sessions
+                session = self.sessions[idx]
+                if not session.dirty:
+                    continue
+                self._activate(session)
+                self.showm.window.Render()
+                callback_stream_client(session.stream)
+                session.dirty = False
+                num_renders += 1
+                if num_renders == self.max_renders:
+                    # the next update starts after this session
+                    self._next = (idx + 1) % num_sessions
+                    break
+        finally:
+            scene.SetActiveCamera(camera)
+            iren.SetInteractorStyle(style)
+            iren.SetEventPosition(*event_position)
+            iren.SetLastEventPosition(*last_event_position)
+
+    def start(self, ms=16, use_asyncio=False):
+        """Start updating the sessions.
+
+        Parameters
+        ----------
+        ms : float, optional
+            positive number greather than zero. Interval between two
+            updates.
+        use_asyncio : bool, optional
+            If False then the updates will be performed in a
+            separate thread.
+
+        """
+        use_asyncio = platform.system() == 'Windows' or use_asyncio
+        if ms <= 0:
+            raise ValueError('ms must be greater than zero')
+
+        if self._started:
+            self.stop()
+        if self._whithout_iren_start:
+            Interval = IntervalTimer \
+                    if use_asyncio else IntervalTimerThreading
+            self._interval_timer = Interval(ms/1000, self.update)
+        else:
+            def callback(caller, event, *args, **kwargs):
+                self.update()
+
+            self._id_observer = self.showm.iren.AddObserver(
+                "TimerEvent", callback)
+            self._id_timer = self.showm.iren.CreateRepeatingTimer(ms)
+
+        self._started = True
+
+    def stop(self):
+        """Stop updating the sessions.
+        """
+        if not self._started:
+            return False
+
+        if self._id_timer is not None:
+            self.showm.iren.DestroyTimer(self._id_timer)
+            self._id_timer = None
+
+        if self._id_observer is not None:
+            self.showm.iren.RemoveObserver(self._id_observer)
+            self._id_observer = None
+
+        if self._interval_timer is not None:
+            self._interval_timer.stop()
+            self._interval_timer = None
+
+        self._started = False
+
+    def cleanup(self):
+        """Release the resources of every session and restore the
+        rendering settings of the window.
+        """
+        for session in list(self.sessions):
+            self.remove_session(session)
+        self.showm.window.SetOffScreenRendering(self._off_screen_rendering)
+        self.showm.iren.SetEnableRender(self._enable_render)
@@ -45,6 +45,7 @@ _CQUEUE_EVENT_IDs = namedtuple(
 # 4 | ctrl_key state (1 pressed 0 otherwise)
 # 5 | shift_key state (1 pressed 0 otherwise)
 # 6 | js event timestamp in mileseconds (ufloat)
+# 7 | server timestamp in mileseconds when the event was enqueued (ufloat)
 _index_info = {
     'weel': 1,
     'x': 2,
@@ -52,6 +53,7 @@ _index_info = {
     'ctrl': 4,
     'shift': 5,
     'user_timestamp': 6,
+    'server_timestamp': 7,
 }
 _CQUEUE_INDEX_INFO = namedtuple(
     'CQUEUE_INDEX_INFO', list(_index_info.keys())
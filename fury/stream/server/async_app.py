@@ -1,7 +1,9 @@
 import asyncio
 import json
 import os
+import struct
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
 from functools import partial
 import aiohttp
 from aiohttp import MultipartWriter
@@ -21,6 +23,7 @@ import logging
 import time
 
 from fury.stream.constants import _CQUEUE_EVENT_IDs as EVENT_IDs
+from fury.stream.tools import AdaptiveQualityController, StreamMetrics
 logging.basicConfig(level=logging.ERROR)
 pcs = set()
 
@@ -42,6 +45,259 @@ async def javascript(request, **kwargs):
     return web.Response(content_type="application/javascript", text=content)
 
 
+def _timed_call(func, *args):
+    """Call a function and return its result with its duration in
+    miliseconds."""
+    start = time.perf_counter()
+    result = func(*args)
+    return result, (time.perf_counter() - start)*1000
+
+
+class MJPEGBroadcaster:
+    """This obj. encodes each frame only once and shares the jpeg
+    bytes with all the clients consuming the MJPEG streaming."""
+    # prefix of the names of the metrics of the broadcaster
+    name = 'mjpeg'
+
+    def __init__(
+            self, image_buffer_manager, ms=33, max_workers=1,
+            quality_controller=None, metrics=None):
+        """
+
+        Parameters
+        ----------
+        image_buffer_manager : ImageBufferManager
+        ms : float, optional
+            The amount of miliseconds between two consecutive
+            jpeg encodings.
+        max_workers : int, optional
+            Number of threads used to encode the frames outside of
+            the event loop.
+        quality_controller : AdaptiveQualityController, optional
+            If given, chooses the jpeg quality and the downsampling of
+            each frame.
+        metrics : StreamMetrics, optional
+            If given, counts the frames encoded and their encoding time
+            as ``mjpeg_frames_encoded`` and ``mjpeg_encode_ms``.
+
+        """
+        self.image_buffer_manager = image_buffer_manager
+        self.ms = ms
+        self.quality_controller = quality_controller
+        self.metrics = metrics
+        self.executor = ThreadPoolExecutor(max_workers=max_workers)
+        self.frame = None
+        self.frame_id = 0
+        self.num_subscribers = 0
+        self._condition = None
+        self._task = None
+        self._error = None
+        self._error_id = 0
+
+    async def _encode(self):
+        """Return the next frame to send, or None if the framebuffer has
+        not changed, and the miliseconds spent encoding it."""
+        quality, scale = None, 1
+        controller = self.quality_controller
+        if controller is not None:
+            quality, scale = controller.adapt()
+        loop = asyncio.get_running_loop()
+        # the duration is measured in the encoding thread, the one stored
+        # by the image buffer manager can come from another broadcaster
+        jpeg, encode_ms = await loop.run_in_executor(
+            self.executor, _timed_call, self.image_buffer_manager.get_jpeg,
+            quality, scale)
+        await asyncio.sleep(self.ms/1000)
+        if jpeg is self.frame:
+            return None, encode_ms
+        if controller is not None:
+            controller.update_encoding(encode_ms)
+        return jpeg, encode_ms
+
+    def _current_frame(self):
+        """Return what a new subscriber, or one that missed frames,
+        should receive."""
+        return self.frame
+
+    async def _run(self):
+        started = True
+        try:
+            while self.num_subscribers > 0:
+                frame, encode_ms = await self._encode()
+                if frame is not None and self.metrics is not None:
+                    self.metrics.increment(f'{self.name}_frames_encoded')
+                    self.metrics.observe(f'{self.name}_encode_ms', encode_ms)
+                if frame is None and started:
+                    # the subscribers that started the task wait for a
+                    # frame
+                    frame = self._current_frame()
+                started = False
+                if not frame:
+                    # the framebuffer has not changed, nothing to send
+                    continue
+                async with self._condition:
+                    self.frame = frame
+                    self.frame_id += 1
+                    self._condition.notify_all()
+        except Exception as e:
+            logging.exception('The encoding of the frames failed')
+            # wake up the subscribers, otherwise they wait forever
+            async with self._condition:
+                self._error = e
+                self._error_id += 1
+                self._condition.notify_all()
+        finally:
+            self._task = None
+
+    async def frames(self):
+        """Yield the jpeg bytes of each new encoded frame.
+
+        The encoding task starts with the first subscriber and stops
+        when the last one leaves. A new subscriber receives the current
+        frame right away, and after that only frames that changed. A slow
+        client does not trigger new encodings, when it missed frames it
+        receives the current frame instead of the next one, so the tiles
+        of the missed frames are not lost. If the encoding fails, the
+        waiting subscribers raise a RuntimeError instead of waiting
+        forever.
+
+        """
+        if self._condition is None:
+            self._condition = asyncio.Condition()
+        self.num_subscribers += 1
+        last_id = self.frame_id
+        error_id = self._error_id
+        running = self._task is not None
+        if not running:
+            self._task = asyncio.ensure_future(self._run())
+        try:
+            if running and self.frame is not None:
+                yield self._current_frame()
+            while True:
+                async with self._condition:
+                    await self._condition.wait_for(
+                        lambda: self.frame_id != last_id or
+                        self._error_id != error_id)
+                    if self._error_id != error_id:
+                        raise RuntimeError(
+                            'The encoding of the frames failed'
+                        ) from self._error
+                    missed = self.frame_id - last_id > 1
+                    last_id = self.frame_id
+                    frame = self._current_frame() if missed else self.frame
+                yield frame
+        finally:
+            self.num_subscribers -= 1
+
+    async def stop(self):
+        """Stop the encoding task and release the encoding threads."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self.executor.shutdown(wait=False)
+
+
+class TilesBroadcaster(MJPEGBroadcaster):
+    """This obj. shares with all the clients only the tiles of each
+    frame that changed since the previous one.
+
+    Each frame is a list of binary messages, one per tile. A message
+    starts with six little-endian uint32 values: the width and height of
+    the frame followed by the x, y, width and height of the tile, with
+    (x, y) being its top-left corner. The jpeg bytes of the tile follow
+    the header.
+
+    """
+    name = 'tiles'
+
+    def __init__(
+            self, image_buffer_manager, ms=33, max_workers=1, tile_size=64,
+            metrics=None):
+        """
+
+        Parameters
+        ----------
+        image_buffer_manager : ImageBufferManager
+        ms : float, optional
+            The amount of miliseconds between two consecutive
+            encodings.
+        max_workers : int, optional
+            Number of threads used to encode the tiles outside of
+            the event loop.
+        tile_size : int, optional
+            Size in pixels of the side of the tiles.
+        metrics : StreamMetrics, optional
+            If given, counts the frames encoded and their encoding time
+            as ``tiles_frames_encoded`` and ``tiles_encode_ms``.
+
+        """
+        super().__init__(
+            image_buffer_manager, ms, max_workers, metrics=metrics)
+        self.tile_size = tile_size
+
+    @staticmethod
+    def _pack(width, height, tiles):
+        return [
+            struct.pack('<6I', width, height, x, y, w, h) + jpeg
+            for x, y, w, h, jpeg in tiles]
+
+    async def _encode(self):
+        loop = asyncio.get_running_loop()
+        (width, height, tiles), encode_ms = await loop.run_in_executor(
+            self.executor, _timed_call,
+            self.image_buffer_manager.get_jpeg_tiles, self.tile_size)
+        await asyncio.sleep(self.ms/1000)
+        if not tiles:
+            return None, encode_ms
+        return self._pack(width, height, tiles), encode_ms
+
+    def _current_frame(self):
+        # a new or late client needs every tile to composite the full
+        # frame
+        return self._pack(*self.image_buffer_manager.get_all_jpeg_tiles())
+
+
+def _client_name(request, endpoint):
+    peername = request.transport.get_extra_info('peername')
+    if peername is None:
+        return f'{endpoint} {id(request)}'
+    return f'{endpoint} {peername[0]}:{peername[1]}'
+
+
+async def tiles_handler(request):
+    """This async function sends through a websocket the tiles of the
+    frames that changed.
+
+    Notes:
+    ------
+    endpoint : /video/tiles
+
+    """
+    ws = web.WebSocketResponse()
+    await ws.prepare(request)
+    request.app['websockets'].add(ws)
+    metrics = request.app['metrics']
+    client = _client_name(request, 'tiles')
+    frames = request.app['tiles_broadcaster'].frames()
+    try:
+        async for messages in frames:
+            if ws.closed:
+                break
+            start = time.perf_counter()
+            for msg in messages:
+                await ws.send_bytes(msg)
+            metrics.observe('send_ms', (time.perf_counter() - start)*1000)
+            metrics.add_client_data(client, sum(map(len, messages)))
+    except ConnectionResetError:
+        logging.info("Client connection closed")
+    finally:
+        await frames.aclose()
+        request.app['websockets'].discard(ws)
+        metrics.remove_client(client)
+
+    return ws
+
+
 async def mjpeg_handler(request):
     """This async function it's responsible
     to create the MJPEG streaming.
@@ -61,19 +317,54 @@ async def mjpeg_handler(request):
             }
     )
     await response.prepare(request)
-    image_buffer_manager = request.app['image_buffer_manager']
-    while True:
-        jpeg_bytes = await image_buffer_manager.async_get_jpeg()
-        with MultipartWriter('image/jpeg', boundary=my_boundary) as mpwriter:
-            mpwriter.append(jpeg_bytes, {
-                'Content-Type': 'image/jpeg'
-            })
-            try:
-                await mpwriter.write(response, close_boundary=False)
-            except ConnectionResetError:
-                logging.info("Client connection closed")
-                break
-        await response.write(b"\r\n")
+    metrics = request.app['metrics']
+    client = _client_name(request, 'mjpeg')
+    frames = request.app['mjpeg_broadcaster'].frames()
+    try:
+        async for jpeg_bytes in frames:
+            start = time.perf_counter()
+            with MultipartWriter(
+                    'image/jpeg', boundary=my_boundary) as mpwriter:
+                mpwriter.append(jpeg_bytes, {
+                    'Content-Type': 'image/jpeg'
+                })
+                try:
+                    await mpwriter.write(response, close_boundary=False)
+                except ConnectionResetError:
+                    logging.info("Client connection closed")
+                    break
+            await response.write(b"\r\n")
+            metrics.observe('send_ms', (time.perf_counter() - start)*1000)
+            metrics.add_client_data(client, len(jpeg_bytes))
+    finally:
+        await frames.aclose()
+        metrics.remove_client(client)
+
+
+async def metrics_handler(request):
+    """Returns the counters and timings of the streaming as JSON.
+
+    Notes:
+    ------
+    endpoint : /metrics
+
+    """
+    app = request.app
+    metrics = app['metrics']
+    image_buffer_manager = app['image_buffer_manager']
+    if image_buffer_manager is not None:
+        metrics.set('frames_captured', image_buffer_manager.frame_id)
+    circular_queue = app['circular_queue']
+    if circular_queue is not None:
+        metrics.set('queue_depth', circular_queue.size)
+        # the latencies are stored by the rendering process, only the
+        # ones not read yet are added to the timing
+        state = app['metrics_state']
+        latencies, state['render_latency_count'] = \
+            circular_queue.render_latencies(state['render_latency_count'])
+        for latency in latencies:
+            metrics.observe('input_to_render_ms', latency)
+    return web.json_response(metrics.as_dict())
 
 
 async def offer(request, **kwargs):
@@ -126,7 +417,7 @@ def set_weel(data, circular_queue):
         np.array(
             [
                 EVENT_IDs.mouse_weel,
-                deltaY, 0, 0, 0, 0, user_envent_ms, 0
+                deltaY, 0, 0, 0, 0, user_envent_ms, time.time()*1000
             ], dtype='float64'))
     ts = time.time()*1000
     logging.info(f'WEEL Time until enqueue {ts-user_envent_ms:.2f} ms')
@@ -145,7 +436,8 @@ def set_mouse(data, circular_queue):
         np.array(
             [
                 EVENT_IDs.mouse_move,
-                0, x, y,  ctrl_key, shift_key, user_envent_ms, 0
+                0, x, y,  ctrl_key, shift_key, user_envent_ms,
+                time.time()*1000
             ],
             dtype='float64'
         )
@@ -178,7 +470,10 @@ def set_mouse_click(data, circular_queue):
     event_id = (mouse_button + 1)*2 + on + 1
     ok = circular_queue.enqueue(
         np.array(
-                [event_id, 0, x, y, ctrl, shift, user_envent_ms, 0],
+                [
+                    event_id, 0, x, y, ctrl, shift, user_envent_ms,
+                    time.time()*1000
+                ],
                 dtype='float64'
             )
     )
@@ -191,6 +486,9 @@ async def on_shutdown(app):
     coros = [pc.close() for pc in pcs]
     await asyncio.gather(*coros)
     pcs.clear()
+    for broadcaster in ['mjpeg_broadcaster', 'tiles_broadcaster']:
+        if broadcaster in app:
+            await app[broadcaster].stop()
     for ws in set(app['websockets']):
         await ws.close(code=WSCloseCode.GOING_AWAY,
                        message='Server shutdown')
@@ -199,6 +497,7 @@ async def on_shutdown(app):
 async def websocket_handler(request, **kwargs):
 
     circular_queue = kwargs['circular_queue']
+    quality_controller = request.app.get('quality_controller')
     ws = web.WebSocketResponse()
     await ws.prepare(request)
     request.app['websockets'].add(ws)
@@ -221,6 +520,10 @@ async def websocket_handler(request, **kwargs):
                         set_mouse(data, circular_queue)
                     elif data['type'] == 'mouseLeftClick':
                         set_mouse_click(data, circular_queue)
+                    if quality_controller is not None:
+                        quality_controller.update_interaction(
+                            float(data['timestampInMs']),
+                            circular_queue.size)
                     # await ws.send_str(msg.data + '/answer')
 
             elif msg.type == aiohttp.WSMsgType.ERROR:
@@ -236,7 +539,8 @@ async def websocket_handler(request, **kwargs):
 def get_app(
         rtc_server=None, folder=None, circular_queue=None,
         image_buffer_manager=None, provides_mjpeg=False,
-        broadcast=True):
+        broadcast=True, ms_jpeg=33, jpeg_workers=1, tile_size=None,
+        adaptive_quality=False):
 
     if folder is None:
         folder = f'{os.path.dirname(__file__)}/www/'
@@ -255,14 +559,33 @@ def get_app(
     # )
     app.router.add_get("/", partial(
         index, folder=folder, just_mjpeg=rtc_server is None))
-    js_files = ['main.js', 'main_just_mjpeg.js', 'webrtc.js', 'constants.js', 'interaction.js']
+    js_files = [
+        'main.js', 'main_just_mjpeg.js', 'webrtc.js', 'constants.js',
+        'interaction.js', 'tiles.js']
     for js in js_files:
         app.router.add_get(
             "/js/%s" % js, partial(javascript, folder=folder, js=js))
 
     app['image_buffer_manager'] = image_buffer_manager
+    app['circular_queue'] = circular_queue
+    app['metrics'] = StreamMetrics()
+    # the application can't be modified once started
+    app['metrics_state'] = {'render_latency_count': 0}
+    app.router.add_get("/metrics", metrics_handler)
     if provides_mjpeg:
+        quality_controller = None
+        if adaptive_quality:
+            quality_controller = AdaptiveQualityController()
+            app['quality_controller'] = quality_controller
+        app['mjpeg_broadcaster'] = MJPEGBroadcaster(
+            image_buffer_manager, ms=ms_jpeg, max_workers=jpeg_workers,
+            quality_controller=quality_controller, metrics=app['metrics'])
         app.router.add_get("/video/mjpeg", mjpeg_handler)
+        if tile_size is not None:
+            app['tiles_broadcaster'] = TilesBroadcaster(
+                image_buffer_manager, ms=ms_jpeg, max_workers=jpeg_workers,
+                tile_size=tile_size, metrics=app['metrics'])
+            app.router.add_get("/video/tiles", tiles_handler)
 
     if rtc_server is not None:
         app.router.add_post("/offer", partial(
@@ -49,6 +49,7 @@ class RTCServer(VideoStreamTrack):
         super().__init__()
 
         self.frame = None
+        self._frame_id = None
         self.buffer_manager = image_buffer_manager
 
     async def recv(self):
@@ -64,6 +65,14 @@ class RTCServer(VideoStreamTrack):
         """
         pts, time_base = await self.next_timestamp()
 
+        frame_id = self.buffer_manager.frame_id
+        if self.frame is not None and frame_id == self._frame_id:
+            # the framebuffer has not changed, reuse the last frame
+            self.frame.pts = pts
+            self.frame.time_base = time_base
+            return self.frame
+        self._frame_id = frame_id
+
         width, height, image = self.buffer_manager.get_current_frame()
 
         if self.frame is None \
@@ -80,7 +89,8 @@ class RTCServer(VideoStreamTrack):
                         self.image,
                         'uint8'
                     )[0:width*height*3].reshape((height, width, 3))
-            self.image = np.flipud(self.image)
+            if self.buffer_manager.bottom_up:
+                self.image = np.flipud(self.image)
             self.frame = VideoFrame.from_ndarray(self.image)
         else:
             self.frame.update_from_buffer(self.image)
@@ -110,6 +120,9 @@ def web_server_raw_array(
     provides_mjpeg=True,
     provides_webrtc=True,
     ms_jpeg=16,
+    jpeg_workers=1,
+    tile_size=None,
+    adaptive_quality=False,
     run_app=True
 ):
     """This will create a streaming webserver running on the
@@ -147,6 +160,18 @@ def web_server_raw_array(
         This it's used  only if the MJPEG will be used. The
         ms_jpeg represents the amount of miliseconds between to
         consecutive calls of the jpeg enconding.
+    jpeg_workers : int, optional
+        Number of threads encoding the jpeg images, so the encoding
+        doesn't block the user interactions handled by the server.
+    tile_size : int, optional
+        If given, the MJPEG server also sends through
+        host:port/video/tiles only the tiles of tile_size pixels
+        that changed between consecutive frames. You can consume
+        that through your browser http://host:port?encoding=tiles
+    adaptive_quality : bool, default False
+        If True, the jpeg quality of the MJPEG streaming is lowered and
+        the frames are downsampled while the user interacts under load.
+        The full quality is restored when the user is idle.
     run_app : bool, default True
         This will run the aiohttp application. The False condition
         is used just to be able to test the server.
@@ -176,7 +201,11 @@ def web_server_raw_array(
     app_fury = get_app(
        rtc_server, circular_queue=circular_queue,
        image_buffer_manager=image_buffer_manager,
-       provides_mjpeg=provides_mjpeg
+       provides_mjpeg=provides_mjpeg,
+       ms_jpeg=ms_jpeg,
+       jpeg_workers=jpeg_workers,
+       tile_size=tile_size,
+       adaptive_quality=adaptive_quality
     )
 
     if run_app:
@@ -202,6 +231,9 @@ def web_server(
         provides_webrtc=True,
         avoid_unlink_shared_mem=True,
         ms_jpeg=16,
+        jpeg_workers=1,
+        tile_size=None,
+        adaptive_quality=False,
         run_app=True):
     """This will create a streaming webserver running on the given port
     and host using SharedMemory.
@@ -241,6 +273,18 @@ def web_server(
         This it's used  only if the MJPEG will be used. The
         ms_jpeg represents the amount of miliseconds between to
         consecutive calls of the jpeg enconding.
+    jpeg_workers : int, optional
+        Number of threads encoding the jpeg images, so the encoding
+        doesn't block the user interactions handled by the server.
+    tile_size : int, optional
+        If given, the MJPEG server also sends through
+        host:port/video/tiles only the tiles of tile_size pixels
+        that changed between consecutive frames. You can consume
+        that through your browser http://host:port?encoding=tiles
+    adaptive_quality : bool, default False
+        If True, the jpeg quality of the MJPEG streaming is lowered and
+        the frames are downsampled while the user interacts under load.
+        The full quality is restored when the user is idle.
     run_app : bool, default True
         This will run the aiohttp application. The False condition
         is used just to be able to test the server.
@@ -273,7 +317,11 @@ def web_server(
     app_fury = get_app(
        rtc_server, circular_queue=circular_queue,
        image_buffer_manager=image_buffer_manager,
-       provides_mjpeg=provides_mjpeg
+       provides_mjpeg=provides_mjpeg,
+       ms_jpeg=ms_jpeg,
+       jpeg_workers=jpeg_workers,
+       tile_size=tile_size,
+       adaptive_quality=adaptive_quality
     )
 
     if run_app:
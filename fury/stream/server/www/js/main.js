@@ -1,4 +1,5 @@
 import { startWebRTC } from "/js/webrtc.js";
+import { startTiles } from "/js/tiles.js";
 import {
   urlParams,
   encoding,
@@ -16,6 +17,9 @@ function getVideoDOMEL(encoding) {
     case "mjpeg":
       videoElId = "videoMJPEG";
       break;
+    case "tiles":
+      videoElId = "videoTiles";
+      break;
     default:
       videoElId = "video";
   }
@@ -32,6 +36,9 @@ document.addEventListener("DOMContentLoaded", (event) => {
   } else if (encoding === 'mjpeg') {
     document.getElementById("startBtn").className = 'hidden'
     videoEl.src = `/video/mjpeg`
+  } else if (encoding === 'tiles') {
+    document.getElementById("startBtn").className = 'hidden'
+    startTiles(videoEl)
   }
   const interaction = urlParams.get("interaction");
   const runningOnIframe = urlParams.get("iframe");
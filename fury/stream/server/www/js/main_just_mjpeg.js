@@ -1,13 +1,21 @@
 import {
   urlParams,
+  encoding,
 } from "/js/constants.js";
+import { startTiles } from "/js/tiles.js";
 import {
   addInteraction
 } from "/js/interaction.js";
 
 document.addEventListener("DOMContentLoaded", (event) => {
-  const videoEl = document.getElementById('videoMJPEG')
-  videoEl.src = `/video/mjpeg`
+  let videoEl;
+  if (encoding === 'tiles') {
+    videoEl = document.getElementById('videoTiles')
+    startTiles(videoEl)
+  } else {
+    videoEl = document.getElementById('videoMJPEG')
+    videoEl.src = `/video/mjpeg`
+  }
   const interaction = urlParams.get("interaction");
   const runningOnIframe = urlParams.get("iframe");
   const backgroundColor = urlParams.get("background");
@@ -0,0 +1,40 @@
+const socketProtocol =
+  location.protocol === 'https:'
+    ? 'wss'
+    : 'ws';
+
+const tilesAddr = `${socketProtocol}://${location.hostname}:${location.port}/video/tiles`
+
+// Each message holds one tile: a header with six uint32 values
+// (frame width, frame height, x, y, tile width, tile height)
+// followed by the jpeg bytes of the tile.
+const headerSize = 6*4
+
+export const startTiles = (canvasEl) => {
+  const ctx = canvasEl.getContext("2d");
+  const ws = new WebSocket(tilesAddr);
+  ws.binaryType = "arraybuffer";
+  // draw the tiles in the order they were received
+  let drawing = Promise.resolve();
+  ws.onmessage = (event) => {
+    const header = new DataView(event.data, 0, headerSize);
+    const [width, height, x, y] = [0, 1, 2, 3].map(
+      (i) => header.getUint32(i*4, true));
+    const blob = new Blob(
+      [event.data.slice(headerSize)], { type: "image/jpeg" });
+    const bitmap = createImageBitmap(blob);
+    drawing = drawing.then(async () => {
+      if (canvasEl.width !== width || canvasEl.height !== height) {
+        canvasEl.width = width;
+        canvasEl.height = height;
+      }
+      const tile = await bitmap;
+      ctx.drawImage(tile, x, y);
+      tile.close();
+    }).catch((error) => {
+      // a tile that can't be decoded must not stop the next ones
+      console.error("Unable to draw a tile", error);
+    });
+  };
+  return ws;
+}
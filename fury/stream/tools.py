@@ -3,6 +3,7 @@ import time
 import logging
 import multiprocessing
 from abc import ABC, abstractmethod
+from collections import deque
 from threading import Timer
 import asyncio
 
@@ -25,6 +26,13 @@ _BYTE_ShM_TYPE = 'B'
 
 _FLOAT_SIZE = np.dtype(_FLOAT_ShM_TYPE).itemsize
 _INT_SIZE = np.dtype(_INT_ShM_TYPE).itemsize
+# number of render latencies kept by the circular queues
+_LATENCY_WINDOW = 64
+# read index, write index, last render latency, number of latencies and
+# the ring of the most recent latencies
+_HEAD_TAIL_SIZE = 4 + _LATENCY_WINDOW
+# copies of a frame tried before encoding one the writer was overwriting
+_COPY_ATTEMPTS = 3
 _UINT_SIZE = np.dtype(_UINT_ShM_TYPE).itemsize
 _BYTE_SIZE = np.dtype(_BYTE_ShM_TYPE).itemsize
 
@@ -63,6 +71,17 @@ def remove_shm_from_resource_tracker():
         del resource_tracker._CLEANUP_FUNCS["shared_memory"]
 
 
+def _encode_jpeg(image, quality=None):
+    """Encodes a PIL image or a (height, width, 3) uint8 array as a
+    jpeg image."""
+    if isinstance(image, np.ndarray):
+        image = Image.fromarray(np.ascontiguousarray(image), mode="RGB")
+    bytes_img_data = io.BytesIO()
+    options = {} if quality is None else {'quality': int(quality)}
+    image.save(bytes_img_data, format='jpeg', **options)
+    return bytes_img_data.getvalue()
+
+
 class GenericMultiDimensionalBuffer(ABC):
     """This implements a abstract (generic) multidimensional buffer."""
     def __init__(
@@ -266,7 +285,11 @@ class SharedMemMultiDimensionalBuffer(GenericMultiDimensionalBuffer):
 
 class GenericCircularQueue(ABC):
     """This implements a generic circular queue which works with
-        shared memory resources."""
+        shared memory resources.
+
+    The queue is lock-free and safe to use with a single producer and a
+    single consumer, each one possibly living in a different process.
+    """
     def __init__(
             self, max_size=None, dimension=8,
             use_shared_mem=False, buffer=None, buffer_name=None):
@@ -301,67 +324,155 @@ class GenericCircularQueue(ABC):
                 max_size=max_size, dimension=dimension, buffer=buffer
             )
 
+    # head_tail_buffer_repr[0] is the read index, written only by the
+    # consumer, and head_tail_buffer_repr[1] the write index, written only
+    # by the producer. Both run over [0, 2*max_size), so a full queue can be
+    # told apart from an empty one, and a slot is given by index % max_size.
+    # Each side stores its index after touching the data, so one producer
+    # and one consumer don't need any lock.
+
+    # head_tail_buffer_repr[2] is written by the consumer with the
+    # miliseconds between the enqueue of the oldest event handled and
+    # the following render. head_tail_buffer_repr[3] counts these
+    # latencies and the last _LATENCY_WINDOW ones are kept in the ring
+    # head_tail_buffer_repr[4:]. The ring slot is written before the
+    # count, so a reader never gets a slot that was not written yet.
+
     @property
-    def head(self):
-        if self._use_shared_mem:
-            return self.head_tail_buffer_repr[0]
-        else:
-            return np.frombuffer(
-                self.head_tail_buffer.get_obj(), _INT_ShM_TYPE)[0]
+    def render_latency(self):
+        """Latency in miliseconds between the last user interactions
+        enqueued and the render showing them."""
+        return int(self.head_tail_buffer_repr[2])
+
+    @render_latency.setter
+    def render_latency(self, value):
+        count = int(self.head_tail_buffer_repr[3])
+        self.head_tail_buffer_repr[4 + count % _LATENCY_WINDOW] = value
+        self.head_tail_buffer_repr[2] = value
+        self.head_tail_buffer_repr[3] = count + 1
+
+    def render_latencies(self, since=0):
+        """Return the render latencies stored after a given one.
 
-    @head.setter
-    def head(self, value):
-        self.head_tail_buffer_repr[0] = value
+        Parameters
+        ----------
+        since : int, optional
+            Number of latencies already read, as returned by a previous
+            call. Only the most recent latencies are kept, so older ones
+            are dropped when the reader falls behind.
+
+        Returns
+        -------
+        latencies : list of int
+            Latencies in miliseconds, from the oldest to the newest.
+        count : int
+            Number of latencies stored since the creation of the queue.
+
+        """
+        count = int(self.head_tail_buffer_repr[3])
+        start = max(since, count - _LATENCY_WINDOW)
+        latencies = [
+            int(self.head_tail_buffer_repr[4 + i % _LATENCY_WINDOW])
+            for i in range(start, count)]
+        return latencies, count
+
+    def _indices(self):
+        read, write = self.head_tail_buffer_repr[0:2]
+        return int(read), int(write)
+
+    @property
+    def head(self):
+        """Position of the next element to be dequeued or -1 if the
+        queue is empty."""
+        read, write = self._indices()
+        if read == write:
+            return -1
+        return read % self.buffer.max_size
 
     @property
     def tail(self):
-        if self._use_shared_mem:
-            return self.head_tail_buffer_repr[1]
-        else:
-            return np.frombuffer(
-                self.head_tail_buffer.get_obj(), _INT_ShM_TYPE)[1]
+        """Position of the last element enqueued or -1 if the
+        queue is empty."""
+        read, write = self._indices()
+        if read == write:
+            return -1
+        return (write - 1) % self.buffer.max_size
+
+    @property
+    def size(self):
+        """Number of elements waiting in the queue."""
+        read, write = self._indices()
+        return (write - read) % (2*self.buffer.max_size)
 
-    @tail.setter
-    def tail(self, value):
-        self.head_tail_buffer_repr[1] = value
+    def enqueue(self, data):
+        """Add an element to the queue. Must be called only by the
+        producer.
 
-    def set_head_tail(self, head, tail, lock=1):
-        self.head_tail_buffer_repr[0:3] = np.array(
-            [head, tail, lock]).astype(_INT_ShM_TYPE)
+        Parameters
+        ----------
+        data : ndarray
+            float64 array with the dimension of the queue.
 
-    def _enqueue(self, data):
-        ok = False
-        if ((self.tail + 1) % self.buffer.max_size == self.head):
-            ok = False
-        else:
-            if (self.head == -1):
-                self.set_head_tail(0, 0, 1)
-            else:
-                self.tail = (self.tail + 1) % self.buffer.max_size
-            self.buffer[self.tail] = data
-
-            ok = True
-        return ok
-
-    def _dequeue(self):
-        if self.head == -1:
-            interactions = None
-        else:
-            if self.head != self.tail:
-                interactions = self.buffer[self.head]
-                self.head = (self.head + 1) % self.buffer.max_size
-            else:
-                interactions = self.buffer[self.head]
-                self.set_head_tail(-1, -1, 1)
-        return interactions
+        Returns
+        -------
+        ok : bool
+            False if the queue is full.
 
-    @abstractmethod
-    def enqueue(self, data):
-        pass  # pragma: no cover
+        """
+        max_size = self.buffer.max_size
+        read, write = self._indices()
+        if (write - read) % (2*max_size) == max_size:
+            return False
+        self.buffer[write % max_size] = data
+        self.head_tail_buffer_repr[1] = (write + 1) % (2*max_size)
+        return True
 
-    @abstractmethod
     def dequeue(self):
-        pass  # pragma: no cover
+        """Remove the oldest element of the queue. Must be called only by
+        the consumer.
+
+        Returns
+        -------
+        interactions : ndarray or None
+            None if the queue is empty.
+
+        """
+        read, write = self._indices()
+        if read == write:
+            return None
+        interactions = self.buffer[read % self.buffer.max_size].copy()
+        self.head_tail_buffer_repr[0] = (read + 1) % (2*self.buffer.max_size)
+        return interactions
+
+    def dequeue_many(self, max_items=None):
+        """Remove at once the oldest elements of the queue. Must be called
+        only by the consumer.
+
+        Parameters
+        ----------
+        max_items : int, optional
+            Maximum number of elements to be removed. If None, the queue
+            is emptied.
+
+        Returns
+        -------
+        interactions : ndarray
+            (N, dimension) array with the elements in the order they
+            were enqueued.
+
+        """
+        max_size = self.buffer.max_size
+        read, write = self._indices()
+        num_items = (write - read) % (2*max_size)
+        if max_items is not None:
+            num_items = min(num_items, max_items)
+        slots = (read + np.arange(num_items)) % max_size
+        dimension = self.buffer.dimension
+        data = self.buffer._buffer_repr[0:max_size*dimension].reshape(
+            max_size, dimension)
+        interactions = data[slots]
+        self.head_tail_buffer_repr[0] = (read + num_items) % (2*max_size)
+        return interactions
 
     @abstractmethod
     def load_mem_resource(self):
@@ -416,32 +527,21 @@ class ArrayCircularQueue(GenericCircularQueue):
             self._created = False
 
         self.head_tail_buffer_name = None
-        self.head_tail_buffer_repr = self.head_tail_buffer
-        if self._created:
-            self.set_head_tail(-1, -1, 0)
+        self.head_tail_buffer_repr = np.frombuffer(
+            self.head_tail_buffer.get_obj(), _INT_ShM_TYPE)
 
     def load_mem_resource(self):
         pass  # pragma: no cover
 
     def create_mem_resource(self):
-        # head_tail_arr[0] int; head position
-        # head_tail_arr[1] int; tail position
-        head_tail_arr = np.array([-1, -1, 0], dtype=_INT_ShM_TYPE)
+        # head_tail_arr[0] int; read index
+        # head_tail_arr[1] int; write index
+        # head_tail_arr[2:] int; render latencies
+        head_tail_arr = np.zeros(_HEAD_TAIL_SIZE, dtype=_INT_ShM_TYPE)
         self.head_tail_buffer = multiprocessing.Array(
                     _INT_ShM_TYPE, head_tail_arr,
         )
 
-    def enqueue(self, data):
-        ok = False
-        with self.head_tail_buffer.get_lock():
-            ok = self._enqueue(data)
-        return ok
-
-    def dequeue(self):
-        with self.head_tail_buffer.get_lock():
-            interactions = self._dequeue()
-        return interactions
-
     def cleanup(self):
         pass
 
@@ -485,54 +585,30 @@ class SharedMemCircularQueue(GenericCircularQueue):
             self._created = False
 
         self.head_tail_buffer_repr = np.ndarray(
-                3,
+                _HEAD_TAIL_SIZE,
                 dtype=_INT_ShM_TYPE,
-                buffer=self.head_tail_buffer.buf[0:3*_INT_SIZE])
+                buffer=self.head_tail_buffer.buf[0:_HEAD_TAIL_SIZE*_INT_SIZE])
         logging.info([
             'create shared mem',
             'size repr', self.head_tail_buffer_repr.shape,
             'size buffer', self.head_tail_buffer.size/_INT_SIZE
         ])
         if self._created:
-            self.set_head_tail(-1, -1, 0)
+            self.head_tail_buffer_repr[:] = 0
 
     def load_mem_resource(self):
         self.head_tail_buffer = shared_memory.SharedMemory(
                     self.head_tail_buffer_name)
 
     def create_mem_resource(self):
-        # head_tail_arr[0] int; head position
-        # head_tail_arr[1] int; tail position
-        head_tail_arr = np.array([-1, -1, 0], dtype=_INT_ShM_TYPE)
+        # head_tail_arr[0] int; read index
+        # head_tail_arr[1] int; write index
+        # head_tail_arr[2:] int; render latencies
+        head_tail_arr = np.zeros(_HEAD_TAIL_SIZE, dtype=_INT_ShM_TYPE)
         self.head_tail_buffer = shared_memory.SharedMemory(
                 create=True, size=head_tail_arr.nbytes)
         self.head_tail_buffer_name = self.head_tail_buffer.name
 
-    def is_unlocked(self):
-        return self.head_tail_buffer_repr[2] == 0
-
-    def lock(self):
-        self.head_tail_buffer_repr[2] = 1
-
-    def unlock(self):
-        self.head_tail_buffer_repr[2] = 0
-
-    def enqueue(self, data):
-        ok = False
-        if self.is_unlocked():
-            self.lock()
-            ok = self._enqueue(data)
-            self.unlock()
-        return ok
-
-    def dequeue(self):
-        interactions = None
-        if self.is_unlocked():
-            self.lock()
-            interactions = self._dequeue()
-            self.unlock()
-        return interactions
-
     def cleanup(self):
         self.buffer.cleanup()
         self.head_tail_buffer.close()
@@ -569,7 +645,7 @@ class GenericImageBufferManager(ABC):
         """
         self.max_window_size = np.array(max_window_size)
         self.num_buffers = num_buffers
-        self.info_buffer_size = num_buffers*2 + 2
+        self.info_buffer_size = num_buffers*2 + 4
         self._use_shared_mem = use_shared_mem
         self.max_size = None  # int
         self.num_components = 3
@@ -580,6 +656,14 @@ class GenericImageBufferManager(ABC):
         self.info_buffer = None
         self.info_buffer_repr = None
         self._created = False
+        self._jpeg = None
+        self._jpeg_key = None
+        self.encode_ms = 0
+        # (image, frame_id, {(x, y): tile}) of the last tiled frame,
+        # replaced in a single assignment because get_jpeg_tiles runs in
+        # an encoding thread while get_all_jpeg_tiles can run in the
+        # event loop
+        self._tiles = None
 
         size = (self.max_window_size[0], self.max_window_size[1])
         img = Image.new(
@@ -604,25 +688,69 @@ class GenericImageBufferManager(ABC):
         index = self.info_buffer_repr[1]
         return index
 
-    def write_into(self, w, h, np_arr):
-        buffer_size = buffer_size = int(h*w*3)
+    @property
+    def frame_id(self):
+        """Sequence number of the last frame written into the buffers."""
+        return int(self.info_buffer_repr[-1])
+
+    @property
+    def bottom_up(self):
+        """If the rows of the current frame are stored bottom-up, as
+        OpenGL reads them."""
+        return bool(self.info_buffer_repr[-2])
+
+    def get_next_buffer(self, w, h):
+        """Returns the region of the next buffer where a frame can be
+        written directly, before calling :meth:`swap_buffers`.
+
+        Parameters
+        ----------
+        w : int
+        h : int
+
+        Returns
+        -------
+        ndarray or None
+            A uint8 array with w*h*3 elements sharing the memory of the
+            buffer. None if the frame is bigger than the buffers.
+
+        """
+        buffer_size = int(h*w*3)
+        if buffer_size > self.max_size:
+            return None
+        return self.image_reprs[self.next_buffer_index][0:buffer_size]
+
+    def swap_buffers(self, w, h, bottom_up=True):
+        """Makes the frame written into the next buffer the current one.
+
+        Parameters
+        ----------
+        w : int
+        h : int
+        bottom_up : bool, optional
+            If the rows of the frame are stored bottom-up.
+
+        """
         next_buffer_index = self.next_buffer_index
+        self.info_buffer_repr[2+next_buffer_index*2] = w
+        self.info_buffer_repr[2+next_buffer_index*2+1] = h
+        self.info_buffer_repr[1] = next_buffer_index
+        self.info_buffer_repr[-2] = int(bottom_up)
+        # the last element stores the frame sequence number
+        self.info_buffer_repr[-1] += 1
 
-        if buffer_size == self.max_size:
-            self.image_reprs[
-                next_buffer_index][:] = np_arr
-        elif buffer_size < self.max_size:
-            self.image_reprs[
-                    next_buffer_index][0:buffer_size] = np_arr
-        else:
+    def write_into(self, w, h, np_arr, bottom_up=True):
+        buffer = self.get_next_buffer(w, h)
+        if buffer is None:
             self.image_reprs[
-                next_buffer_index][0:self.max_size] = self.img_exceed
+                self.next_buffer_index][0:self.max_size] = self.img_exceed
             w = self.max_window_size[0]
             h = self.max_window_size[1]
+            bottom_up = True
+        else:
+            buffer[:] = np_arr
 
-        self.info_buffer_repr[2+next_buffer_index*2] = w
-        self.info_buffer_repr[2+next_buffer_index*2+1] = h
-        self.info_buffer_repr[1] = next_buffer_index
+        self.swap_buffers(w, h, bottom_up)
 
     def get_current_frame(self):
         """Get the current frame from the buffer.
@@ -643,30 +771,198 @@ class GenericImageBufferManager(ABC):
 
         return self.width, self.height, image
 
-    def get_jpeg(self):
-        """Returns a jpeg image from the buffer.
+    def _copy_current_frame(self, copy):
+        """Returns copy(width, height, image, bottom_up) of the current
+        frame.
+
+        The writer overwrites the buffer of a frame after its next swap,
+        so a frame is copied out of the buffers before being encoded, and
+        copied again if a new frame was written during the copy.
 
-        Returns:
-            bytes: jpeg image.
         """
-        width, height, image = self.get_current_frame()
+        for _ in range(_COPY_ATTEMPTS):
+            frame_id = self.frame_id
+            width, height, image = self.get_current_frame()
+
+            if self._use_shared_mem:
+                image = np.frombuffer(
+                    image, _BYTE_ShM_TYPE)
+
+            frame = copy(width, height, image[0:width*height*3],
+                         self.bottom_up)
+            if self.frame_id == frame_id:
+                break
+        return frame
+
+    def _get_current_image(self):
+        """Returns a copy of the current frame as a (height, width, 3)
+        array in the top-down row order expected by the image encoders."""
+        def copy(width, height, image, bottom_up):
+            image = image.reshape((height, width, 3))
+            if bottom_up:
+                image = np.flipud(image)
+            return image.copy()
+
+        return self._copy_current_frame(copy)
+
+    def _get_current_pil_image(self):
+        """Returns a copy of the current frame as a PIL image."""
+        def copy(width, height, image, bottom_up):
+            # Pillow can't share the memory of RGB pixels, it copies them
+            orientation = -1 if bottom_up else 1
+            return Image.frombuffer(
+                'RGB', (width, height), image, 'raw', 'RGB', 0, orientation)
+
+        return self._copy_current_frame(copy)
+
+    def get_jpeg(self, quality=None, scale=1):
+        """Returns a jpeg image from the buffer.
+
+        The last encoded image is reused while no new frame has been
+        written into the buffers.
+
+        Parameters
+        ----------
+        quality : int, optional
+            Jpeg quality, from 1 to 95. If None, the default quality of
+            Pillow is used.
+        scale : int, optional
+            Downsampling factor applied to the frame before the encoding.
 
-        if self._use_shared_mem:
-            image = np.frombuffer(
-                image, _BYTE_ShM_TYPE)
+        Returns
+        -------
+        bytes
+            jpeg image.
 
-        image = image[0:width*height*3].reshape(
-                (height, width, 3))
-        image = np.flipud(image)
-        image_encoded = Image.fromarray(image, mode="RGB")
-        bytes_img_data = io.BytesIO()
-        image_encoded.save(bytes_img_data, format='jpeg')
-        bytes_img = bytes_img_data.getvalue()
+        """
+        frame_id = self.frame_id
+        key = (frame_id, quality, scale)
+        if self._jpeg is not None and key == self._jpeg_key:
+            return self._jpeg
+
+        start = time.perf_counter()
+        image = self._get_current_pil_image()
+        if scale > 1:
+            image = image.reduce(scale)
+        bytes_img = _encode_jpeg(image, quality)
+        self.encode_ms = (time.perf_counter() - start)*1000
+        self._jpeg = bytes_img
+        self._jpeg_key = key
 
         return bytes_img
 
-    async def async_get_jpeg(self, ms=33):
-        jpeg = self.get_jpeg()
+    def get_jpeg_tiles(self, tile_size=64):
+        """Returns the jpeg images of the tiles that changed since the
+        last call.
+
+        The current frame is compared with the previous one in square
+        tiles and only the tiles with at least one different pixel are
+        encoded. Every tile is encoded for the first frame and after a
+        resize of the window.
+
+        Parameters
+        ----------
+        tile_size : int, optional
+            Size in pixels of the side of the tiles.
+
+        Returns
+        -------
+        width : int
+            Width of the frame.
+        height : int
+            Height of the frame.
+        tiles : list of tuples
+            (x, y, w, h, jpeg) for each changed tile, where (x, y) is the
+            top-left corner of the tile in the frame. The list is empty
+            if no new frame was written into the buffers.
+
+        """
+        frame_id = self.frame_id
+        state = self._tiles
+        if state is not None and frame_id == state[1]:
+            height, width = state[0].shape[:2]
+            return width, height, []
+
+        start = time.perf_counter()
+        image = self._get_current_image()
+        height, width = image.shape[:2]
+        ny = -(-height // tile_size)
+        nx = -(-width // tile_size)
+        if state is None or state[0].shape != image.shape:
+            jpeg_tiles = {}
+            changed = np.ones((ny, nx), dtype=bool)
+        else:
+            previous, _, previous_tiles = state
+            jpeg_tiles = dict(previous_tiles)
+            diff = np.any(image != previous, axis=2)
+            padded = np.zeros((ny*tile_size, nx*tile_size), dtype=bool)
+            padded[:height, :width] = diff
+            changed = padded.reshape(
+                ny, tile_size, nx, tile_size).any(axis=(1, 3))
+
+        tiles = []
+        for j, i in zip(*np.nonzero(changed)):
+            x, y = int(i*tile_size), int(j*tile_size)
+            tile = image[y:y+tile_size, x:x+tile_size]
+            tile = (x, y, tile.shape[1], tile.shape[0], _encode_jpeg(tile))
+            jpeg_tiles[(x, y)] = tile
+            tiles.append(tile)
+
+        self._tiles = (image, frame_id, jpeg_tiles)
+        self.encode_ms = (time.perf_counter() - start)*1000
+        return width, height, tiles
+
+    def get_all_jpeg_tiles(self):
+        """Returns the jpeg images of all the tiles of the last frame
+        processed by :meth:`get_jpeg_tiles`.
+
+        This allows a new client to composite the full frame before
+        receiving only the changed tiles.
+
+        Returns
+        -------
+        width : int
+            Width of the frame.
+        height : int
+            Height of the frame.
+        tiles : list of tuples
+            (x, y, w, h, jpeg) for each tile of the frame.
+
+        """
+        state = self._tiles
+        if state is None:
+            return 0, 0, []
+        image, _, jpeg_tiles = state
+        height, width = image.shape[:2]
+        return width, height, list(jpeg_tiles.values())
+
+    async def async_get_jpeg(
+            self, ms=33, executor=None, quality=None, scale=1):
+        """Returns a jpeg image from the buffer without blocking the
+        event loop.
+
+        Parameters
+        ----------
+        ms : float, optional
+            The amount of miliseconds to wait after the encoding.
+        executor : concurrent.futures.Executor, optional
+            Executor running the encoding. If None, the default executor
+            of the event loop is used.
+        quality : int, optional
+            Jpeg quality, from 1 to 95. If None, the default quality of
+            Pillow is used.
+        scale : int, optional
+            Downsampling factor applied to the frame before the encoding.
+
+        Returns
+        -------
+        bytes
+            jpeg image.
+
+        """
+        loop = asyncio.get_running_loop()
+        jpeg = await loop.run_in_executor(
+            executor, self.get_jpeg, quality, scale)
         await asyncio.sleep(ms/1000)
         return jpeg
 
@@ -736,10 +1032,13 @@ class RawArrayImageBufferManager(GenericImageBufferManager):
         # 1 id buffer
         # 2, 3, width first buffer, height first buffer
         # 4, 5, width second buffer , height second buffer
+        # last - 1, 1 if the rows of the frames are stored bottom-up
+        # last, frame sequence number
         info_list = [3, 0]
         for _ in range(self.num_buffers):
             info_list += [self.max_window_size[0]]
             info_list += [self.max_window_size[1]]
+        info_list += [1, 0]
         info_list = np.array(
             info_list, dtype=_UINT_ShM_TYPE
         )
@@ -812,10 +1111,11 @@ class SharedMemImageBufferManager(GenericImageBufferManager):
                     buffer=buffer.buf))
             self.image_buffer_names.append(buffer.name)
 
-        info_list = [2+self.num_buffers*2, 1, 3, 0]
+        info_list = [self.info_buffer_size, 1, 3, 0]
         for _ in range(self.num_buffers):
             info_list += [self.max_window_size[0]]
             info_list += [self.max_window_size[1]]
+        info_list += [1, 0]
         info_list = np.array(
             info_list, dtype=_UINT_ShM_TYPE
         )
@@ -883,6 +1183,210 @@ class SharedMemImageBufferManager(GenericImageBufferManager):
                     print(f'Shared Memory {name}(buffer image) File not found')
 
 
+class StreamMetrics:
+    """This obj. stores the counters and the timings of the streaming
+    system.
+
+    Counters only grow, gauges store the last value set and timings keep
+    a window of the most recent samples, summarized by percentiles.
+    """
+    def __init__(self, window_size=1000):
+        """
+
+        Parameters
+        ----------
+        window_size : int, optional
+            Number of recent samples kept for each timing.
+
+        """
+        self.window_size = window_size
+        self.counters = {}
+        self.gauges = {}
+        self.timings = {}
+        self.clients = {}
+
+    def increment(self, name, value=1):
+        self.counters[name] = self.counters.get(name, 0) + value
+
+    def set(self, name, value):
+        self.gauges[name] = value
+
+    def observe(self, name, value):
+        if name not in self.timings:
+            self.timings[name] = deque(maxlen=self.window_size)
+        self.timings[name].append(value)
+
+    def add_client_data(self, client, num_bytes):
+        """Register the data sent to a client.
+
+        Parameters
+        ----------
+        client : str
+        num_bytes : int
+
+        """
+        stats = self.clients.setdefault(
+            client, {'bytes_sent': 0, 'frames_sent': 0})
+        stats['bytes_sent'] += num_bytes
+        stats['frames_sent'] += 1
+        self.increment('bytes_sent', num_bytes)
+
+    def remove_client(self, client):
+        self.clients.pop(client, None)
+
+    def summary(self, name):
+        """Summarize the recent samples of a timing.
+
+        Returns
+        -------
+        summary : dict
+            count, mean, p50, p90, p99 and max of the samples.
+
+        """
+        samples = np.array(self.timings.get(name, []), dtype=float)
+        if len(samples) == 0:
+            return {'count': 0}
+        p50, p90, p99 = np.percentile(samples, [50, 90, 99])
+        return {
+            'count': len(samples), 'mean': float(samples.mean()),
+            'p50': float(p50), 'p90': float(p90), 'p99': float(p99),
+            'max': float(samples.max())}
+
+    def as_dict(self):
+        """Return all the metrics as a JSON serializable dict."""
+        return {
+            'counters': dict(self.counters),
+            'gauges': dict(self.gauges),
+            'timings': {name: self.summary(name) for name in self.timings},
+            'clients': {
+                client: dict(stats)
+                for client, stats in self.clients.items()},
+        }
+
+
+class AdaptiveQualityController:
+    """This obj. chooses the jpeg quality and the downsampling of the
+    streamed frames according to the load of the streaming system.
+
+    While the user is interacting, each time the encoding takes longer
+    than the target, the interaction events pile up in the queue or the
+    delay of the user events grows, the jpeg quality is lowered and, once
+    the minimum quality is reached, the frames are downsampled. When the
+    load decreases the steps are undone in the reverse order, and the full
+    quality is restored as soon as the user stops interacting.
+    """
+    def __init__(
+            self, max_quality=90, min_quality=30, quality_step=15,
+            max_scale=4, target_ms=20, max_delay_ms=100, idle_ms=250):
+        """
+
+        Parameters
+        ----------
+        max_quality : int, optional
+            Jpeg quality used when the user is idle.
+        min_quality : int, optional
+            Lowest jpeg quality used before downsampling the frames.
+        quality_step : int, optional
+            Amount of jpeg quality changed at each adaptation.
+        max_scale : int, optional
+            Highest downsampling factor of the frames.
+        target_ms : float, optional
+            Maximum encoding time of a frame, in miliseconds.
+        max_delay_ms : float, optional
+            Maximum delay of the user events, in miliseconds.
+        idle_ms : float, optional
+            Time without user events after which the user is
+            considered idle, in miliseconds.
+
+        """
+        self.max_quality = max_quality
+        self.min_quality = min_quality
+        self.quality_step = quality_step
+        self.max_scale = max_scale
+        self.target_ms = target_ms
+        self.max_delay_ms = max_delay_ms
+        self.idle_ms = idle_ms
+        self.quality = max_quality
+        self.scale = 1
+        self.encode_ms = 0
+        self.delay_ms = 0
+        self.queue_size = 0
+        self._min_delay = None
+        self._last_interaction = None
+        self._measured = False
+
+    @property
+    def interacting(self):
+        if self._last_interaction is None:
+            return False
+        idle = (time.time() - self._last_interaction)*1000
+        return idle < self.idle_ms
+
+    def update_interaction(self, user_timestamp, queue_size=0):
+        """Register a user event.
+
+        Parameters
+        ----------
+        user_timestamp : float
+            Time in miliseconds when the user created the event.
+        queue_size : int, optional
+            Number of events waiting to be processed.
+
+        """
+        now = time.time()
+        self._last_interaction = now
+        delay = now*1000 - user_timestamp
+        # the clocks of the browser and of the server can differ, so just
+        # the delay in excess of the smallest one observed is considered
+        if self._min_delay is None or delay < self._min_delay:
+            self._min_delay = delay
+        self.delay_ms = delay - self._min_delay
+        self.queue_size = queue_size
+
+    def update_encoding(self, encode_ms):
+        """Register the time spent encoding a frame.
+
+        Parameters
+        ----------
+        encode_ms : float
+
+        """
+        self.encode_ms = encode_ms
+        self._measured = True
+
+    def adapt(self):
+        """Update the quality and the downsampling factor.
+
+        Returns
+        -------
+        quality : int
+        scale : int
+
+        """
+        if not self.interacting:
+            self.quality = self.max_quality
+            self.scale = 1
+        elif self._measured:
+            self._measured = False
+            overloaded = self.encode_ms > self.target_ms or \
+                self.queue_size > 1 or self.delay_ms > self.max_delay_ms
+            underloaded = self.encode_ms < self.target_ms/2 and \
+                self.queue_size <= 1 and self.delay_ms < self.max_delay_ms/2
+            if overloaded:
+                if self.quality > self.min_quality:
+                    self.quality = max(
+                        self.min_quality, self.quality - self.quality_step)
+                elif self.scale < self.max_scale:
+                    self.scale += 1
+            elif underloaded:
+                if self.scale > 1:
+                    self.scale -= 1
+                elif self.quality < self.max_quality:
+                    self.quality = min(
+                        self.max_quality, self.quality + self.quality_step)
+        return self.quality, self.scale
+
+
 class IntervalTimerThreading:
     """Implements a object with the same behavior of setInterval from Js
     """
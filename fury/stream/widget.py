@@ -49,7 +49,7 @@ class Widget:
             ms_interaction=33,
             host='localhost', port=None,
             encoding='mjpeg', ms_jpeg=33,
-            queue_size=20):
+            queue_size=20, tile_size=64, adaptive_quality=False):
         """
         Parameters
         ----------
@@ -61,13 +61,19 @@ class Widget:
         host : str, optional
         port : int, optional
         encoding : str, optional
-            If should use MJPEG streaming or WebRTC.
+            If should use MJPEG streaming, WebRTC or MJPEG tiles, where
+            only the tiles of the frame that changed are sent.
         ms_jpeg : float, optional
             This it's used  only if the MJPEG will be used. The
             ms_jpeg represents the amount of miliseconds between to
             consecutive calls of the jpeg enconding.
         queue_size : int, optional
             maximum number of user interactions to be stored
+        tile_size : int, optional
+            Size in pixels of the tiles used by the tiles encoding.
+        adaptive_quality : bool, optional
+            If the MJPEG quality and resolution should be lowered while
+            the user interacts under load.
 
         """
         if not PY_VERSION_8:
@@ -91,6 +97,8 @@ class Widget:
         self._server_started = False
         self.pserver = None
         self.encoding = encoding
+        self.tile_size = tile_size
+        self.adaptive_quality = adaptive_quality
         self.showm.window.SetOffScreenRendering(1)
         self.showm.iren.EnableRenderOff()
 
@@ -111,10 +119,13 @@ class Widget:
         s += f"{self.stream_interaction.circular_queue.head_tail_buffer_name}'"
         s += ",queue_buffer_name='"
         s += f"{self.stream_interaction.circular_queue.buffer.buffer_name}'"
-        if self.encoding == 'mjpeg':
+        if self.encoding in ['mjpeg', 'tiles']:
             s += ",provides_mjpeg=True"
             s += f",ms_jpeg={self.ms_jpeg}"
             s += ",provides_webrtc=False"
+            s += f",adaptive_quality={self.adaptive_quality}"
+        if self.encoding == 'tiles':
+            s += f",tile_size={self.tile_size}"
         s += f",port={self._port},host='{self._host}',"
         s += "avoid_unlink_shared_mem=True"
         s += ")"
@@ -145,7 +156,8 @@ class Widget:
             use_raw_array=False)
 
         self.stream_interaction.start(
-            ms=self.ms_interaction, use_asyncio=use_asyncio)
+            ms=self.ms_interaction, use_asyncio=use_asyncio,
+            ms_render=self.ms_stream)
         self.stream.start(self.ms_stream, use_asyncio=use_asyncio)
         self._server_started = True
         self.pserver = None
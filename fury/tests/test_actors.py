@@ -11,6 +11,7 @@ from fury import shaders
 from fury import actor, window, primitive as fp
 from fury.actor import grid
 from fury.decorators import skip_osx, skip_win, skip_linux
+from fury.lib import numpy_support
 from fury.utils import shallow_copy, rotate, primitives_count_from_actor
 from fury.testing import assert_greater, assert_greater_equal, \
     assert_less_equal, assert_not_equal, assert_equal
@@ -345,6 +346,52 @@ def test_streamtube_and_line_actors():
     npt.assert_equal(c3.GetProperty().GetRenderLinesAsTubes(), True)
 
 
+def test_tube_impostor(interactive=False):
+    scene = window.Scene()
+    scene.background((1, 1, 1))
+
+    line1 = np.array([[0, 0, 0], [1, 1, 1], [2, 2, 2.]])
+    line2 = line1 + np.array([1.5, 0., 0.])
+    lines = [line1, line2]
+    colors = np.array([[1, 0, 0], [0, 0, 1.]])
+
+    tubes = actor.tube_impostor(lines, colors, radii=[.1, .2])
+    radii = tubes.GetMapper().GetInput().GetPointData().GetArray('radius')
+    npt.assert_array_equal(numpy_support.vtk_to_numpy(radii),
+                           [.1, .1, .1, .2, .2, .2])
+    mapper_code = tubes.GetShaderProperty().GetGeometryShaderCode()
+    npt.assert_equal(mapper_code,
+                     shaders.import_fury_shader('tube_impostor.geom'))
+
+    point_radii = np.linspace(.1, .3, 6)
+    tubes = actor.tube_impostor(lines, colors, radii=point_radii)
+    radii = tubes.GetMapper().GetInput().GetPointData().GetArray('radius')
+    npt.assert_array_equal(numpy_support.vtk_to_numpy(radii), point_radii)
+
+    scene.add(tubes)
+    if interactive:
+        window.show(scene)
+
+    arr = window.snapshot(scene)
+    report = window.analyze_snapshot(arr, colors=[(255, 0, 0), (0, 0, 255)],
+                                     find_objects=True)
+    npt.assert_equal(report.objects, 2)
+    npt.assert_equal(report.colors_found, [True, True])
+
+    # the radii follow the scale of the actor: scaling the actor and the
+    # camera position by the same factor gives the same image
+    scene.reset_camera()
+    arr = window.snapshot(scene)
+    camera = scene.GetActiveCamera()
+    tubes.SetScale(2, 2, 2)
+    camera.SetPosition(2 * np.asarray(camera.GetPosition()))
+    camera.SetFocalPoint(2 * np.asarray(camera.GetFocalPoint()))
+    scene.reset_clipping_range()
+    scaled_arr = window.snapshot(scene)
+    npt.assert_allclose(np.count_nonzero(scaled_arr.min(axis=-1) < 255),
+                        np.count_nonzero(arr.min(axis=-1) < 255), rtol=.02)
+
+
 def simulated_bundle(no_streamlines=10, waves=False):
     t = np.linspace(20, 80, 200)
     # parallel waves or parallel lines
@@ -1568,6 +1615,12 @@ def test_actors_primitives_count():
         [actor.cone, {**args_3, 'use_primitive': True}, cen_c],
         [actor.arrow, {**args_3, 'repeat_primitive': False}, cen_c],
         [actor.arrow, {**args_3, 'repeat_primitive': True}, cen_c],
+        [actor.box, {**args_1, 'instanced': True}, cen_c],
+        [actor.square, {**args_1, 'instanced': True}, cen_c],
+        [actor.sphere, {**args_2, 'instanced': True}, cen_c],
+        [actor.cone, {**args_3, 'instanced': True}, cen_c],
+        [actor.arrow, {**args_3, 'instanced': True}, cen_c],
+        [actor.frustum, {**args_1, 'instanced': True}, cen_c],
         [actor.dot, {'points': centers}, cen_c],
         [actor.point, {'points': centers, 'colors': colors}, cen_c],
         [actor.line, {'lines': lines}, lin_c],
@@ -1579,3 +1632,19 @@ def test_actors_primitives_count():
         primitives_count = test_case[2]
         act = act_func(**args)
         npt.assert_equal(primitives_count_from_actor(act), primitives_count)
+
+
+def test_instanced_arrow_vertices():
+    centers = np.array([[1, 1, 1], [2, 2, 2]])
+    directions = np.array([[1, 0, 0], [0, 1, 0]])
+    verts, faces = fp.prim_cone()
+
+    arrow_actor = actor.arrow(centers, directions, (1, 0, 0),
+                              vertices=verts, faces=faces, instanced=True)
+    source = arrow_actor.GetMapper().GetSource()
+    npt.assert_array_equal(
+        numpy_support.vtk_to_numpy(source.GetPoints().GetData()), verts)
+
+    arrow_actor = actor.arrow(centers, directions, (1, 0, 0), instanced=True)
+    source = arrow_actor.GetMapper().GetSource()
+    npt.assert_equal(source.GetNumberOfPoints(), len(fp.prim_arrow()[0]))
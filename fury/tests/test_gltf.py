@@ -1,4 +1,6 @@
 import os
+import time
+from tempfile import TemporaryDirectory as InTemporaryDirectory
 import numpy as np
 import numpy.testing as npt
 import itertools
@@ -103,60 +105,138 @@ def test_orientation():
 
 
 def test_export_gltf():
+    with InTemporaryDirectory() as tdir:
+        fname = os.path.join(tdir, 'test.gltf')
+        scene = window.Scene()
+
+        centers = np.zeros((3, 3))
+        colors = np.array([1, 1, 1])
+
+        cube = actor.cube(np.add(centers, np.array([2, 0, 0])), colors=colors)
+        scene.add(cube)
+        export_scene(scene, fname)
+        gltf_obj = glTF(fname)
+        actors = gltf_obj.actors()
+        npt.assert_equal(len(actors), 1)
+
+        sphere = actor.sphere(centers, np.array([1, 0, 0]), use_primitive=False)
+        scene.add(sphere)
+        export_scene(scene, fname)
+        gltf_obj = glTF(fname)
+        actors = gltf_obj.actors()
+
+        scene.clear()
+        scene.add(*actors)
+        npt.assert_equal(len(actors), 2)
+
+        scene.set_camera(position=(150.0, 10.0, 10.0), focal_point=(0.0, 0.0, 0.0),
+                         view_up=(0.0, 0.0, 1.0))
+        export_scene(scene, fname)
+        gltf_obj = glTF(fname)
+        actors = gltf_obj.actors()
+
+        scene.clear()
+        scene.add(*actors)
+        display = window.snapshot(scene)
+        res = window.analyze_snapshot(display)
+        npt.assert_equal(res.objects, 1)
+
+        scene.reset_camera_tight()
+        scene.clear()
+
+        fetch_gltf('BoxTextured', 'glTF')
+        filename = read_viz_gltf('BoxTextured')
+        gltf_obj = glTF(filename)
+        box_actor = gltf_obj.actors()
+        scene.add(* box_actor)
+        export_scene(scene, fname)
+        scene.clear()
+
+        gltf_obj = glTF(fname)
+        actors = gltf_obj.actors()
+        scene.add(* actors)
+
+        display = window.snapshot(scene)
+        res = window.analyze_snapshot(display, bg_color=(0, 0, 0),
+                                      colors=[(108, 173, 223), (92, 135, 39)],
+                                      find_objects=False)
+        npt.assert_equal(res.colors_found, [True, True])
+        del gltf_obj
+
+
+def test_buffer_cache():
     scene = window.Scene()
+    centers = np.array([[0, 0, 0], [2, 0, 0]])
+    scene.add(actor.box(centers, colors=np.array([1, 0, 0]), scales=1))
 
-    centers = np.zeros((3, 3))
-    colors = np.array([1, 1, 1])
+    with InTemporaryDirectory() as tdir:
+        fname = os.path.join(tdir, 'test.gltf')
+        export_scene(scene, fname)
+        gltf_obj = glTF(fname)
 
-    cube = actor.cube(np.add(centers, np.array([2, 0, 0])), colors=colors)
-    scene.add(cube)
-    export_scene(scene, 'test.gltf')
-    gltf_obj = glTF('test.gltf')
-    actors = gltf_obj.actors()
-    npt.assert_equal(len(actors), 1)
+        buff_data = gltf_obj.get_buffer(0)
+        npt.assert_equal(isinstance(buff_data, np.memmap), True)
+        npt.assert_equal(gltf_obj.get_buffer(0) is buff_data, True)
 
-    sphere = actor.sphere(centers, np.array([1, 0, 0]), use_primitive=False)
-    scene.add(sphere)
-    export_scene(scene, 'test.gltf')
-    gltf_obj = glTF('test.gltf')
-    actors = gltf_obj.actors()
+        vertices = utils.get_polydata_vertices(gltf_obj.polydatas[0])
+        npt.assert_equal(vertices.shape, (16, 3))
+        npt.assert_almost_equal(vertices.min(axis=0), [-0.5, -0.5, -0.5])
+        npt.assert_almost_equal(vertices.max(axis=0), [2.5, 0.5, 0.5])
+        del buff_data, gltf_obj
 
-    scene.clear()
-    scene.add(*actors)
-    npt.assert_equal(len(actors), 2)
-
-    scene.set_camera(position=(150.0, 10.0, 10.0), focal_point=(0.0, 0.0, 0.0),
-                     view_up=(0.0, 0.0, 1.0))
-    export_scene(scene, 'test.gltf')
-    gltf_obj = glTF('test.gltf')
-    actors = gltf_obj.actors()
-
-    scene.clear()
-    scene.add(*actors)
-    display = window.snapshot(scene)
-    res = window.analyze_snapshot(display)
-    npt.assert_equal(res.objects, 1)
 
-    scene.reset_camera_tight()
-    scene.clear()
-
-    fetch_gltf('BoxTextured', 'glTF')
-    filename = read_viz_gltf('BoxTextured')
-    gltf_obj = glTF(filename)
-    box_actor = gltf_obj.actors()
-    scene.add(* box_actor)
-    export_scene(scene, 'test.gltf')
-    scene.clear()
-
-    gltf_obj = glTF('test.gltf')
-    actors = gltf_obj.actors()
-    scene.add(* actors)
-
-    display = window.snapshot(scene)
-    res = window.analyze_snapshot(display, bg_color=(0, 0, 0),
-                                  colors=[(108, 173, 223), (92, 135, 39)],
-                                  find_objects=False)
-    npt.assert_equal(res.colors_found, [True, True])
+def test_lazy_parallel_loading():
+    rgb = np.zeros((64, 64, 3), dtype=np.uint8)
+    rgb[:32] = [255, 0, 0]
+    scene = window.Scene()
+    scene.add(actor.texture(rgb))
+
+    with InTemporaryDirectory() as tdir:
+        fname = os.path.join(tdir, 'test.gltf')
+        export_scene(scene, fname)
+
+        gltf_obj = glTF(fname, max_workers=2)
+        npt.assert_equal(len(gltf_obj.polydatas), 1)
+        textured = gltf_obj.actors()[0]
+        npt.assert_equal(textured.GetTexture() is None, False)
+
+        gltf_obj = glTF(fname, max_workers=2, lazy=True)
+        npt.assert_equal(len(gltf_obj.polydatas), 0)
+        actors = gltf_obj.actors()
+        npt.assert_equal(len(gltf_obj.polydatas), 1)
+        npt.assert_equal(len(actors), 1)
+
+        deadline = time.time() + 30
+        while gltf_obj.update_textures() and time.time() < deadline:
+            time.sleep(0.01)
+        npt.assert_equal(gltf_obj.update_textures(), 0)
+        texture = actors[0].GetTexture()
+        npt.assert_equal(texture is None, False)
+
+        # actors created by another call get the textures too
+        npt.assert_equal(gltf_obj.actors()[1].GetTexture(), texture)
+
+        gltf_obj = glTF(fname, max_workers=2, lazy=True)
+        actors = [gltf_obj.actors()[0], gltf_obj.actors()[1]]
+        deadline = time.time() + 30
+        while gltf_obj.update_textures() and time.time() < deadline:
+            time.sleep(0.01)
+        npt.assert_equal([act.GetTexture() is None for act in actors],
+                         [False, False])
+        texture = actors[0].GetTexture()
+        npt.assert_equal(texture is None, False)
+        npt.assert_equal(texture.GetInput().GetDimensions(),
+                         textured.GetTexture().GetInput().GetDimensions())
+
+        # the decoding threads stop once the textures are decoded, even
+        # if the actors are never created
+        gltf_obj = glTF(fname, max_workers=2, lazy=True)
+        threads = gltf_obj._executor._threads
+        deadline = time.time() + 30
+        while any(t.is_alive() for t in threads) and time.time() < deadline:
+            time.sleep(0.01)
+        npt.assert_equal([t.is_alive() for t in threads],
+                         [False] * len(threads))
 
 
 def test_simple_animation():
@@ -282,6 +362,35 @@ def test_skinning():
     showm.destroy_timer(timer_id)
 
 
+def test_apply_skin_matrix():
+    fetch_gltf('Box', 'glTF')
+    file = read_viz_gltf('Box', 'glTF')
+    gltf_obj = glTF(file)
+    vertices = utils.get_polydata_vertices(gltf_obj.polydatas[0])
+    n_vertices = len(vertices)
+
+    rng = np.random.default_rng(42)
+    gltf_obj.bones = [3, 5, 8]
+    joints = rng.integers(0, 3, size=(n_vertices, 4)).astype(np.ushort)
+    weights = rng.random((n_vertices, 4))
+    weights /= weights.sum(axis=1, keepdims=True)
+    gltf_obj.joints_0 = [joints]
+    gltf_obj.weights_0 = [weights]
+    joint_matrices = {bone: rng.random((4, 4)) for bone in gltf_obj.bones}
+
+    skinned = gltf_obj.apply_skin_matrix(vertices, joint_matrices)
+
+    expected = np.zeros_like(vertices)
+    for i, xyz in enumerate(vertices):
+        skin_mat = sum(weights[i, j] *
+                       joint_matrices[gltf_obj.bones[joints[i, j]]]
+                       for j in range(4))
+        expected[i] = np.dot(skin_mat, np.append(xyz, 1))[:3]
+
+    npt.assert_equal(skinned.shape, vertices.shape)
+    npt.assert_almost_equal(skinned, expected, decimal=5)
+
+
 def test_morphing():
     fetch_gltf('MorphStressTest', 'glTF')
     file = read_viz_gltf('MorphStressTest')
@@ -231,6 +231,27 @@ def test_repeat_primitive():
     np.testing.assert_equal(np.mean(big_vert_origin), 0)
 
 
+def test_repeat_primitive_directions():
+    verts, faces = fp.prim_arrow()
+    centers = np.zeros((4, 3))
+    dirs = np.array([[0, 2, 0], [0, 0, 0], [1, 1, 1], [1, 0, 0]])
+
+    rot_mats = fp._rotation_matrices_from_directions(dirs)
+    npt.assert_equal(rot_mats.shape, (4, 3, 3))
+    unit_dirs = np.array([[0, 1, 0], [1, 0, 0], [1, 1, 1] / np.sqrt(3),
+                          [1, 0, 0]])
+    npt.assert_array_almost_equal(rot_mats[:, :, 0], unit_dirs)
+    npt.assert_array_almost_equal(rot_mats[1], np.identity(3))
+    npt.assert_array_almost_equal(rot_mats[3], np.identity(3))
+    for mat in rot_mats:
+        npt.assert_array_almost_equal(mat.dot(mat.T), np.identity(3))
+
+    big_verts, _, _, _ = fp.repeat_primitive(verts, faces, centers=centers,
+                                             directions=dirs)
+    expected = np.concatenate([verts.dot(mat.T) for mat in rot_mats])
+    npt.assert_array_almost_equal(big_verts, expected)
+
+
 def test_repeat_primitive_function():
     # init variables
     centers = np.array([[0, 0, 0], [5, 0, 0], [10, 0, 0]])
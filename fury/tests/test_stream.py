@@ -1,4 +1,6 @@
+import io
 import time
+import threading
 import numpy as np
 import numpy.testing as npt
 import sys
@@ -6,6 +8,7 @@ from unittest import mock
 from importlib import reload
 import asyncio
 import pytest
+from aiohttp import test_utils
 
 if sys.version_info.minor >= 8:
     PY_VERSION_8 = True
@@ -13,10 +16,16 @@ else:
     PY_VERSION_8 = False
 
 from fury import actor, window
+from fury.lib import (Camera, InteractorStyleTrackballCamera,
+                      RenderWindowInteractor)
 from fury.stream import tools
 from fury.stream.client import FuryStreamClient, FuryStreamInteraction
+from fury.stream.client import coalesce_events, FuryStreamSessions
+from fury.stream.client import callback_stream_client
 from fury.stream.constants import _CQUEUE
 from fury.stream.server.async_app import WEBRTC_AVAILABLE, set_mouse, set_weel, set_mouse_click
+from fury.stream.server.async_app import MJPEGBroadcaster, TilesBroadcaster
+from fury.stream.server.async_app import get_app
 from fury.stream.server.main import RTCServer, web_server, web_server_raw_array
 from fury.stream.widget import Widget, check_port_is_available
 
@@ -339,6 +348,35 @@ def test_stream_client_conditions():
         test(False, 0, True)
 
 
+def test_stream_client_captures_modified_scene():
+    width, height = 100, 200
+    actors = actor.sphere(
+        np.zeros((1, 3)), colors=np.array([[1, 0, 0]]), radii=.5)
+    scene = window.Scene()
+    scene.add(actors)
+    showm = window.ShowManager(scene, size=(width, height))
+    stream = FuryStreamClient(showm, whithout_iren_start=True)
+    img_buffer_manager = stream.img_manager
+
+    def current_colors():
+        w, h, frame = img_buffer_manager.get_current_frame()
+        image = np.frombuffer(frame, 'uint8')[0:w*h*3].reshape((h, w, 3))
+        report = window.analyze_snapshot(
+            image, colors=[(255, 0, 0)], find_objects=False)
+        return report.colors_found
+
+    showm.render()
+    stream.start(16)
+    npt.assert_equal(current_colors(), [True])
+    stream.stop()
+    # the timer captures the changes made without rendering the window
+    actors.GetProperty().SetColor(0, 0, 1)
+    actors.GetMapper().ScalarVisibilityOff()
+    callback_stream_client(stream)
+    npt.assert_equal(current_colors(), [False])
+    stream.cleanup()
+
+
 def test_stream_client_resize():
     width_0 = 100
     height_0 = 200
@@ -716,11 +754,241 @@ def test_circular_queue():
         assert ok
         queue_sh.cleanup()
         queue.cleanup()
+
+    def test_many(use_raw_array=True):
+        max_size = 4
+        dimension = 2
+        if use_raw_array:
+            queue = tools.ArrayCircularQueue(
+                max_size=max_size, dimension=dimension
+            )
+        else:
+            queue = tools.SharedMemCircularQueue(
+                max_size=max_size, dimension=dimension
+            )
+        assert queue.dequeue_many().shape == (0, dimension)
+        # wraps around the end of the buffer
+        for i in range(3):
+            assert queue.enqueue(np.array([i, i], dtype='d'))
+        npt.assert_equal(queue.dequeue(), [0, 0])
+        for i in range(3, 5):
+            assert queue.enqueue(np.array([i, i], dtype='d'))
+        assert not queue.enqueue(np.array([5, 5], dtype='d'))
+        assert queue.size == 4
+        npt.assert_equal(queue.dequeue_many(3)[:, 0], [1, 2, 3])
+        assert queue.enqueue(np.array([5, 5], dtype='d'))
+        npt.assert_equal(queue.dequeue_many()[:, 0], [4, 5])
+        assert queue.size == 0 and queue.head == -1
+        assert queue.dequeue() is None
+        queue.cleanup()
+
     test(True)
     test_comm(True)
+    test_many(True)
     if PY_VERSION_8:
         test(False)
         test_comm(False)
+        test_many(False)
+
+
+def test_coalesce_events():
+    ids = _CQUEUE.event_ids
+    weel = _CQUEUE.index_info.weel
+    x = _CQUEUE.index_info.x
+    events = np.zeros((8, _CQUEUE.dimension))
+    events[:, 0] = [
+        ids.mouse_move, ids.mouse_move, ids.mouse_move,
+        ids.left_btn_press, ids.mouse_move, ids.mouse_weel,
+        ids.mouse_weel, ids.left_btn_release]
+    events[:, x] = np.arange(8)
+    events[5:7, weel] = [100, -50]
+
+    coalesced = coalesce_events(events)
+    # only the last of consecutive moves is kept, the buttons are not
+    # merged and the order is preserved
+    npt.assert_equal(coalesced[:, 0], [
+        ids.mouse_move, ids.left_btn_press, ids.mouse_move,
+        ids.mouse_weel, ids.left_btn_release])
+    npt.assert_equal(coalesced[:, x], [2, 3, 4, 6, 7])
+    # the merged weel events zoom as much as the original ones
+    npt.assert_almost_equal(
+        1 - coalesced[3, weel]/1000, (1 - 100/1000)*(1 + 50/1000))
+    npt.assert_equal(events[6, weel], -50)
+    assert coalesce_events(events[3:5]) is not None
+    npt.assert_equal(coalesce_events(events[3:5]), events[3:5])
+
+
+def test_stream_interaction_render_coalescing():
+    showm = mock.MagicMock()
+    showm.size = (300, 200)
+    showm.iren.GetEnabled.return_value = True
+    showm.iren.GetEnableRender.return_value = True
+    stream_interaction = FuryStreamInteraction(
+        showm, max_queue_size=50, use_raw_array=True)
+    stream_interaction.ms_render = 100
+    queue = stream_interaction.circular_queue
+
+    def mouse_move(x):
+        queue.enqueue(np.array(
+            [_CQUEUE.event_ids.mouse_move, 0, x, .5, 0, 0, 0, 0],
+            dtype='d'))
+
+    # nothing to do without events
+    stream_interaction.update()
+    assert showm.iren.Render.call_count == 0
+    for x in np.linspace(0, 1, 20):
+        mouse_move(x)
+    stream_interaction.update()
+    # a burst of moves is merged into one event and one render
+    assert showm.iren.MouseMoveEvent.call_count == 1
+    assert showm.iren.Render.call_count == 1
+    assert showm.window.Render.call_count == 0
+    # renders are limited to one per ms_render
+    for x in np.linspace(0, 1, 5):
+        mouse_move(x)
+        stream_interaction.update()
+    assert showm.iren.MouseMoveEvent.call_count == 6
+    assert showm.iren.Render.call_count == 1
+    time.sleep(.15)
+    # the postponed render happens even without new events
+    stream_interaction.update()
+    assert showm.iren.Render.call_count == 2
+    stream_interaction.update()
+    assert showm.iren.Render.call_count == 2
+
+    # the latency between the enqueue of an event and its render
+    time.sleep(.15)
+    queue.enqueue(np.array(
+        [_CQUEUE.event_ids.mouse_move, 0, .5, .5, 0, 0, 0,
+         time.time()*1000 - 20], dtype='d'))
+    stream_interaction.update()
+    assert queue.render_latency >= 20
+    summary = stream_interaction.metrics.summary('input_to_render_ms')
+    assert summary['count'] == 1 and summary['p50'] >= 20
+    npt.assert_equal(stream_interaction.metrics.counters, {
+        'events_handled': 26, 'renders': 3})
+    stream_interaction.cleanup()
+
+
+def test_stream_sessions():
+    width, height = 30, 20
+    showm = mock.MagicMock()
+    showm.size = (width, height)
+    showm.window.GetSize.return_value = (width, height)
+    main_camera = Camera()
+    showm.scene.GetActiveCamera.return_value = main_camera
+
+    def set_active_camera(camera):
+        showm.scene.GetActiveCamera.return_value = camera
+
+    showm.scene.SetActiveCamera.side_effect = set_active_camera
+    sessions = FuryStreamSessions(showm, num_sessions=3)
+    assert len(sessions.sessions) == 3
+    cameras = [session.camera for session in sessions.sessions]
+    assert len(set(map(id, cameras + [main_camera]))) == 4
+    assert len({id(session.style) for session in sessions.sessions}) == 3
+
+    def frame_ids():
+        return [s.img_manager.frame_id for s in sessions.sessions]
+
+    # the new sessions are rendered in round-robin order
+    for expected in [[1, 0, 0], [1, 1, 0], [1, 1, 1], [1, 1, 1]]:
+        sessions.update()
+        npt.assert_equal(frame_ids(), expected)
+
+    # the events of a session only change its camera
+    view_angle = main_camera.GetViewAngle()
+    sessions.sessions[1].circular_queue.enqueue(np.array(
+        [_CQUEUE.event_ids.mouse_weel, 100, 0, 0, 0, 0, 0, 0], dtype='d'))
+    sessions.update()
+    npt.assert_equal(frame_ids(), [1, 2, 1])
+    npt.assert_equal(cameras[0].GetViewAngle(), view_angle)
+    assert cameras[1].GetViewAngle() != view_angle
+    npt.assert_equal(cameras[2].GetViewAngle(), view_angle)
+    # the camera of the window is restored after each update
+    assert showm.scene.GetActiveCamera() is main_camera
+
+    sessions.max_renders = 2
+    sessions.invalidate()
+    sessions.update()
+    npt.assert_equal(frame_ids(), [2, 2, 2])
+    sessions.update()
+    npt.assert_equal(frame_ids(), [2, 3, 2])
+
+    session = sessions.add_session()
+    assert session.dirty
+    sessions.remove_session(session)
+    assert len(sessions.sessions) == 3
+    sessions.cleanup()
+    assert len(sessions.sessions) == 0
+
+
+def test_stream_sessions_event_positions():
+    width, height = 30, 20
+    moves = []
+
+    class Interactor(RenderWindowInteractor):
+        def MouseMoveEvent(self):
+            moves.append((self.GetInteractorStyle(), self.GetEventPosition(),
+                          self.GetLastEventPosition()))
+
+    showm = mock.MagicMock()
+    showm.size = (width, height)
+    showm.window.GetSize.return_value = (width, height)
+    showm.scene = window.Scene()
+    showm.style = InteractorStyleTrackballCamera()
+    showm.iren = Interactor()
+    sessions = FuryStreamSessions(showm, num_sessions=2)
+    styles = [session.style for session in sessions.sessions]
+
+    def drag(session, x, y):
+        session.circular_queue.enqueue(np.array(
+            [_CQUEUE.event_ids.mouse_move, 0, x/width, 1 - y/height, 0, 0, 0,
+             0], dtype='d'))
+
+    # the drags of the two sessions are interleaved, each move starts
+    # from the previous position of its own session
+    first, second = sessions.sessions
+    drag(first, 3, 4)
+    drag(second, 20, 10)
+    sessions.update()
+    drag(first, 6, 8)
+    drag(second, 25, 5)
+    sessions.update()
+    drag(first, 9, 12)
+    sessions.update()
+    npt.assert_equal(moves, [
+        (styles[0], (3, 4), (0, 0)),
+        (styles[1], (20, 10), (0, 0)),
+        (styles[0], (6, 8), (3, 4)),
+        (styles[1], (25, 5), (20, 10)),
+        (styles[0], (9, 12), (6, 8))])
+    # the positions of the interactor are restored after each update
+    npt.assert_equal(showm.iren.GetEventPosition(), (0, 0))
+    npt.assert_equal(showm.iren.GetLastEventPosition(), (0, 0))
+    sessions.cleanup()
+
+
+def test_stream_sessions_restore_window():
+    scene = window.Scene()
+    showm = window.ShowManager(scene, size=(30, 20))
+    style = showm.iren.GetInteractorStyle()
+    camera = scene.GetActiveCamera()
+    assert not showm.window.GetOffScreenRendering()
+    assert showm.iren.GetEnableRender()
+
+    sessions = FuryStreamSessions(showm, num_sessions=2)
+    # the sessions use the style of the ShowManager
+    assert all(
+        type(session.style) is type(style) for session in sessions.sessions)
+    assert showm.window.GetOffScreenRendering()
+    assert not showm.iren.GetEnableRender()
+    sessions.cleanup()
+    # the ShowManager can be used as before the sessions
+    assert not showm.window.GetOffScreenRendering()
+    assert showm.iren.GetEnableRender()
+    assert showm.iren.GetInteractorStyle() is style
+    assert scene.GetActiveCamera() is camera
 
 
 def test_queue_and_webserver():
@@ -741,12 +1009,19 @@ def test_queue_and_webserver():
         queue = tools.SharedMemCircularQueue(
             max_size=max_size, dimension=dimension
         )
+    def check_server_timestamp(arr, arr_queue):
+        # the server stores when it enqueued the event
+        idx = _CQUEUE.index_info.server_timestamp
+        assert abs(arr_queue[idx] - time.time()*1000) < 5000
+        arr[idx] = arr_queue[idx]
+
     set_weel({'deltaY': .2, 'timestampInMs': 123}, queue)
     arr_queue = queue.dequeue()
     arr = np.zeros(dimension)
     arr[0] = _CQUEUE.event_ids.mouse_weel
     arr[_CQUEUE.index_info.weel] = 0.2
     arr[_CQUEUE.index_info.user_timestamp] = 123
+    check_server_timestamp(arr, arr_queue)
     npt.assert_equal(arr, arr_queue)
 
     # if the mouse position has been stored correctly in the circular queue
@@ -761,6 +1036,7 @@ def test_queue_and_webserver():
     arr[_CQUEUE.index_info.ctrl] = data['ctrlKey']
     arr[_CQUEUE.index_info.shift] = data['shiftKey']
     arr[_CQUEUE.index_info.user_timestamp] = data['timestampInMs']
+    check_server_timestamp(arr, arr_queue)
     npt.assert_equal(arr, arr_queue)
 
     data = {
@@ -775,10 +1051,471 @@ def test_queue_and_webserver():
     arr[_CQUEUE.index_info.ctrl] = data['ctrlKey']
     arr[_CQUEUE.index_info.shift] = data['shiftKey']
     arr[_CQUEUE.index_info.user_timestamp] = data['timestampInMs']
+    check_server_timestamp(arr, arr_queue)
     npt.assert_equal(arr, arr_queue)
     queue.cleanup()
 
 
+def test_mjpeg_broadcaster(loop: asyncio.AbstractEventLoop):
+    width, height = 20, 10
+    img_buffer_manager = tools.RawArrayImageBufferManager(
+        max_window_size=(width, height))
+    broadcaster = MJPEGBroadcaster(img_buffer_manager, ms=1)
+
+    def write_frame(value):
+        img_buffer_manager.write_into(
+            width, height, np.full(width*height*3, value, dtype='uint8'))
+
+    async def consume(num_frames):
+        frames = []
+        async for jpeg in broadcaster.frames():
+            frames.append(jpeg)
+            if len(frames) == num_frames:
+                break
+        return frames
+
+    async def produce(num_frames):
+        for i in range(num_frames):
+            write_frame(i*50)
+            await asyncio.sleep(.05)
+
+    threads = set()
+    get_jpeg = img_buffer_manager.get_jpeg
+
+    def get_jpeg_in_thread(*args):
+        threads.add(threading.get_ident())
+        return get_jpeg(*args)
+
+    img_buffer_manager.get_jpeg = get_jpeg_in_thread
+
+    async def main():
+        with mock.patch.object(
+                tools.Image, 'fromarray',
+                wraps=tools.Image.fromarray) as fromarray:
+            results = await asyncio.gather(
+                produce(4), *[consume(3) for _ in range(5)])
+            # every client receives the same encoded frames
+            for frames in results[1:]:
+                assert len(frames) == 3
+                assert frames[0][:2] == b'\xff\xd8'
+                assert frames[0] is not frames[1]
+            # one encoding per new frame instead of one per client
+            assert fromarray.call_count <= 4
+
+            # a static framebuffer is encoded only once
+            await asyncio.sleep(.1)
+            num_encodings = fromarray.call_count
+            waiting = asyncio.ensure_future(consume(2))
+            await asyncio.sleep(.1)
+            assert not waiting.done()
+            assert fromarray.call_count <= num_encodings + 1
+            write_frame(255)
+            frames = await waiting
+            assert frames[0] != frames[1]
+
+        # the encoding runs outside of the event loop thread
+        assert len(threads) > 0
+        assert threading.get_ident() not in threads
+        await broadcaster.stop()
+
+    loop.run_until_complete(main())
+
+
+def test_mjpeg_broadcaster_encoding_error(loop: asyncio.AbstractEventLoop):
+    width, height = 20, 10
+    img_buffer_manager = tools.RawArrayImageBufferManager(
+        max_window_size=(width, height))
+    img_buffer_manager.write_into(
+        width, height, np.zeros(width*height*3, dtype='uint8'))
+    broadcaster = MJPEGBroadcaster(img_buffer_manager, ms=1)
+
+    async def consume():
+        async for jpeg in broadcaster.frames():
+            return jpeg
+
+    async def main():
+        with mock.patch.object(
+                img_buffer_manager, 'get_jpeg',
+                side_effect=ValueError('broken encoder')):
+            # the subscribers are woken up instead of waiting forever
+            results = await asyncio.wait_for(asyncio.gather(
+                consume(), consume(), return_exceptions=True), 5)
+        for result in results:
+            assert isinstance(result, RuntimeError)
+            assert isinstance(result.__cause__, ValueError)
+        assert broadcaster._task is None
+
+        # a new subscriber starts a new encoding task
+        jpeg = await asyncio.wait_for(consume(), 5)
+        assert jpeg[:2] == b'\xff\xd8'
+        await broadcaster.stop()
+
+    loop.run_until_complete(main())
+
+
+def test_jpeg_tiles(loop: asyncio.AbstractEventLoop):
+    width, height, tile_size = 100, 70, 32
+    img_buffer_manager = tools.RawArrayImageBufferManager(
+        max_window_size=(width, height))
+    frame = np.zeros((height, width, 3), dtype='uint8')
+
+    def write_frame():
+        # the buffers store the rows bottom-up
+        img_buffer_manager.write_into(
+            width, height, np.flipud(frame).flatten())
+
+    write_frame()
+    # every tile is sent for the first frame
+    w, h, tiles = img_buffer_manager.get_jpeg_tiles(tile_size)
+    assert (w, h) == (width, height)
+    npt.assert_equal(len(tiles), 4*3)
+    assert sum(tw*th for _, _, tw, th, _ in tiles) == width*height
+    assert all(jpeg[:2] == b'\xff\xd8' for *_, jpeg in tiles)
+    # no new frame
+    assert img_buffer_manager.get_jpeg_tiles(tile_size)[2] == []
+
+    # only the tiles touched by the change are encoded again
+    frame[40:50, 60:70] = 255
+    write_frame()
+    _, _, tiles = img_buffer_manager.get_jpeg_tiles(tile_size)
+    npt.assert_equal([t[:4] for t in tiles], [(32, 32, 32, 32),
+                                             (64, 32, 32, 32)])
+    # an unchanged frame produces no tiles
+    write_frame()
+    assert img_buffer_manager.get_jpeg_tiles(tile_size)[2] == []
+    # the right and bottom tiles are cropped to the frame
+    frame[-1, -1] = 255
+    write_frame()
+    _, _, tiles = img_buffer_manager.get_jpeg_tiles(tile_size)
+    npt.assert_equal([t[:4] for t in tiles], [(96, 64, 4, 6)])
+
+    w, h, all_tiles = img_buffer_manager.get_all_jpeg_tiles()
+    npt.assert_equal(len(all_tiles), 4*3)
+    assert tiles[0] in all_tiles
+
+    # the tiles read from another thread always cover a whole frame,
+    # even while the encoding thread processes frames of another size
+    encoding = True
+
+    def encode_frames():
+        for i in range(20):
+            size = (width, height) if i % 2 else (40, 30)
+            img_buffer_manager.write_into(
+                *size, np.full(size[0]*size[1]*3, i, dtype='uint8'))
+            img_buffer_manager.get_jpeg_tiles(tile_size)
+        nonlocal encoding
+        encoding = False
+
+    thread = threading.Thread(target=encode_frames)
+    thread.start()
+    while encoding:
+        w, h, all_tiles = img_buffer_manager.get_all_jpeg_tiles()
+        assert sum(tw*th for _, _, tw, th, _ in all_tiles) == w*h
+    thread.join()
+    img_buffer_manager.write_into(
+        width, height, np.flipud(frame).flatten())
+    img_buffer_manager.get_jpeg_tiles(tile_size)
+
+    broadcaster = TilesBroadcaster(
+        img_buffer_manager, ms=1, tile_size=tile_size)
+
+    async def consume(num_frames):
+        frames = []
+        async for messages in broadcaster.frames():
+            frames.append(messages)
+            if len(frames) == num_frames:
+                break
+        return frames
+
+    async def main():
+        first = asyncio.ensure_future(consume(2))
+        await asyncio.sleep(.05)
+        frame[0, 0] = 255
+        write_frame()
+        await asyncio.sleep(.05)
+        # a new client receives every tile of the current frame
+        second = asyncio.ensure_future(consume(1))
+        frames = await first
+        npt.assert_equal(len(frames[0]), 4*3)
+        # and then only the tiles that changed
+        assert len(frames[1]) == 1
+        header = np.frombuffer(frames[1][0][:24], '<u4')
+        npt.assert_equal(header, [width, height, 0, 0, 32, 32])
+        assert frames[1][0][24:26] == b'\xff\xd8'
+        frames = await second
+        assert len(frames[0]) == 4*3
+        await broadcaster.stop()
+
+    loop.run_until_complete(main())
+
+
+def test_jpeg_tiles_slow_client(loop: asyncio.AbstractEventLoop):
+    width, height, tile_size = 100, 70, 32
+    img_buffer_manager = tools.RawArrayImageBufferManager(
+        max_window_size=(width, height))
+    frame = np.zeros((height, width, 3), dtype='uint8')
+
+    def write_frame():
+        img_buffer_manager.write_into(
+            width, height, np.flipud(frame).flatten())
+
+    def composite(canvas, messages):
+        for message in messages:
+            _, _, x, y, w, h = np.frombuffer(message[:24], '<u4')
+            tile = np.asarray(tools.Image.open(io.BytesIO(message[24:])))
+            canvas[y:y+h, x:x+w] = tile
+
+    write_frame()
+    broadcaster = TilesBroadcaster(
+        img_buffer_manager, ms=1, tile_size=tile_size)
+    canvas = np.zeros_like(frame)
+
+    async def slow_consumer():
+        num_frames = 0
+        async for messages in broadcaster.frames():
+            composite(canvas, messages)
+            num_frames += 1
+            if num_frames == 2:
+                break
+            # several frames are encoded while this client is busy
+            await asyncio.sleep(.5)
+
+    async def main():
+        consumer = asyncio.ensure_future(slow_consumer())
+        await asyncio.sleep(.05)
+        # each frame changes a different tile
+        for x in (0, 32, 64):
+            frame[:32, x:x+32] = 255
+            write_frame()
+            await asyncio.sleep(.1)
+        await asyncio.wait_for(consumer, 5)
+        await broadcaster.stop()
+
+    loop.run_until_complete(main())
+    expected = np.zeros_like(frame)
+    composite(expected, broadcaster._pack(
+        *img_buffer_manager.get_all_jpeg_tiles()))
+    npt.assert_array_equal(canvas, expected)
+    npt.assert_allclose(canvas, frame, atol=5)
+
+
+def test_adaptive_quality():
+    width, height = 64, 48
+    img_buffer_manager = tools.RawArrayImageBufferManager(
+        max_window_size=(width, height))
+    rng = np.random.default_rng(0)
+    img_buffer_manager.write_into(
+        width, height, rng.integers(0, 255, width*height*3, dtype='uint8'))
+    jpeg = img_buffer_manager.get_jpeg(quality=90)
+    assert img_buffer_manager.get_jpeg(quality=90) is jpeg
+    assert len(img_buffer_manager.get_jpeg(quality=30)) < len(jpeg)
+    small = img_buffer_manager.get_jpeg(quality=90, scale=2)
+    assert len(small) < len(jpeg)
+    npt.assert_equal(tools.Image.open(io.BytesIO(small)).size, (32, 24))
+    assert img_buffer_manager.encode_ms > 0
+
+    controller = tools.AdaptiveQualityController(
+        max_quality=90, min_quality=30, quality_step=30, max_scale=2,
+        target_ms=20, idle_ms=1000)
+    assert controller.adapt() == (90, 1)
+    # slow encodings while the user interacts lower the quality and
+    # then the resolution
+    expected = [(60, 1), (30, 1), (30, 2), (30, 2)]
+    for quality_scale in expected:
+        controller.update_interaction(time.time()*1000)
+        controller.update_encoding(50)
+        assert controller.adapt() == quality_scale
+    # without a new measurement nothing changes
+    assert controller.adapt() == (30, 2)
+    # a fast encoding restores the resolution first
+    controller.update_encoding(1)
+    assert controller.adapt() == (30, 1)
+    # events piling up in the queue also mean overload
+    controller.update_interaction(time.time()*1000, queue_size=5)
+    controller.update_encoding(1)
+    assert controller.adapt() == (30, 2)
+    # the full quality is restored when the user is idle
+    controller._last_interaction -= 2
+    assert controller.adapt() == (90, 1)
+
+    queue = tools.ArrayCircularQueue(max_size=4, dimension=2)
+    assert queue.size == 0
+    for i in range(3):
+        queue.enqueue(np.zeros(2))
+    assert queue.size == 3
+    queue.dequeue()
+    assert queue.size == 2
+
+
+def test_render_latencies():
+    def test(use_raw_array):
+        if use_raw_array:
+            queue = tools.ArrayCircularQueue(max_size=4, dimension=2)
+            queue_sh = tools.ArrayCircularQueue(
+                max_size=4, dimension=2,
+                head_tail_buffer=queue.head_tail_buffer,
+                buffer=queue.buffer.buffer)
+        else:
+            queue = tools.SharedMemCircularQueue(max_size=4, dimension=2)
+            queue_sh = tools.SharedMemCircularQueue(
+                max_size=4, dimension=2,
+                head_tail_buffer_name=queue.head_tail_buffer_name,
+                buffer_name=queue.buffer.buffer_name)
+        assert queue_sh.render_latencies() == ([], 0)
+        queue.render_latency = 5
+        queue.render_latency = 7
+        assert queue_sh.render_latency == 7
+        assert queue_sh.render_latencies() == ([5, 7], 2)
+        assert queue_sh.render_latencies(1) == ([7], 2)
+        assert queue_sh.render_latencies(2) == ([], 2)
+        # the indices of the queue are not affected
+        assert queue_sh.enqueue(np.ones(2))
+        npt.assert_equal(queue.dequeue(), np.ones(2))
+        # only the most recent latencies are kept
+        window_size = tools._LATENCY_WINDOW
+        for latency in range(10, 10 + 2*window_size):
+            queue.render_latency = latency
+        latencies, count = queue_sh.render_latencies(2)
+        assert count == 2 + 2*window_size
+        npt.assert_equal(
+            latencies, np.arange(10 + window_size, 10 + 2*window_size))
+        queue_sh.cleanup()
+        queue.cleanup()
+
+    test(True)
+    if PY_VERSION_8:
+        test(False)
+
+
+def test_metrics(loop: asyncio.AbstractEventLoop):
+    metrics = tools.StreamMetrics(window_size=100)
+    for i in range(200):
+        metrics.observe('encode_ms', i)
+    summary = metrics.summary('encode_ms')
+    assert summary['count'] == 100 and summary['max'] == 199
+    npt.assert_almost_equal(summary['p50'], 149.5)
+    assert metrics.summary('send_ms') == {'count': 0}
+
+    width, height = 20, 10
+    img_buffer_manager = tools.RawArrayImageBufferManager(
+        max_window_size=(width, height))
+    img_buffer_manager.write_into(
+        width, height, np.zeros(width*height*3, dtype='uint8'))
+    queue = tools.ArrayCircularQueue(
+        max_size=5, dimension=_CQUEUE.dimension)
+    app = get_app(
+        image_buffer_manager=img_buffer_manager, circular_queue=queue,
+        provides_mjpeg=True, ms_jpeg=1)
+
+    async def main():
+        client = test_utils.TestClient(test_utils.TestServer(app))
+        await client.start_server()
+        resp = await client.get('/video/mjpeg')
+        await resp.content.readexactly(100)
+        await asyncio.sleep(.1)
+        set_mouse({
+            'x': .1, 'y': .2, 'ctrlKey': 0, 'shiftKey': 0,
+            'timestampInMs': time.time()*1000}, queue)
+        for latency in [10, 20, 30]:
+            queue.render_latency = latency
+        data = await (await client.get('/metrics')).json()
+        # only the new latencies are added to the timing
+        queue.render_latency = 40
+        second = await (await client.get('/metrics')).json()
+        resp.close()
+        await client.close()
+        return data, second
+
+    data, second = loop.run_until_complete(main())
+    assert data['counters']['mjpeg_frames_encoded'] == 1
+    assert data['timings']['mjpeg_encode_ms']['count'] == 1
+    assert 'tiles_encode_ms' not in data['timings']
+    npt.assert_equal(data['gauges'], {
+        'frames_captured': 1, 'queue_depth': 1})
+    latencies = data['timings']['input_to_render_ms']
+    assert latencies['count'] == 3
+    npt.assert_almost_equal(
+        [latencies['p50'], latencies['max']], [20, 30])
+    latencies = second['timings']['input_to_render_ms']
+    assert latencies['count'] == 4 and latencies['max'] == 40
+    clients = list(data['clients'].values())
+    assert len(clients) == 1
+    assert clients[0]['bytes_sent'] > 0
+    assert data['counters']['bytes_sent'] == clients[0]['bytes_sent']
+
+
+def test_image_buffer_frame_id():
+    def test(use_raw_array):
+        width, height = 20, 10
+        if use_raw_array:
+            img_buffer_manager = tools.RawArrayImageBufferManager(
+                max_window_size=(width, height))
+            img_buffer_reader = tools.RawArrayImageBufferManager(
+                info_buffer=img_buffer_manager.info_buffer,
+                image_buffers=img_buffer_manager.image_buffers)
+        else:
+            img_buffer_manager = tools.SharedMemImageBufferManager(
+                max_window_size=(width, height))
+            img_buffer_reader = tools.SharedMemImageBufferManager(
+                info_buffer_name=img_buffer_manager.info_buffer_name,
+                image_buffer_names=img_buffer_manager.image_buffer_names)
+
+        frame = np.zeros(width*height*3, dtype='uint8')
+        assert img_buffer_reader.frame_id == 0
+        img_buffer_manager.write_into(width, height, frame)
+        assert img_buffer_reader.frame_id == 1
+
+        jpeg = img_buffer_reader.get_jpeg()
+        # no new frame, the encoded image is reused
+        assert img_buffer_reader.get_jpeg() is jpeg
+        img_buffer_manager.write_into(width, height, frame + 255)
+        assert img_buffer_reader.frame_id == 2
+        assert img_buffer_reader.get_jpeg() != jpeg
+
+        # frames written directly into the buffers, in both orientations
+        image = np.arange(width*height*3, dtype='uint8').reshape(
+            (height, width, 3))
+        for bottom_up in [True, False]:
+            buffer = img_buffer_manager.get_next_buffer(width, height)
+            rows = np.flipud(image) if bottom_up else image
+            buffer[:] = rows.flatten()
+            img_buffer_manager.swap_buffers(width, height, bottom_up)
+            assert img_buffer_reader.bottom_up == bottom_up
+            npt.assert_equal(img_buffer_reader._get_current_image(), image)
+            decoded = np.asarray(tools.Image.open(
+                io.BytesIO(img_buffer_reader.get_jpeg())))
+            assert np.abs(decoded - image.astype(float)).mean() < 20
+        # the frame is copied out of the buffers before being encoded, the
+        # next frames can overwrite them
+        pil_image = img_buffer_reader._get_current_pil_image()
+        for _ in range(2):
+            img_buffer_manager.write_into(width, height, frame + 255)
+        npt.assert_equal(np.asarray(pil_image), image)
+        # a frame written during the copy is copied again
+        get_current_frame = img_buffer_reader.get_current_frame
+
+        def write_during_copy():
+            current_frame = get_current_frame()
+            if len(calls) == 0:
+                img_buffer_manager.write_into(
+                    width, height, image.flatten(), bottom_up=False)
+            calls.append(current_frame)
+            return current_frame
+
+        calls = []
+        with mock.patch.object(img_buffer_reader, 'get_current_frame',
+                               side_effect=write_during_copy):
+            npt.assert_equal(img_buffer_reader._get_current_image(), image)
+        assert len(calls) == 2
+        assert img_buffer_manager.get_next_buffer(width*2, height) is None
+
+        img_buffer_reader.cleanup()
+        img_buffer_manager.cleanup()
+
+    test(True)
+    if PY_VERSION_8:
+        test(False)
+
 def test_webserver():
     def test(use_raw_array):
         width_0 = 100
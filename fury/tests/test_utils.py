@@ -15,15 +15,18 @@ from fury.utils import (add_polydata_numeric_field, get_polydata_field,
                         rotate, vertices_from_actor,
                         compute_bounds, set_input,
                         update_actor, get_actor_from_primitive,
+                        get_instanced_actor_from_primitive,
+                        update_glyph_actor,
                         get_bounds, update_surface_actor_colors,
                         apply_affine_to_actor, color_check, is_ui,
                         primitives_count_to_actor, primitives_count_from_actor,
                         set_polydata_primitives_count,
                         get_polydata_primitives_count)
-from fury import actor, window, utils
+from fury import actor, colormap, window, utils
 from fury.lib import (numpy_support, PolyData, PolyDataMapper2D, Points,
                       CellArray, Polygon, Actor2D, DoubleArray, VTK_INT,
-                      UnsignedCharArray, TextActor3D, VTK_DOUBLE, VTK_FLOAT)
+                      UnsignedCharArray, TextActor3D, VTK_DOUBLE, VTK_FLOAT,
+                      Math)
 
 import fury.primitive as fp
 
@@ -112,6 +115,93 @@ def test_polydata_lines():
     npt.assert_equal(utils.get_polydata_colors(PolyData()), None)
 
 
+def test_polydata_lines_colors():
+    rng = np.random.default_rng(42)
+    lines = [rng.random((n, 3)) for n in (2, 5, 3, 7)]
+    points_per_line = [len(line) for line in lines]
+    nb_points = sum(points_per_line)
+
+    def get_colors(colors):
+        pd_lines, is_cmap = utils.lines_to_vtk_polydata(lines, colors)
+        scalars = pd_lines.GetPointData().GetScalars()
+        return numpy_support.vtk_to_numpy(scalars), is_cmap
+
+    # Default orientation colors, one per line
+    orient = [colormap.orient2rgb(line[-1] - line[0]) for line in lines]
+    expected = (255 * np.repeat(orient, points_per_line, axis=0)).astype(
+        np.uint8)
+    res_colors, is_cmap = get_colors(None)
+    npt.assert_array_equal(res_colors, expected)
+    npt.assert_equal(is_cmap, False)
+
+    # One RGB color per line
+    line_rgb = rng.random((len(lines), 3))
+    expected = (255 * np.repeat(line_rgb, points_per_line, axis=0)).astype(
+        np.uint8)
+    res_colors, is_cmap = get_colors(line_rgb)
+    npt.assert_array_equal(res_colors, expected)
+    npt.assert_equal(is_cmap, False)
+
+    # One scalar value per line
+    line_values = np.array([.1, .5, .7, .9])
+    res_colors, is_cmap = get_colors(line_values)
+    npt.assert_array_equal(res_colors,
+                           np.repeat(line_values, points_per_line))
+    npt.assert_equal(is_cmap, True)
+
+    # The same color for all points
+    res_colors, is_cmap = get_colors((1, 0.5, 0))
+    npt.assert_array_equal(res_colors, np.tile([255, 127, 0], (nb_points, 1)))
+    npt.assert_equal(is_cmap, False)
+
+
+def test_numpy_to_vtk_cells():
+    lines = [np.zeros((n, 3)) for n in (3, 1, 4)]
+    cell_array = utils.numpy_to_vtk_cells(lines)
+    npt.assert_equal(cell_array.GetNumberOfCells(), 3)
+    npt.assert_array_equal(
+        numpy_support.vtk_to_numpy(cell_array.GetOffsetsArray()),
+        [0, 3, 4, 8])
+    npt.assert_array_equal(
+        numpy_support.vtk_to_numpy(cell_array.GetConnectivityArray()),
+        np.arange(8))
+
+    triangles = np.array([[0, 1, 2], [2, 1, 3]])
+    cell_array = utils.numpy_to_vtk_cells(triangles, is_coords=False)
+    npt.assert_array_equal(
+        numpy_support.vtk_to_numpy(cell_array.GetOffsetsArray()), [0, 3, 6])
+    npt.assert_array_equal(
+        numpy_support.vtk_to_numpy(cell_array.GetConnectivityArray()),
+        triangles.ravel())
+
+
+@pytest.mark.skipif(not have_dipy, reason="Requires DIPY")
+def test_array_sequence_to_polydata():
+    from dipy.tracking.streamline import Streamlines
+    rng = np.random.default_rng(42)
+    lines = Streamlines([rng.random((n, 3)).astype(np.float32)
+                         for n in (3, 4, 5, 2)])
+
+    # The points of the streamlines are shared with the polydata
+    pd_lines, _ = utils.lines_to_vtk_polydata(lines)
+    points = numpy_support.vtk_to_numpy(pd_lines.GetPoints().GetData())
+    npt.assert_equal(points.ctypes.data, lines._data.ctypes.data)
+    for res_line, line in zip(utils.get_polydata_lines(pd_lines), lines):
+        npt.assert_array_equal(res_line, line)
+
+    # A sliced sequence only uses part of its data
+    sub_lines = lines[::2]
+    pd_lines, is_cmap = utils.lines_to_vtk_polydata(sub_lines,
+                                                    np.array([.2, .4]))
+    npt.assert_equal(pd_lines.GetNumberOfPoints(), 8)
+    for res_line, line in zip(utils.get_polydata_lines(pd_lines), sub_lines):
+        npt.assert_array_equal(res_line, line)
+    res_colors = numpy_support.vtk_to_numpy(
+        pd_lines.GetPointData().GetScalars())
+    npt.assert_array_equal(res_colors, [.2] * 3 + [.4] * 5)
+    npt.assert_equal(is_cmap, True)
+
+
 def test_polydata_polygon(interactive=False):
     # Create a cube
     my_triangles = np.array([[0, 6, 4],
@@ -498,6 +588,160 @@ def test_winding_order():
                      utils.fix_winding_order(vertices, triangles))
 
 
+def instanced_vertices(inst_actor):
+    """Apply the transforms of the glyph mapper to its source, per instance.
+    """
+    mapper = inst_actor.GetMapper()
+    source = numpy_support.vtk_to_numpy(
+        mapper.GetSource().GetPoints().GetData())
+    instances = mapper.GetInput()
+    centers = numpy_support.vtk_to_numpy(instances.GetPoints().GetData())
+    scales = numpy_support.vtk_to_numpy(
+        instances.GetPointData().GetArray('scales'))
+    if scales.ndim == 1:
+        scales = np.repeat(np.abs(scales)[:, None], 3, axis=1)
+    vertices = []
+    for i, center in enumerate(centers):
+        rotation = np.identity(3)
+        if mapper.GetOrient():
+            quaternion = instances.GetPointData().GetArray(
+                'orientations').GetTuple(i)
+            matrix = [[0.] * 3 for _ in range(3)]
+            Math.QuaternionToMatrix3x3(quaternion, matrix)
+            rotation = np.array(matrix)
+        vertices.append((source * scales[i]) @ rotation.T + center)
+    return np.vstack(vertices)
+
+
+def test_get_instanced_actor_from_primitive():
+    verts, faces = fp.prim_box()
+    centers = np.array([[0, 0, 0], [10, 0, 0], [0, 10, 0]])
+    colors = np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1.]])
+
+    for dirs, scales in [(None, 1), (None, (1, 2, 3)),
+                         ((1, 0, 0), [1, 2, 3]),
+                         ([[0, 1, 0], [0, 0, 0], [1, 1, 1]], (1, 2, 3)),
+                         (np.random.rand(3, 3), np.random.rand(3, 3))]:
+        inst_actor = get_instanced_actor_from_primitive(
+            verts, faces, centers, directions=dirs, colors=colors,
+            scales=scales)
+        big_verts, big_faces, big_colors, _ = fp.repeat_primitive(
+            verts.copy(), faces, centers, directions=dirs,
+            colors=colors.copy(), scales=scales)
+        prim_actor = get_actor_from_primitive(big_verts, big_faces,
+                                              big_colors)
+
+        # Only the unit primitive and the per-instance data are stored
+        mapper = inst_actor.GetMapper()
+        npt.assert_equal(mapper.GetSource().GetNumberOfPoints(), len(verts))
+        npt.assert_equal(mapper.GetInput().GetNumberOfPoints(), len(centers))
+        npt.assert_equal(primitives_count_from_actor(inst_actor),
+                         len(centers))
+        npt.assert_array_equal(utils.colors_from_actor(inst_actor),
+                               colors * 255)
+
+        # same geometry as the non-instanced path
+        npt.assert_array_almost_equal(instanced_vertices(inst_actor),
+                                      big_verts)
+
+        # bounds of glyphs are conservative
+        inst_bounds = np.array(inst_actor.GetBounds())
+        prim_bounds = np.array(prim_actor.GetBounds())
+        npt.assert_array_less(inst_bounds[::2], prim_bounds[::2] + 1e-6)
+        npt.assert_array_less(prim_bounds[1::2], inst_bounds[1::2] + 1e-6)
+
+    npt.assert_raises(IOError, get_instanced_actor_from_primitive, verts,
+                      faces, centers, colors=np.random.rand(2, 3))
+
+    # asymmetric primitive, not invariant by a half turn around x
+    verts, faces = fp.prim_triangularprism()
+    dirs = np.random.rand(3, 3) - .5
+    inst_actor = get_instanced_actor_from_primitive(
+        verts, faces, centers, directions=dirs)
+    big_verts = fp.repeat_primitive(verts.copy(), faces, centers,
+                                    directions=dirs)[0]
+    npt.assert_array_almost_equal(instanced_vertices(inst_actor), big_verts)
+    inst_actor = get_instanced_actor_from_primitive(
+        verts, faces, centers, directions=(-1, 0, 0))
+    npt.assert_array_almost_equal(
+        instanced_vertices(inst_actor),
+        np.vstack([verts * (-1, 1, -1) + c for c in centers]))
+
+
+def test_update_glyph_actor():
+    centers = np.array([[0, 0, 0], [10, 0, 0], [0, 10, 0]])
+    colors = np.array([[1, 0, 0], [0, 1, 0], [0, 0, 1.]])
+
+    # instanced glyph actor
+    box_actor = actor.box(centers, directions=(1, 0, 0), colors=colors,
+                          scales=1, instanced=True)
+    pd = box_actor.GetMapper().GetInput()
+    mtime = pd.GetPoints().GetData().GetMTime()
+    update_glyph_actor(box_actor, [1], colors=(1, 1, 1), scales=2,
+                       directions=(0, 1, 0))
+    npt.assert_equal(pd.GetPoints().GetData().GetMTime(), mtime)
+    npt.assert_array_equal(utils.colors_from_actor(box_actor),
+                           [[255, 0, 0], [255, 255, 255], [0, 0, 255]])
+    npt.assert_array_equal(utils.array_from_actor(box_actor, 'scales'),
+                           [1, 2, 1])
+    npt.assert_array_equal(utils.array_from_actor(box_actor, 'directions'),
+                           [[1, 0, 0], [0, 1, 0], [1, 0, 0]])
+    update_glyph_actor(box_actor, np.array([0, 2]),
+                       centers=[[1, 1, 1], [2, 2, 2]])
+    npt.assert_array_equal(vertices_from_actor(box_actor),
+                           [[1, 1, 1], [10, 0, 0], [2, 2, 2]])
+
+    sphere_actor = actor.sphere(centers, colors, instanced=True)
+    npt.assert_raises(ValueError, update_glyph_actor, sphere_actor, [0],
+                      directions=(0, 1, 0))
+
+    # glyph actor generated by a vtkGlyph3D filter
+    sphere_actor = actor.sphere(centers, colors, radii=np.ones(3))
+    update_glyph_actor(sphere_actor, [1], centers=(5, 5, 5),
+                       colors=(1, 1, 1), scales=2)
+    sphere_actor.GetMapper().Update()
+    glyph_pd = sphere_actor.GetMapper().GetInput()
+    res_verts = vertices_from_actor(sphere_actor).reshape((3, -1, 3))
+    npt.assert_array_almost_equal(res_verts[1].mean(axis=0), (5, 5, 5), 4)
+    npt.assert_almost_equal(np.ptp(res_verts[1], axis=0).max(), 4, 2)
+    npt.assert_array_almost_equal(res_verts[0].mean(axis=0), (0, 0, 0), 4)
+    res_colors = utils.colors_from_actor(sphere_actor).reshape((3, -1, 3))
+    npt.assert_array_equal(res_colors[1], 255)
+    npt.assert_array_equal(res_colors[2, :, 2], 255)
+    # the update survives a new execution of the pipeline
+    sphere_actor.GetMapper().GetInputAlgorithm().Modified()
+    sphere_actor.GetMapper().Update()
+    npt.assert_array_almost_equal(
+        vertices_from_actor(sphere_actor).reshape((3, -1, 3))[1].mean(axis=0),
+        (5, 5, 5), 4)
+    npt.assert_equal(sphere_actor.GetMapper().GetInput(), glyph_pd)
+    npt.assert_raises(ValueError, update_glyph_actor, sphere_actor, [0],
+                      directions=(0, 1, 0))
+
+    # tiled glyph actor
+    box_actor = actor.box(centers, colors=colors, scales=1)
+    update_glyph_actor(box_actor, [2], colors=(1, 1, 1))
+    res_colors = utils.colors_from_actor(box_actor).reshape((3, 8, 3))
+    npt.assert_array_equal(res_colors[:2], np.repeat(colors[:2, None] * 255,
+                                                     8, axis=1))
+    npt.assert_array_equal(res_colors[2], np.full((8, 3), 255))
+    npt.assert_raises(ValueError, update_glyph_actor, box_actor, [0],
+                      scales=2)
+    npt.assert_raises(ValueError, update_glyph_actor, box_actor, [0],
+                      centers=(1, 1, 1))
+
+    # tiled glyph actor storing its centers
+    billboard_actor = actor.billboard(centers, colors=colors)
+    verts = vertices_from_actor(billboard_actor).copy()
+    update_glyph_actor(billboard_actor, [1], centers=(10, 10, 10))
+    res_verts = vertices_from_actor(billboard_actor)
+    npt.assert_array_almost_equal(res_verts[:4], verts[:4])
+    npt.assert_array_almost_equal(res_verts[4:8], verts[4:8] + [0, 10, 10])
+    npt.assert_array_almost_equal(
+        utils.array_from_actor(billboard_actor, 'center')[4:8],
+        np.full((4, 3), 10))
+
+
 def test_vertices_from_actor(interactive=False):
 
     expected = np.array([[1.5, -0.5, 0.],
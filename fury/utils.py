@@ -1,12 +1,12 @@
 import numpy as np
 from scipy.ndimage import map_coordinates
 
-from fury.colormap import line_colors
+from fury.colormap import orient2rgb
 from fury.lib import (numpy_support, PolyData, ImageData, Points,
                       CellArray, PolyDataNormals, Actor, PolyDataMapper,
                       Matrix4x4, Matrix3x3, Glyph3D, VTK_DOUBLE, VTK_FLOAT,
                       Transform, AlgorithmOutput, VTK_INT, VTK_UNSIGNED_CHAR,
-                      TransformPolyDataFilter)
+                      TransformPolyDataFilter, Glyph3DMapper)
 
 
 def remove_observer_from_actor(actor, id):
@@ -55,12 +55,15 @@ def set_input(vtk_object, inp):
     return vtk_object
 
 
-def numpy_to_vtk_points(points):
+def numpy_to_vtk_points(points, deep=True):
     """Convert Numpy points array to a vtk points array.
 
     Parameters
     ----------
     points : ndarray
+    deep : bool, optional
+        If False, the vtk array shares the memory of ``points`` when it is
+        already C-contiguous, so later changes of ``points`` are seen by vtk.
 
     Returns
     -------
@@ -69,16 +72,19 @@ def numpy_to_vtk_points(points):
     """
     vtk_points = Points()
     vtk_points.SetData(numpy_support.numpy_to_vtk(np.asarray(points),
-                                                  deep=True))
+                                                  deep=deep))
     return vtk_points
 
 
-def numpy_to_vtk_colors(colors):
+def numpy_to_vtk_colors(colors, deep=True):
     """Convert Numpy color array to a vtk color array.
 
     Parameters
     ----------
     colors: ndarray
+    deep : bool, optional
+        If False and ``colors`` is already a C-contiguous unsigned char array,
+        the vtk array shares its memory instead of copying it.
 
     Returns
     -------
@@ -96,7 +102,7 @@ def numpy_to_vtk_colors(colors):
     >>> vtk_colors = numpy_to_vtk_colors(255 * rgb_array)
 
     """
-    vtk_colors = numpy_support.numpy_to_vtk(np.asarray(colors), deep=True,
+    vtk_colors = numpy_support.numpy_to_vtk(np.asarray(colors), deep=deep,
                                             array_type=VTK_UNSIGNED_CHAR)
     return vtk_colors
 
@@ -116,6 +122,14 @@ def numpy_to_vtk_cells(data, is_coords=True):
     vtk_cell : vtkCellArray
         connectivity + offset information
 
+    Notes
+    -----
+    When ``is_coords`` is True, the cells use consecutive points, so the
+    offsets are the cumulative number of points of the cells and the
+    connectivity is a range over all points. For an ArraySequence, the
+    number of points of every cell is read from ``_lengths`` without
+    visiting the cells.
+
     """
     if isinstance(data, (list, np.ndarray)):
         offsets_dtype = np.int64
@@ -123,35 +137,46 @@ def numpy_to_vtk_cells(data, is_coords=True):
         offsets_dtype = np.dtype(data._offsets.dtype)
         if offsets_dtype.kind == 'u':
             offsets_dtype = np.dtype(offsets_dtype.name[1:])
-    data = np.array(data, dtype=object)
-    nb_cells = len(data)
-
-    # Get lines_array in vtk input format
-    connectivity = data.flatten() if not is_coords else []
-    offset = [0, ]
-    current_position = 0
 
     cell_array = CellArray()
-
-    for i in range(nb_cells):
-        current_len = len(data[i])
-        offset.append(offset[-1] + current_len)
-
-        if is_coords:
-            end_position = current_position + current_len
-            connectivity += list(range(current_position, end_position))
-            current_position = end_position
-
-    connectivity = np.array(connectivity, offsets_dtype)
-    offset = np.array(offset, dtype=offsets_dtype)
-
     vtk_array_type = numpy_support.get_vtk_array_type(offsets_dtype)
-    cell_array.SetData(
-        numpy_support.numpy_to_vtk(offset, deep=True,
-                                   array_type=vtk_array_type),
-        numpy_support.numpy_to_vtk(connectivity, deep=True,
-                                   array_type=vtk_array_type))
 
+    if is_coords:
+        if hasattr(data, '_lengths'):
+            lengths = np.asarray(data._lengths)
+        else:
+            lengths = np.fromiter(map(len, data), np.intp, count=len(data))
+        nb_cells = len(lengths)
+
+        # Fill arrays allocated by vtk in place: SetData shallow copies them,
+        # which would not keep numpy owned memory alive.
+        vtk_offsets = numpy_support.create_vtk_array(vtk_array_type)
+        vtk_offsets.SetNumberOfTuples(nb_cells + 1)
+        offset = numpy_support.vtk_to_numpy(vtk_offsets)
+        offset[0] = 0
+        np.cumsum(lengths, out=offset[1:])
+
+        vtk_connectivity = numpy_support.create_vtk_array(vtk_array_type)
+        vtk_connectivity.SetNumberOfTuples(offset[-1])
+        connectivity = numpy_support.vtk_to_numpy(vtk_connectivity)
+        connectivity.fill(1)
+        connectivity[:1] = 0
+        np.cumsum(connectivity, out=connectivity)
+    else:
+        data = np.array(data, dtype=object)
+        nb_cells = len(data)
+        connectivity = np.array(data.flatten(), offsets_dtype)
+        offset = [0, ]
+        for i in range(nb_cells):
+            offset.append(offset[-1] + len(data[i]))
+        offset = np.array(offset, dtype=offsets_dtype)
+
+        vtk_offsets = numpy_support.numpy_to_vtk(offset, deep=True,
+                                                 array_type=vtk_array_type)
+        vtk_connectivity = numpy_support.numpy_to_vtk(
+            connectivity, deep=True, array_type=vtk_array_type)
+
+    cell_array.SetData(vtk_offsets, vtk_connectivity)
     cell_array.SetNumberOfCells(nb_cells)
     return cell_array
 
@@ -228,12 +253,133 @@ def map_coordinates_3d_4d(input_array, indices):
         return np.ascontiguousarray(np.array(values_4d).T)
 
 
+def _is_packed_array_sequence(lines):
+    """Check that the lines of an ArraySequence fill its data consecutively.
+
+    Parameters
+    ----------
+    lines : ArraySequence
+
+    Returns
+    -------
+    bool
+        True if ``lines._data`` holds the points of every line in order and
+        nothing else, e.g. False for a sliced ArraySequence.
+
+    """
+    lengths = np.asarray(lines._lengths, np.intp)
+    offsets = np.cumsum(lengths) - lengths
+    return len(lines._data) == lengths.sum() and \
+        np.array_equal(lines._offsets, offsets)
+
+
+def _repeat_line_colors(colors, points_per_line):
+    """Repeat one RGB color per line to get one color per point.
+
+    The colors are scaled and cast to unsigned char before being repeated,
+    so the expanded array takes one byte per channel instead of eight.
+
+    Parameters
+    ----------
+    colors : ndarray (N, 3) or (N, 4)
+        Colors of the N lines in the [0, 1] range.
+    points_per_line : array-like (N,)
+        Number of points of each line.
+
+    Returns
+    -------
+    colors : ndarray (K, 3) or (K, 4)
+        Colors in the [0, 255] range for the K points of all lines.
+
+    """
+    colors = (255 * np.asarray(colors)).astype(np.uint8)
+    return np.repeat(colors, points_per_line, axis=0)
+
+
+def _lines_to_vtk_colors(lines, points_array, colors):
+    """Create the vtk point colors of lines.
+
+    Every per-line color mode is expanded to one value per point with a
+    ``np.repeat`` over the number of points of each line.
+
+    Parameters
+    ----------
+    lines : list or ArraySequence
+        N curves represented as 2D ndarrays.
+    points_array : ndarray (K, 3)
+        Points of all lines.
+    colors : array (N, 3), list of arrays, tuple (3,), array (K,)
+        See :func:`lines_to_vtk_polydata`.
+
+    Returns
+    -------
+    vtk_colors : vtkDataArray
+    color_is_scalar : bool, true if the color array is a single scalar
+
+    """
+    # Get colors_array (reformat to have colors for each points)
+    #           - if/else tested and work in normal simple case
+    nb_points = len(points_array)
+    nb_lines = len(lines)
+    if lines.__class__.__name__ == 'ArraySequence':
+        points_per_line = np.asarray(lines._lengths, np.intp)
+    else:
+        points_per_line = np.fromiter(map(len, lines), np.intp,
+                                      count=nb_lines)
+    lines_offsets = np.zeros(nb_lines, np.intp)
+    np.cumsum(points_per_line[:-1], out=lines_offsets[1:])
+
+    color_is_scalar = False
+    if colors is None or colors is False:
+        # set automatic rgb colors from the orientation of each line
+        ends = lines_offsets + np.maximum(points_per_line - 1, 0)
+        cols_arr = orient2rgb(points_array[ends] -
+                              points_array[lines_offsets])
+        vtk_colors = numpy_to_vtk_colors(
+            _repeat_line_colors(cols_arr, points_per_line), deep=False)
+    else:
+        cols_arr = np.asarray(colors)
+        if cols_arr.dtype == object:  # colors is a list of colors
+            vtk_colors = numpy_to_vtk_colors(255 * np.vstack(colors))
+        else:
+            if len(cols_arr) == nb_points:
+                if cols_arr.ndim == 1:  # values for every point
+                    vtk_colors = numpy_support.numpy_to_vtk(cols_arr,
+                                                            deep=True)
+                    color_is_scalar = True
+                elif cols_arr.ndim == 2:  # map color to each point
+                    vtk_colors = numpy_to_vtk_colors(255 * cols_arr)
+
+            elif cols_arr.ndim == 1:
+                if len(cols_arr) == nb_lines:  # values for every streamline
+                    cols_arrx = np.repeat(cols_arr, points_per_line)
+                    vtk_colors = numpy_support.numpy_to_vtk(cols_arrx,
+                                                            deep=False)
+                    color_is_scalar = True
+                else:  # the same colors for all points
+                    vtk_colors = numpy_to_vtk_colors(
+                        _repeat_line_colors(cols_arr[None], [nb_points]),
+                        deep=False)
+
+            elif cols_arr.ndim == 2:  # map color to each line
+                vtk_colors = numpy_to_vtk_colors(
+                    _repeat_line_colors(cols_arr, points_per_line),
+                    deep=False)
+            else:  # colormap
+                #  get colors for each vertex
+                cols_arr = map_coordinates_3d_4d(cols_arr, points_array)
+                vtk_colors = numpy_support.numpy_to_vtk(cols_arr, deep=True)
+                color_is_scalar = True
+
+    return vtk_colors, color_is_scalar
+
+
 def lines_to_vtk_polydata(lines, colors=None):
     """Create a vtkPolyData with lines and colors.
 
     Parameters
     ----------
-    lines : list
+    lines : list or ArraySequence
         list of N curves represented as 2D ndarrays
     colors : array (N, 3), list of arrays, tuple (3,), array (K,)
         If None or False, a standard orientation colormap is used for every
@@ -262,9 +408,17 @@ def lines_to_vtk_polydata(lines, colors=None):
         Scalar array could be used with a colormap lut
         None if no color was used
 
+    Notes
+    -----
+    The points of an ArraySequence (e.g. nibabel or DIPY streamlines) are
+    not copied, unless the sequence is a slice of a larger one: the returned
+    polydata uses ``lines._data`` directly, so modifying the streamlines
+    afterwards also modifies the polydata.
+
     """
     # Get the 3d points_array
-    if lines.__class__.__name__ == 'ArraySequence':
+    if lines.__class__.__name__ == 'ArraySequence' and \
+            _is_packed_array_sequence(lines):
         points_array = lines._data
     else:
         points_array = np.vstack(lines)
@@ -272,8 +426,8 @@ def lines_to_vtk_polydata(lines, colors=None):
     if points_array.size == 0:
         raise ValueError("Empty lines/streamlines data.")
 
-    # Set Points to vtk array format
-    vtk_points = numpy_to_vtk_points(points_array)
+    # Set Points to vtk array format, sharing the memory of points_array
+    vtk_points = numpy_to_vtk_points(points_array, deep=False)
 
     # Set Lines to vtk array format
     vtk_cell_array = numpy_to_vtk_cells(lines)
@@ -283,57 +437,10 @@ def lines_to_vtk_polydata(lines, colors=None):
     poly_data.SetPoints(vtk_points)
     poly_data.SetLines(vtk_cell_array)
 
-    # Get colors_array (reformat to have colors for each points)
-    #           - if/else tested and work in normal simple case
-    nb_points = len(points_array)
-    nb_lines = len(lines)
-    lines_range = range(nb_lines)
-    points_per_line = [len(lines[i]) for i in lines_range]
-    points_per_line = np.array(points_per_line, np.intp)
-
     color_is_scalar = False
     if points_array.size:
-        if colors is None or colors is False:
-            # set automatic rgb colors
-            cols_arr = line_colors(lines)
-            colors_mapper = np.repeat(lines_range, points_per_line, axis=0)
-            vtk_colors = numpy_to_vtk_colors(255 * cols_arr[colors_mapper])
-        else:
-            cols_arr = np.asarray(colors)
-            if cols_arr.dtype == object:  # colors is a list of colors
-                vtk_colors = numpy_to_vtk_colors(255 * np.vstack(colors))
-            else:
-                if len(cols_arr) == nb_points:
-                    if cols_arr.ndim == 1:  # values for every point
-                        vtk_colors = numpy_support.numpy_to_vtk(cols_arr,
-                                                                deep=True)
-                        color_is_scalar = True
-                    elif cols_arr.ndim == 2:  # map color to each point
-                        vtk_colors = numpy_to_vtk_colors(255 * cols_arr)
-
-                elif cols_arr.ndim == 1:
-                    if len(cols_arr) == nb_lines:  # values for every streamline
-                        cols_arrx = []
-                        for (i, value) in enumerate(colors):
-                            cols_arrx += lines[i].shape[0]*[value]
-                        cols_arrx = np.array(cols_arrx)
-                        vtk_colors = numpy_support.numpy_to_vtk(cols_arrx,
-                                                                deep=True)
-                        color_is_scalar = True
-                    else:  # the same colors for all points
-                        vtk_colors = numpy_to_vtk_colors(
-                            np.tile(255 * cols_arr, (nb_points, 1)))
-
-                elif cols_arr.ndim == 2:  # map color to each line
-                    colors_mapper = np.repeat(lines_range, points_per_line,
-                                              axis=0)
-                    vtk_colors = numpy_to_vtk_colors(255 * cols_arr[colors_mapper])
-                else:  # colormap
-                    #  get colors for each vertex
-                    cols_arr = map_coordinates_3d_4d(cols_arr, points_array)
-                    vtk_colors = numpy_support.numpy_to_vtk(cols_arr, deep=True)
-                    color_is_scalar = True
-
+        vtk_colors, color_is_scalar = _lines_to_vtk_colors(
+            lines, points_array, colors)
         vtk_colors.SetName("colors")
         poly_data.GetPointData().SetScalars(vtk_colors)
 
@@ -814,6 +921,155 @@ def get_actor_from_primitive(vertices, triangles, colors=None,
     return current_actor
 
 
+def _quaternions_from_directions(directions):
+    """Compute the quaternions of the smallest rotations of the x-axis.
+
+    Parameters
+    ----------
+    directions : ndarray, shape (N, 3)
+        Orientation vectors. Null vectors give the identity rotation.
+
+    Returns
+    -------
+    quaternions : ndarray, shape (N, 4)
+        Unit quaternions (w, x, y, z) rotating (1, 0, 0) to each direction,
+        the same rotations as :func:`fury.primitive.repeat_primitive`.
+
+    """
+    directions = np.asarray(directions, dtype=float).reshape((-1, 3))
+    dir_abs = np.linalg.norm(directions, axis=1)
+    valid = dir_abs != 0
+    dirs = directions[valid] / dir_abs[valid, None]
+
+    # q = (1 + x . d, x ^ d), normalized
+    quaternions = np.zeros((len(directions), 4))
+    quaternions[:, 0] = 1
+    quaternions[valid, 0] = 1 + dirs[:, 0]
+    quaternions[valid, 2] = -dirs[:, 2]
+    quaternions[valid, 3] = dirs[:, 1]
+    norms = np.linalg.norm(quaternions, axis=1)
+    # opposite direction: any half turn around an axis normal to x
+    quaternions[norms < 1e-12] = (0, 0, 1, 0)
+    norms[norms < 1e-12] = 1
+    return quaternions / norms[:, None]
+
+
+def get_instanced_actor_from_primitive(vertices, triangles, centers,
+                                       directions=None, colors=(1, 0, 0),
+                                       scales=1, normals=None,
+                                       backface_culling=True):
+    """Get an actor rendering one primitive instanced at many centers.
+
+    Contrary to :func:`fury.primitive.repeat_primitive`, the primitive is not
+    duplicated on the CPU. Its geometry is uploaded once and the per-instance
+    centers, directions, scales and colors are handed to a glyph mapper that
+    transforms every instance in the vertex shader (GPU instancing).
+
+    Parameters
+    ----------
+    vertices : (Mx3) ndarray
+        XYZ coordinates of the unit primitive
+    triangles: (Kx3) ndarray
+        Indices into vertices; forms triangular faces.
+    centers : ndarray, shape (N, 3)
+        Instances positions
+    directions : ndarray, shape (N, 3) or tuple (3,), optional
+        The orientation vector of the instances. The x-axis of the primitive
+        is aligned with it.
+    colors : ndarray (N,3) or (N, 4) or tuple (3,) or tuple (4,), optional
+        RGB or RGBA (for opacity) R, G, B and A should be at the range [0, 1]
+    scales : ndarray, shape (N) or (N,3) or tuple (3,) or float, optional
+        Instances size, uniform or on each axis of the primitive.
+    normals: (Mx3) ndarray, optional
+        normals of the unit primitive (one per vertex)
+    backface_culling: bool
+        culling of polygons based on orientation of normal with respect to
+        camera. If backface culling is True, polygons facing away from camera
+        are not drawn. Default: True
+
+    Returns
+    -------
+    actor : actor
+
+    """
+    centers = np.asarray(centers, dtype=float).reshape((-1, 3))
+    n_centers = centers.shape[0]
+
+    def normalize_input(arr, arr_name='', ndim=2):
+        arr = np.asarray(arr, dtype=float)
+        if arr.ndim == ndim - 1:
+            arr = arr[np.newaxis]
+        if arr.shape[0] == 1:
+            return np.repeat(arr, n_centers, axis=0)
+        if arr.shape[0] != n_centers:
+            msg = "{} size should be 1 or ".format(arr_name)
+            msg += "equal to the numbers of centers"
+            raise IOError(msg)
+        return arr
+
+    # Create the unit primitive
+    source_pd = PolyData()
+    set_polydata_vertices(source_pd, vertices)
+    set_polydata_triangles(source_pd, triangles)
+    if isinstance(normals, np.ndarray):
+        set_polydata_normals(source_pd, normals)
+
+    # Create the per-instance attributes
+    instances_pd = PolyData()
+    instances_pd.SetPoints(numpy_to_vtk_points(centers))
+    set_polydata_colors(instances_pd,
+                        255 * normalize_input(colors, 'colors'),
+                        array_name='colors')
+    set_polydata_primitives_count(instances_pd, n_centers)
+
+    glyph_mapper = Glyph3DMapper()
+    glyph_mapper.SetSourceData(source_pd)
+    glyph_mapper.SetInputData(instances_pd)
+
+    if directions is not None:
+        # The direction mode of the glyph mapper adds a half turn around the
+        # x-axis, so pass the rotations of repeat_primitive as quaternions.
+        directions = normalize_input(directions, 'directions')
+        directions_fa = numpy_support.numpy_to_vtk(directions, deep=True,
+                                                   array_type=VTK_DOUBLE)
+        directions_fa.SetName('directions')
+        instances_pd.GetPointData().AddArray(directions_fa)
+        quaternions = _quaternions_from_directions(directions)
+        quaternions_fa = numpy_support.numpy_to_vtk(quaternions, deep=True,
+                                                    array_type=VTK_DOUBLE)
+        quaternions_fa.SetName('orientations')
+        instances_pd.GetPointData().AddArray(quaternions_fa)
+        glyph_mapper.SetOrientationArray('orientations')
+        glyph_mapper.SetOrientationModeToQuaternion()
+        glyph_mapper.OrientOn()
+    else:
+        glyph_mapper.OrientOff()
+
+    scales = np.asarray(scales, dtype=float)
+    if scales.ndim == 2 and scales.shape[1] == 1:
+        scales = scales.ravel()
+    if scales.ndim == 2 or (scales.ndim == 1 and scales.size == 3 and
+                            n_centers != 3):
+        scales = normalize_input(scales, 'scales')
+        glyph_mapper.SetScaleModeToScaleByVectorComponents()
+    else:
+        scales = normalize_input(scales.reshape(-1), 'scales', ndim=1)
+        glyph_mapper.SetScaleModeToScaleByMagnitude()
+    scales_fa = numpy_support.numpy_to_vtk(np.ascontiguousarray(scales),
+                                           deep=True, array_type=VTK_DOUBLE)
+    scales_fa.SetName('scales')
+    instances_pd.GetPointData().AddArray(scales_fa)
+    glyph_mapper.SetScaleArray('scales')
+    glyph_mapper.ScalingOn()
+
+    glyph_mapper.SetScalarModeToUsePointFieldData()
+    glyph_mapper.SelectColorArray('colors')
+
+    current_actor = get_actor_from_polymapper(glyph_mapper)
+    current_actor.GetProperty().SetBackfaceCulling(backface_culling)
+    return current_actor
+
+
 def repeat_sources(centers, colors, active_scalars=1., directions=None,
                    source=None, vertices=None, faces=None, orientation=None):
     """Transform a vtksource to glyph."""
@@ -876,8 +1132,10 @@ def repeat_sources(centers, colors, active_scalars=1., directions=None,
     glyph.SetVectorModeToUseVector()
     glyph.Update()
 
+    # Keep the glyph filter in the pipeline, so that updates of its input
+    # (e.g. with update_glyph_actor) reach the rendered geometry.
     mapper = PolyDataMapper()
-    mapper.SetInputData(glyph.GetOutput())
+    mapper.SetInputConnection(glyph.GetOutputPort())
     mapper.SetScalarModeToUsePointFieldData()
     mapper.SelectColorArray('colors')
 
@@ -1482,6 +1740,136 @@ def update_surface_actor_colors(actor, colors):
         SetScalars(numpy_to_vtk_colors(255*colors))
 
 
+def update_glyph_actor(actor, indices=None, centers=None, colors=None,
+                       scales=None, directions=None):
+    """Update in place a subset of the instances of a glyph actor.
+
+    Only the rows of the given instances are written and only the modified
+    arrays are flagged for upload to the GPU, see the notes below.
+
+    Parameters
+    ----------
+    actor : actor
+        Glyph actor e.g. created by :func:`fury.actor.sphere`,
+        :func:`fury.actor.box` or :func:`fury.actor.markers`.
+    indices : ndarray, shape (K,) or slice, optional
+        Indices of the instances to update. Default: all instances.
+    centers : ndarray, shape (K, 3) or tuple (3,), optional
+        New instances positions.
+    colors : ndarray (K, 3) or (K, 4) or tuple (3,) or tuple (4,), optional
+        New RGB or RGBA colors at the range [0, 1].
+    scales : ndarray, shape (K,) or (K, 3) or float, optional
+        New instances size. Not supported by glyph actors tiling their
+        primitive on the CPU.
+    directions : ndarray, shape (K, 3) or tuple (3,), optional
+        New orientation vectors. Only supported by glyph actors created with
+        directions, and not by the ones tiling their primitive on the CPU.
+
+    Notes
+    -----
+    Instanced glyph actors (``instanced=True``) support all the attributes.
+    Glyph actors built by a ``vtkGlyph3D`` filter (e.g. ``sphere`` or
+    ``cone(use_primitive=False)``) are updated through the input of the
+    filter, which generates the whole geometry again at the next render.
+    Glyph actors tiling their primitive on the CPU only support colors, and
+    centers when they store a ``center`` vertex attribute (e.g. billboard,
+    markers or sdf actors).
+
+    VTK uploads a modified array to the GPU as a whole, there is no upload of
+    a range of rows. Updating a few instances avoids rebuilding the actor,
+    but the modified arrays of all the instances are still sent again at the
+    next render.
+
+    """
+    mapper = actor.GetMapper()
+    indices = slice(None) if indices is None else indices
+
+    def update_array(vtk_array, rows, values, factor=1):
+        arr = numpy_support.vtk_to_numpy(vtk_array)
+        if arr.ndim == 1:
+            arr[rows] = np.asarray(values).reshape(-1) * factor
+        else:
+            arr[rows] = np.asarray(values).reshape((-1, arr.shape[1])) * factor
+        vtk_array.Modified()
+
+    if isinstance(mapper, Glyph3DMapper):
+        pd = mapper.GetInput()
+        point_data = pd.GetPointData()
+        if directions is not None and \
+                point_data.GetArray('directions') is None:
+            raise ValueError("This glyph actor has not been created with "
+                             "directions.")
+        if centers is not None:
+            update_array(pd.GetPoints().GetData(), indices, centers)
+        if colors is not None:
+            update_array(point_data.GetArray('colors'), indices, colors, 255)
+        if scales is not None:
+            update_array(point_data.GetArray('scales'), indices, scales)
+        if directions is not None:
+            update_array(point_data.GetArray('directions'), indices,
+                         directions)
+            new_directions = numpy_support.vtk_to_numpy(
+                point_data.GetArray('directions'))[indices]
+            update_array(point_data.GetArray('orientations'), indices,
+                         _quaternions_from_directions(new_directions))
+        return
+
+    glyph = mapper.GetInputAlgorithm()
+    if isinstance(glyph, Glyph3D):
+        # Write into the input of the glyph filter: its output is generated
+        # again from it whenever the pipeline executes.
+        pd = glyph.GetInput()
+        point_data = pd.GetPointData()
+        for name, values in (('active_scalars', scales),
+                             ('directions', directions)):
+            if values is not None and point_data.GetArray(name) is None:
+                raise ValueError("This glyph actor has not been created "
+                                 "with {}.".format(name.replace('_', ' ')))
+        if centers is not None:
+            update_array(pd.GetPoints().GetData(), indices, centers)
+        if colors is not None:
+            update_array(point_data.GetArray('colors'), indices, colors, 255)
+        if scales is not None:
+            update_array(point_data.GetArray('active_scalars'), indices,
+                         scales)
+        if directions is not None:
+            update_array(point_data.GetArray('directions'), indices,
+                         directions)
+        return
+
+    if scales is not None or directions is not None:
+        raise ValueError("Scales and directions can only be updated on "
+                         "instanced glyph actors. Use instanced=True.")
+
+    pd = mapper.GetInput()
+    point_data = pd.GetPointData()
+    prim_count = get_polydata_primitives_count(pd)
+    unit_verts_size = pd.GetNumberOfPoints() // prim_count
+    instances = np.arange(prim_count)[indices]
+    rows = (instances[:, None] * unit_verts_size +
+            np.arange(unit_verts_size)).ravel()
+
+    def repeat_values(values):
+        values = np.asarray(values, dtype=float)
+        values = np.broadcast_to(values, (len(instances), values.shape[-1]))
+        return np.repeat(values, unit_verts_size, axis=0)
+
+    if centers is not None:
+        center_array = point_data.GetArray('center')
+        if center_array is None:
+            raise ValueError("This glyph actor does not store its centers. "
+                             "Use instanced=True.")
+        old_centers = numpy_support.vtk_to_numpy(center_array)[rows]
+        new_centers = repeat_values(centers)
+        vertices = numpy_support.vtk_to_numpy(pd.GetPoints().GetData())
+        vertices[rows] += new_centers - old_centers
+        pd.GetPoints().GetData().Modified()
+        update_array(center_array, rows, new_centers)
+    if colors is not None:
+        update_array(point_data.GetArray('colors'), rows,
+                     repeat_values(colors), 255)
+
+
 def color_check(pts_len, colors=None):
     """
     Returns a VTK scalar array containing colors information for each one of